@@ -10,6 +10,7 @@ from pathlib import Path
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi import Response
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from google.transit import gtfs_realtime_pb2
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,9 +22,11 @@ sys.path.append(str(project_root))
 import config
 
 from fiware_scorpio.fiware_scorpio_crud_operations import (
+    MAX_CONCURRENT_LISTINGS,
     fiware_scorpio_get_entities_by_type,
     fiware_scorpio_define_header,
-    fiware_scorpio_batch_replace_entity_data
+    fiware_scorpio_batch_replace_entity_data,
+    close_session
 )
 
 from gtfs_realtime.gtfs_realtime_utils import (
@@ -315,15 +318,15 @@ async def update_vehicle_positions_loop(interval: int = 30):
 
     config.set_operating_city("Sofia")  # Ensure the operating city is set for Orion-LD operations
 
+    # Set correct header for Orion-LD operations once, it does not change between cycles
+    header = fiware_scorpio_define_header("gtfs_realtime")
+
     # Run continuously as a background update loop
     while True:
         try:
             # Retrieve raw NGSI-LD GtfsRealtimeVehiclePosition entities
             ngsild_entities = gtfs_realtime_get_ngsi_ld_data("VehiclePosition")
 
-            # Set correct header for Orion-LD operations
-            header = fiware_scorpio_define_header("gtfs_realtime")
-
              # Replace existing entity data in Orion-LD with the new batch
             fiware_scorpio_batch_replace_entity_data(ngsild_entities, header)
 
@@ -353,8 +356,8 @@ async def lifespan(app: FastAPI):
 
     On startup, this lifespan context starts a background task responsible for
     periodically updating the GTFS-Realtime vehicle positions feed.
-    On shutdown, the background task is cancelled to allow for a graceful
-    application termination.
+    On shutdown, the background task is cancelled and the pooled Context
+    Broker connections are closed to allow for a graceful application termination.
 
     Args:
         app (FastAPI): The FastAPI application instance.
@@ -372,6 +375,9 @@ async def lifespan(app: FastAPI):
     # Cancel background task on application shutdown
     task.cancel()
 
+    # Release the keep-alive connections to the Context Broker
+    close_session()
+
 
 # -----------------------------------------------------
 # FastAPI App
@@ -741,53 +747,51 @@ def entities_to_csv_bytes(entities: list[dict[str, Any]]) -> bytes:
 
     return output.getvalue().encode("utf-8")
 
+# GTFS file written for every NGSI-LD entity type, in archive order
+GTFS_FILE_ENTITY_TYPES = {
+    "agency.txt": "GtfsAgency",
+    "stops.txt": "GtfsStop",
+    "routes.txt": "GtfsRoute",
+    "trips.txt": "GtfsTrip",
+    "stop_times.txt": "GtfsStopTime",
+    "calendar_dates.txt": "GtfsCalendarDateRule",
+    "fare_attributes.txt": "GtfsFareAttributes",
+    "shapes.txt": "GtfsShape",
+    "transfers.txt": "GtfsTransferRule",
+    "pathways.txt": "GtfsPathway",
+    "levels.txt": "GtfsLevel",
+    "translations.txt": "GtfsTranslation",
+}
+
 def build_gtfs_zip() -> str:
     """
-    data_by_file:
-    {
-        "agency.txt": [entities...],
-        "routes.txt": [entities...],
-        "stops.txt": [...]
-    }
+    Build the GTFS Static archive of the operating city from the Context Broker.
+
+    The entity types are fetched concurrently, at most MAX_CONCURRENT_LISTINGS at a time since every
+    type is itself paged concurrently, and every file is written as soon as its type has arrived,
+    while later types are still loading.
+
+    Returns:
+        str: Path of the written gtfs.zip
     """
     config.set_operating_city("Sofia")
 
     zip_path = os.path.join(config.OTP_DATA_DIR, f"gtfs.zip")
     
     header = fiware_scorpio_define_header("gtfs_static")
-    agencies = fiware_scorpio_get_entities_by_type("GtfsAgency", header, config.get_operating_city())
-    stops = fiware_scorpio_get_entities_by_type("GtfsStop", header, config.get_operating_city())
-    routes = fiware_scorpio_get_entities_by_type("GtfsRoute", header, config.get_operating_city())
-    trips = fiware_scorpio_get_entities_by_type("GtfsTrip", header, config.get_operating_city())
-    stop_times = fiware_scorpio_get_entities_by_type("GtfsStopTime", header, config.get_operating_city())
-    calendar_dates = fiware_scorpio_get_entities_by_type("GtfsCalendarDateRule", header, config.get_operating_city())
-    fare_attributes = fiware_scorpio_get_entities_by_type("GtfsFareAttributes", header, config.get_operating_city())
-    shapes = fiware_scorpio_get_entities_by_type("GtfsShape", header, config.get_operating_city())
-    transfers = fiware_scorpio_get_entities_by_type("GtfsTransferRule", header, config.get_operating_city())
-    pathways = fiware_scorpio_get_entities_by_type("GtfsPathway", header, config.get_operating_city())
-    levels = fiware_scorpio_get_entities_by_type("GtfsLevel", header, config.get_operating_city())
-    translations = fiware_scorpio_get_entities_by_type("GtfsTranslation", header, config.get_operating_city())
-
-    data = {
-        "agency.txt": agencies,
-        "stops.txt": stops,
-        "routes.txt": routes,
-        "trips.txt": trips,
-        "stop_times.txt": stop_times,
-        "calendar_dates.txt": calendar_dates,
-        "fare_attributes.txt": fare_attributes,
-        "shapes.txt": shapes,
-        "transfers.txt": transfers,
-        "pathways.txt": pathways,
-        "levels.txt": levels,
-        "translations.txt": translations,
-    }
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LISTINGS) as executor:
+        futures = {
+            filename: executor.submit(fiware_scorpio_get_entities_by_type, entity_type, header, config.get_operating_city())
+            for filename, entity_type in GTFS_FILE_ENTITY_TYPES.items()
+        }
+
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
 
-        for filename, entities in data.items():
-            csv_bytes = entities_to_csv_bytes(entities)
-            z.writestr(filename, csv_bytes)
+            # Files keep their order; a failed fetch is re-raised here
+            for filename, future in futures.items():
+                csv_bytes = entities_to_csv_bytes(future.result())
+                z.writestr(filename, csv_bytes)
                         
     return zip_path
 
@@ -16,11 +16,15 @@ class GtfsSource(Enum):
 
 ORION_LD_BASE_URL = os.getenv("ORION_LD_BASE_URL")
 
+# Number of requests kept in flight towards Orion-LD at the same time
+ORION_LD_MAX_CONCURRENT_REQUESTS = int(os.getenv("ORION_LD_MAX_CONCURRENT_REQUESTS", "4"))
+
 class OrionLDEndpoint(Enum):
     ENTITIES_ENDPOINT = f"{ORION_LD_BASE_URL}/entities"
     BATCH_CREATE_ENDPOINT = f"{ORION_LD_BASE_URL}/entityOperations/create"
     BATCH_DELETE_ENDPOINT = f"{ORION_LD_BASE_URL}/entityOperations/delete"
     BATCH_UPDATE_ENDPOINT = f"{ORION_LD_BASE_URL}/entityOperations/upsert?options=update"
+    BATCH_QUERY_ENDPOINT = f"{ORION_LD_BASE_URL}/entityOperations/query"
 
 NETEX_AUTHORITY = None
 
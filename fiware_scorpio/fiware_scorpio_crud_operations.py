@@ -1,10 +1,17 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 import os
 import json
 import time
-import codecs
+import random
+import orjson
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -13,14 +20,233 @@ sys.path.append(str(project_root))
 
 from gtfs_static.gtfs_static_utils import gtfs_static_get_ngsi_ld_batches
 
-from typing import  Any
+from typing import  Any, Iterator
 import config
 
+# Handlers and levels are left to the application entrypoint, importing the module does not configure logging
 logger = logging.getLogger("Orion-LD")
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
 
+# Number of batch requests kept in flight towards the broker at the same time;
+# this bounded window is the rate-limit knob of the loaders, not a fixed sleep
+MAX_CONCURRENT_REQUESTS = config.ORION_LD_MAX_CONCURRENT_REQUESTS
+
+# Attempts per Batch Create request and upper bound on the pause between them
+MAX_POST_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 30
+
+# Entities per page of a paginated GET (Orion-LD maximum); a shorter page is the last one
+PAGE_LIMIT = 1000
+
+# Most pages a query expression may span before it is treated as a runaway query
+MAX_QUERY_PAGES = 50
+
+# Longest ID list sent as a GET query parameter; longer lists use the Batch Query endpoint
+MAX_IDS_PER_GET_QUERY = 50
+
+# Longest part of a broker error body kept in exception messages and logs
+MAX_ERROR_BODY_CHARS = 512
+
+# Most per-entity errors of a partially failed batch quoted in the raised exception
+MAX_REPORTED_ERRORS = 10
+
+# Casefolded title the broker gives entities of a batch that already exist
+ALREADY_EXISTS_MARKER = "already exists"
+
+# Context Broker endpoints, resolved from the config enum once at import
+ENTITIES_URL = config.OrionLDEndpoint.ENTITIES_ENDPOINT.value
+BATCH_CREATE_URL = config.OrionLDEndpoint.BATCH_CREATE_ENDPOINT.value
+BATCH_UPDATE_URL = config.OrionLDEndpoint.BATCH_UPDATE_ENDPOINT.value
+BATCH_DELETE_URL = config.OrionLDEndpoint.BATCH_DELETE_ENDPOINT.value
+BATCH_QUERY_URL = config.OrionLDEndpoint.BATCH_QUERY_ENDPOINT.value
+
+# -----------------------------------------------------
+# HEADER Definitions
+# -----------------------------------------------------
+
+# JSON-LD context Link headers, built once at import
+GTFS_STATIC_CONTEXT_LINK = '<https://manoldzhermanski.github.io/System-for-Semantic-Interoperability-of-Urban-Data/gtfs_static/gtfs_static_context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
+POIS_CONTEXT_LINK = '<https://raw.githubusercontent.com/smart-data-models/dataModel.PointOfInterest/master/context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
+GTFS_REALTIME_CONTEXT_LINK = '<https://manoldzhermanski.github.io/System-for-Semantic-Interoperability-of-Urban-Data/gtfs_realtime/gtfs_realtime_context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
+CORE_CONTEXT_LINK = '<https://uri.etsi.org/ngsi-ld/v1/ngsi-ld-core-context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
+
+# Context Link header per data domain keyword; unknown keywords fall back to the NGSI-LD core context
+CONTEXT_LINKS = {
+    "gtfs_static": GTFS_STATIC_CONTEXT_LINK,
+    "pois": POIS_CONTEXT_LINK,
+    "gtfs_realtime": GTFS_REALTIME_CONTEXT_LINK
+}
+
+# Headers shared by every request to the Context Broker
+BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# -----------------------------------------------------
+# HTTP Session
+# -----------------------------------------------------
+
+# Shared session so every call to the Context Broker reuses pooled keep-alive
+# connections instead of opening a new TCP connection per request.
+# Connection errors are retried by urllib3; POST payload errors are handled
+# by the callers themselves.
+# The per-host pool is never smaller than the concurrency window, so every
+# in-flight batch keeps its own warm connection and none is discarded after use.
+POOL_MAXSIZE = max(16, MAX_CONCURRENT_REQUESTS)
+
+# Entity types that may be listed at the same time when each listing pages with its own
+# MAX_CONCURRENT_REQUESTS workers; the product of both stays within the pooled connections
+MAX_CONCURRENT_LISTINGS = max(1, POOL_MAXSIZE // MAX_CONCURRENT_REQUESTS)
+
+SESSION = requests.Session()
+# Idempotent requests are also retried by urllib3 when the broker or its proxy is briefly unavailable
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE,
+                       max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)))
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# Requests that do not pass their own headers still talk plain JSON to the broker
+SESSION.headers.update(BASE_HEADERS)
+
+def close_session() -> None:
+    """
+    Close the pooled connections of the shared Context Broker session.
+
+    Meant for application teardown; the session transparently opens new
+    connections if it is used again afterwards.
+
+    Returns:
+        None
+    """
+    SESSION.close()
+
+# \uXXXX escape sequences Orion-LD stores non-ASCII values as; a UTF-16 surrogate pair is matched as one character
+_UNICODE_ESCAPE_PATTERN = re.compile(
+    r"\\u(d[89ab][0-9a-f]{2})\\u(d[c-f][0-9a-f]{2})|\\u([0-9a-f]{4})",
+    re.IGNORECASE
+)
+
+# A decoded string can only contain a backslash if the raw JSON has an escaped one ("\\" or "\u005c")
+_ESCAPED_BACKSLASH_PATTERN = re.compile(rb"\\\\|\\u005[cC]")
+
+def _replace_unicode_escape(match: re.Match) -> str:
+    """
+    Turn one matched \\uXXXX escape (or surrogate pair of escapes) into its character.
+
+    Args:
+        match (re.Match): Match of _UNICODE_ESCAPE_PATTERN
+
+    Returns:
+        str: The decoded character
+    """
+    high, low, single = match.groups()
+
+    if single is not None:
+        return chr(int(single, 16))
+
+    # Combine the surrogate pair into one code point above the Basic Multilingual Plane
+    return chr(0x10000 + ((int(high, 16) - 0xD800) << 10) + (int(low, 16) - 0xDC00))
+
+def _unescape_value(text: str) -> str:
+    """
+    Decode the escape sequences of one stored value.
+
+    The value is parsed as the body of a JSON string, which lets orjson decode
+    \\uXXXX escapes and surrogate pairs in native code. Values that are not a
+    valid JSON string body (a bare quote, an unknown escape such as \\x) fall
+    back to replacing only their \\uXXXX sequences.
+
+    Args:
+        text (str): Stored value containing at least one \\u sequence
+
+    Returns:
+        str: The decoded value
+    """
+    try:
+        return orjson.loads(b'"' + text.encode() + b'"')
+
+    except orjson.JSONDecodeError:
+        return _UNICODE_ESCAPE_PATTERN.sub(_replace_unicode_escape, text)
+
+def _decode_escaped_values(data: Any) -> None:
+    """
+    Decode escaped Unicode in the "value" and "object" members of an NGSI-LD
+    payload in place. The payload is walked once with an explicit stack, so
+    sub-attributes and list elements are covered without recursion.
+
+    Only strings holding a \\uXXXX sequence are decoded, and non-ASCII text
+    next to the escapes is kept as it is.
+
+    Args:
+        data (Any): Parsed NGSI-LD entity, list of entities or attribute
+
+    Returns:
+        None
+    """
+    stack = [data]
+
+    while stack:
+        node = stack.pop()
+
+        if isinstance(node, list):
+            stack.extend(node)
+
+        elif isinstance(node, dict):
+            for key, item in node.items():
+                # Only escaped strings need decoding; plain UTF-8 text is kept as it is
+                if key in ("value", "object") and isinstance(item, str):
+                    if "\\u" in item:
+                        node[key] = _unescape_value(item)
+
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+
+def _entity_type_from_urn(entity_id: str) -> str:
+    """
+    Read the entity type from an NGSI-LD URN of the form urn:ngsi-ld:<type>:<...>.
+
+    Args:
+        entity_id (str): NGSI-LD entity ID
+
+    Returns:
+        str: The entity type part of the URN
+
+    Raises:
+        ValueError: If the ID is not an NGSI-LD URN with a type
+    """
+    parts = entity_id.split(":", 3)
+
+    if len(parts) < 4 or parts[0] != "urn" or parts[1] != "ngsi-ld" or not parts[2]:
+        raise ValueError(f"Cannot read the entity type from ID {entity_id}")
+
+    return parts[2]
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """
+    Read the delay of a Retry-After header given in seconds.
+
+    Args:
+        value (str | None): Raw header value
+
+    Returns:
+        float | None: Seconds to wait, or None when the header is missing or holds an HTTP date
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        return None
+
+# Shared default for 207 entries without an "error" member, so none is allocated per entry
+_EMPTY_ERROR: dict[str, Any] = {}
+
+class _BatchRejectedError(requests.exceptions.HTTPError):
+    """
+    The broker rejected a batch for a reason a retry will not fix (4xx).
+    """
 
 # -----------------------------------------------------
 # HEADER Definition Function
@@ -32,31 +258,21 @@ def fiware_scorpio_define_header(keyword: str, extra: dict[str, str] | None = No
 
     Args:
         keyword (str):
-            Determines which NGSI-LD context (and base headers) to use.
+            Determines which NGSI-LD context to use.
 
         extra (dict[str, str] | None):
             Optional additional headers (e.g. Prefer, custom flags for Scorpio/Orion).
 
     Returns:
         dict[str, str]:
-            Headers dictionary for NGSI-LD requests.
+            Per-request headers for NGSI-LD requests: the Link header and any extras.
+            Content-Type and Accept are not repeated here, they are set once on SESSION.
     """
 
-    headers = {
-        "Content-Type": "application/json"
-    }
-
-    if keyword == "gtfs_static":
-        headers["Link"] = '<https://manoldzhermanski.github.io/System-for-Semantic-Interoperability-of-Urban-Data/gtfs_static/gtfs_static_context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
-
-    elif keyword == "pois":
-        headers["Link"] = '<https://raw.githubusercontent.com/smart-data-models/dataModel.PointOfInterest/master/context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
-
-    elif keyword == "gtfs_realtime":
-        headers["Link"] = '<https://manoldzhermanski.github.io/System-for-Semantic-Interoperability-of-Urban-Data/gtfs_realtime/gtfs_realtime_context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
-
-    else:
-        headers["Link"] = '<https://uri.etsi.org/ngsi-ld/v1/ngsi-ld-core-context.jsonld>; rel="http://www.w3.org/ns/json-ld#context"; type="application/ld+json"'
+    # Only the part that differs from the session's base headers is sent per request;
+    # requests merges it with SESSION.headers, so the base headers are not copied every time.
+    # One table lookup picks the context; a fresh dict is returned so callers may change it freely
+    headers = {"Link": CONTEXT_LINKS.get(keyword, CORE_CONTEXT_LINK)}
 
     # Allow backend-specific or query-specific overrides (Scorpio, Orion, debugging, etc.)
     if extra:
@@ -69,21 +285,57 @@ def fiware_scorpio_define_header(keyword: str, extra: dict[str, str] | None = No
 # -----------------------------------------------------  
 
 def fiware_scorpio_post_batch_request(batch_ngsi_ld_data: list[dict[str, Any]], header: dict[str, str],) -> None:
+    """
+    Send a single Batch Create request to the Context Broker.
+
+    The Context Broker answers with:
+        - HTTP 201 if all entities were created
+        - HTTP 207 (Multi-Status) if only part of the batch was created;
+          entities that already exist are not treated as errors, entities
+          that failed with a server-side error are sent again on their own
+        - HTTP 413 if the payload is too large; the batch is then split in
+          halves which are sent separately, so oversized batches shrink
+          until the broker accepts them
+
+    Server errors, throttling (429) and network failures are retried up to
+    MAX_POST_ATTEMPTS times with an exponential, jittered pause between the
+    attempts, so a restarting broker does not make the whole load fail. When
+    the broker sends Retry-After with a 429 or 503, that pause is used instead.
+
+    Args:
+        batch_ngsi_ld_data (list[dict[str, Any]]):
+            NGSI-LD entities to create.
+        header (dict[str, str]):
+            HTTP headers for the request (Content-Type and Link)
+
+    Returns:
+        None
+
+    Raises:
+        requests.exceptions.RequestException:
+            If the batch still fails after all retries or the broker rejects it.
+    """
+
+    # Entities still to be created; shrinks to the failed ones after a partial success
+    batch = batch_ngsi_ld_data
+
+    for attempt in range(1, MAX_POST_ATTEMPTS + 1):
 
-    max_retries = 3
+        # Pause the broker asked for with Retry-After, used instead of the exponential backoff
+        retry_after = None
 
-    for attempt in range(1, max_retries + 1):
         try:
             
-            response = requests.post(config.OrionLDEndpoint.BATCH_CREATE_ENDPOINT.value, json=batch_ngsi_ld_data,
+            # Serialize with orjson straight to UTF-8 bytes instead of letting requests use the stdlib encoder
+            response = SESSION.post(BATCH_CREATE_URL, data=orjson.dumps(batch),
                                      headers=header, timeout=(10, 600))
 
             if response.status_code == 201:
-                logger.info("Batch OK (%d entities)", len(batch_ngsi_ld_data))
+                logger.info("Batch OK (%d entities)", len(batch))
                 return
 
             if response.status_code == 207:
-                payload = response.json()
+                payload = orjson.loads(response.content)
 
                 successes = payload.get("success", [])
                 errors = payload.get("errors", [])
@@ -92,21 +344,48 @@ def fiware_scorpio_post_batch_request(batch_ngsi_ld_data: list[dict[str, Any]],
                     logger.info("Created %d entities", len(successes))
 
                 real_errors = []
+                failed_ids = set()
 
                 for err in errors:
-                    title = err.get("error", {}).get("title", "").lower()
+                    error = err.get("error", _EMPTY_ERROR)
                     entity_id = err.get("entityId")
 
-                    if "already exists" in title:
+                    if ALREADY_EXISTS_MARKER in (error.get("title") or "").casefold():
                         logger.debug("Exists: %s", entity_id)
+
+                    # Only reported server-side failures of single entities are worth another attempt;
+                    # an entry without a status is a permanent rejection, like a validation failure
+                    elif isinstance(error.get("status"), int) and error["status"] >= 500:
+                        failed_ids.add(entity_id)
+
                     else:
                         real_errors.append(err)
 
+                # Only the first few errors are quoted, a largely rejected batch would make a huge message
                 if real_errors:
-                    raise requests.exceptions.HTTPError(real_errors)
+                    raise _BatchRejectedError(
+                        f"{len(real_errors)} entities rejected, first errors: {real_errors[:MAX_REPORTED_ERRORS]}"
+                    )
+
+                if failed_ids:
+                    # Retry only the entities that failed, the rest already exist in the broker
+                    batch = [entity for entity in batch if entity.get("id") in failed_ids]
+                    raise requests.exceptions.HTTPError(f"{len(failed_ids)} entities failed with a server error")
 
                 return
 
+            # payload too large → leave the retry loop and split the batch
+            if response.status_code == 413 and len(batch) > 1:
+                break
+
+            # broker is overloaded → retry after the pause it asks for, if any
+            if response.status_code in (429, 503):
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+                raise requests.exceptions.HTTPError(
+                    f"Broker busy {response.status_code}"
+                )
+
             # server error → retry
             if response.status_code >= 500:
                 raise requests.exceptions.HTTPError(
@@ -114,30 +393,100 @@ def fiware_scorpio_post_batch_request(batch_ngsi_ld_data: list[dict[str, Any]],
                 )
 
             # other errors → fail immediately
-            raise requests.exceptions.HTTPError(
-                f"Batch failed ({response.status_code}): {response.text}"
+            raise _BatchRejectedError(
+                f"Batch failed ({response.status_code}): {response.text[:MAX_ERROR_BODY_CHARS]}"
             )
 
+        # Client errors will not go away on their own, so they are not retried
+        except _BatchRejectedError:
+            raise
+
         except requests.exceptions.RequestException as e:
-            logger.warning("Batch attempt %d/%d failed: %s", attempt, max_retries, str(e))
+            logger.warning("Batch attempt %d/%d failed: %s", attempt, MAX_POST_ATTEMPTS, str(e))
 
-            if attempt == max_retries:
+            if attempt == MAX_POST_ATTEMPTS:
                 raise
 
-            time.sleep(2 * attempt)
+            # Exponential backoff with jitter, so parallel workers do not retry in lockstep,
+            # unless the broker said how long to wait
+            if retry_after is None:
+                retry_after = 2 ** (attempt - 1) + random.random()
 
+            time.sleep(min(retry_after, MAX_BACKOFF_SECONDS))
 
-def fiware_scorpio_batch_load_to_context_broker(batches_iterator, header: dict, delay: float = 0.1) -> None:
+    # Only reached when the broker rejected the payload as too large:
+    # send both halves separately, outside of this call's retry loop
+    middle = len(batch) // 2
+    logger.warning("Batch of %d entities too large, retrying in halves", len(batch))
+    fiware_scorpio_post_batch_request(batch[:middle], header)
+    fiware_scorpio_post_batch_request(batch[middle:], header)
+
+
+def fiware_scorpio_batch_load_to_context_broker(batches_iterator, header: dict, delay: float = 0.0,
+                                                 max_workers: int = MAX_CONCURRENT_REQUESTS) -> int:
     """
-    Accepts iterator of batches instead of giant list.
-    Works with streaming pipeline.
+    Load NGSI-LD entity batches into the Context Broker concurrently.
+
+    Batch requests are I/O-bound, so up to max_workers of them are kept in
+    flight on a thread pool while the next batch is produced. The iterator
+    is only advanced when a slot is free, which keeps at most max_workers
+    batches in memory and preserves the streaming behaviour of the
+    GTFS/PoI pipelines.
+
+    Args:
+        batches_iterator (Iterable[list[dict[str, Any]]]):
+            Iterator of NGSI-LD entity batches.
+
+        header (dict):
+            NGSI-LD request headers.
+
+        delay (float, optional):
+            Pause in seconds between submitting two batches. The in-flight
+            window (max_workers) is what throttles the broker, so no pause
+            is made by default. Default: 0.0.
+
+        max_workers (int, optional):
+            Maximum number of batch requests in flight. Default: MAX_CONCURRENT_REQUESTS.
+
+    Returns:
+        int: Number of entities sent to the Context Broker.
+
+    Raises:
+        requests.exceptions.RequestException:
+            If a batch fails after all retries. Batches already in flight
+            are awaited before the exception propagates.
     """
 
-    for batch_index, batch in enumerate(batches_iterator, start=1):
-        logger.debug("Sending batch %d (%d entities)", batch_index, len(batch))
-                
-        fiware_scorpio_post_batch_request(batch, header)
-        time.sleep(delay)
+    # Futures of the batch requests that are currently in flight
+    in_flight: set[Future] = set()
+
+    # Number of entities sent so far
+    sent = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_index, batch in enumerate(batches_iterator, start=1):
+
+            # Wait for a free slot before reading the next batch into flight
+            if len(in_flight) >= max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                # Surface failures of completed batches
+                for future in done:
+                    future.result()
+
+            logger.debug("Sending batch %d (%d entities)", batch_index, len(batch))
+            in_flight.add(executor.submit(fiware_scorpio_post_batch_request, batch, header))
+            sent += len(batch)
+
+            # Optional pacing for brokers that cannot keep up with the window alone
+            if delay > 0:
+                time.sleep(delay)
+
+        # Wait for the remaining batches and surface their failures
+        for future in in_flight:
+            future.result()
+
+    return sent
         
 # -----------------------------------------------------
 # GET Requests
@@ -149,7 +498,9 @@ def fiware_scorpio_get_entity_by_id(entity_id: str, header: dict[str, str]) -> d
 
     The function sends an HTTP GET request to the Orion-LD Context Broker
     and returns the entity as a JSON dictionary. Additionally, it post-processes
-    NGSI-LD attributes to decode any escaped Unicode characters (e.g. Cyrillic)
+    NGSI-LD attributes to decode any escaped Unicode characters (e.g. Cyrillic).
+    Values without a backslash carry no escape sequences and are returned as they are,
+    which also keeps text that the broker already returns as UTF-8 intact.
 
     Args:
         entity_id (str):
@@ -168,40 +519,33 @@ def fiware_scorpio_get_entity_by_id(entity_id: str, header: dict[str, str]) -> d
     """
     try:
         # Send GET request to Orion-LD for a specific entity
-        response = requests.get(f"{config.OrionLDEndpoint.ENTITIES_ENDPOINT.value}/{entity_id}", headers=header)
+        response = SESSION.get(f"{ENTITIES_URL}/{entity_id}", headers=header)
         
         # Raise an exception for HTTP error responses
         response.raise_for_status()
         
-        # Ensure correct response encoding
-        response.encoding = "utf-8"
-
-        # Parse JSON response
-        data = response.json()
+        raw = response.content
 
-        # Iterate through all attributes of the entity
-        for attr in data.values():
-            if isinstance(attr, dict):
-                # Decode escaped Unicode in Property values
-                if "value" in attr and isinstance(attr["value"], str):
-                    attr["value"] = codecs.decode(attr["value"], "unicode_escape")
+        # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+        data = orjson.loads(raw)
 
-                # Decode escaped Unicode in Relationship values
-                if "object" in attr and isinstance(attr["object"], str):
-                    attr["object"] = codecs.decode(attr["object"], "unicode_escape")
+        # Decode escaped Unicode in all Property and Relationship values, sub-attributes included;
+        # without an escaped backslash in the body no value can hold an escape, so the walk is skipped
+        if _ESCAPED_BACKSLASH_PATTERN.search(raw):
+            _decode_escaped_values(data)
 
         return data
 
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"Error when sending GET Request: {e}")
 
-def fiware_scorpio_get_entities_by_type(entity_type: str, header: dict[str, str], id_pattern: str | None = None) -> list[dict[str, Any]]:
+def fiware_scorpio_get_entity_pages_by_type(entity_type: str, header: dict[str, str], id_pattern: str | None = None, key_values: bool = False, offset: int = 0) -> Iterator[list[dict[str, Any]]]:
     """
-    Retrieve all entities of a specific NGSI-LD type from Orion-LD, handling pagination.
+    Lazily page through all entities of a specific NGSI-LD type in the Context Broker.
 
-    Orion-LD allows fetching a limited number of entities per request (default limit=1000)
-    and supports pagination via the `offset` parameter. This function retrieves all entities
-    of the specified type up to Orion-LD's maximum limit (34,000).
+    Entities are requested with `limit`/`offset` pagination and yielded one page
+    at a time, so callers that only need part of each entity (e.g. the ids for
+    deletion) never hold more than a single page of full payloads in memory.
 
     Args:
         entity_type (str): 
@@ -210,76 +554,241 @@ def fiware_scorpio_get_entities_by_type(entity_type: str, header: dict[str, str]
         header (dict[str, str]): 
             HTTP headers to include in the request (Content-Type and Link)
 
-    Returns:
-        list[dict[str, Any]]: A list of NGSI-LD entities of the specified type.
+        id_pattern (str | None, optional):
+            Regular expression the entity IDs must match. Default: None.
+
+        key_values (bool, optional):
+            Request the simplified keyValues representation, which drops the
+            Property/Relationship wrappers from every attribute. Default: False.
+
+        offset (int, optional):
+            Index of the first entity to retrieve. Default: 0.
+
+    Yields:
+        list[dict[str, Any]]: A page of up to 1000 NGSI-LD entities of the specified type.
 
     Raises:
         requests.exceptions.RequestException: If there is a network or HTTP error during the requests.
     """
-    # List to store all entities
-    all_entities = []
-
-    # Starting index for pagination
-    offset = 0
-    
-    # Number of entities per request
-    limit = 1000
+    # While there are entities of the desired type, get PAGE_LIMIT at a time
+    # Query parameters that are the same for every page, built once per listing
+    base_params = {
+        "type": entity_type,
+        "limit": PAGE_LIMIT,
+        }
     
-    # Prevent infinite loops by setting a maximum number of iterations
-    max_iterations = 1000000000
-    iteration = 0
+    if id_pattern is not None:
+        base_params["idPattern"] = id_pattern
+
+    if key_values:
+        base_params["options"] = "keyValues"
 
-    # While there are entities of the desired type, get 1000 at a time
     while True:
         
-        params = {
-            "type": entity_type,
-            "limit": limit,
-            "offset": offset,
-            }
-        
-        if id_pattern is not None:
-            params["idPattern"] = id_pattern
+        # Only the offset changes from page to page
+        params = {**base_params, "offset": offset}
         
         try:
             # Send a GET request to extract entities of type 'entity_type'
-            response = requests.get(config.OrionLDEndpoint.ENTITIES_ENDPOINT.value, headers=header, params=params)
+            response = SESSION.get(ENTITIES_URL, headers=header, params=params)
             
             # Raise an exception for HTTP error responses
             response.raise_for_status()
             
-            # Ensure correct response encoding
-            response.encoding = "utf-8"
+            # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+            data = orjson.loads(response.content)
+            
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
 
-            # Parse the JSON response
-            data = response.json()
+        # Stop if no more entities
+        if not data:
+            return
 
-            # Break if no more entities
-            if not data:
-                break
+        yield data
 
-            # Extend entity list
-            all_entities.extend(data)
+        # A short page is the last one, no need to ask for an empty one
+        if len(data) < PAGE_LIMIT:
+            return
 
-            # Move offset for next page
-            offset += limit
-            
-        except requests.exceptions.RequestException as e:
-            raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
+        # Move offset for next page
+        offset += PAGE_LIMIT
+
+def fiware_scorpio_get_entity_ids_by_type(entity_type: str, header: dict[str, str], id_pattern: str | None = None) -> Iterator[list[str]]:
+    """
+    Lazily page through the IDs of all entities of a specific NGSI-LD type.
+
+    Pages are requested in the keyValues representation, which is considerably
+    smaller than the normalized one, and only the entity IDs are passed on to
+    the caller.
+
+    Args:
+        entity_type (str): 
+            The NGSI-LD entity type whose IDs are retrieved.
         
+        header (dict[str, str]): 
+            HTTP headers to include in the request (Content-Type and Link)
+
+        id_pattern (str | None, optional):
+            Regular expression the entity IDs must match. Default: None.
+
+    Yields:
+        list[str]: The IDs of a page of up to 1000 entities.
+
+    Raises:
+        requests.exceptions.RequestException: If there is a network or HTTP error during the requests.
+    """
+    for page in fiware_scorpio_get_entity_pages_by_type(entity_type, header, id_pattern, key_values=True):
+        yield [entity["id"] for entity in page]
+
+def fiware_scorpio_get_entities_by_type(entity_type: str, header: dict[str, str], id_pattern: str | None = None, key_values: bool = False, max_workers: int = MAX_CONCURRENT_REQUESTS) -> list[dict[str, Any]]:
+    """
+    Retrieve all entities of a specific NGSI-LD type from Orion-LD, handling pagination.
+
+    Orion-LD allows fetching a limited number of entities per request (default limit=1000)
+    and supports pagination via the `offset` parameter. The first page is requested
+    together with the total entity count (`count=true`); once the count is known the
+    remaining pages are independent of each other and are fetched concurrently.
+    If the broker does not report the count, the remaining pages are fetched one
+    after another with `fiware_scorpio_get_entity_pages_by_type`.
+
+    Args:
+        entity_type (str): 
+            The NGSI-LD entity type to retrieve.
+        
+        header (dict[str, str]): 
+            HTTP headers to include in the request (Content-Type and Link)
+
+        id_pattern (str | None, optional):
+            Regular expression the entity IDs must match. Default: None.
+
+        key_values (bool, optional):
+            Request the simplified keyValues representation for consumers that
+            only read attribute values. Default: False.
+
+        max_workers (int, optional):
+            Maximum number of pages requested at the same time.
+            Default: MAX_CONCURRENT_REQUESTS.
+
+    Returns:
+        list[dict[str, Any]]: A list of NGSI-LD entities of the specified type.
+
+    Raises:
+        requests.exceptions.RequestException: If there is a network or HTTP error during the requests.
+    """
+    params = {
+        "type": entity_type,
+        "limit": PAGE_LIMIT,
+        "offset": 0,
+        "count": "true"
+        }
+
+    if id_pattern is not None:
+        params["idPattern"] = id_pattern
+
+    if key_values:
+        params["options"] = "keyValues"
+
+    try:
+        # Request the first page together with the total number of matching entities
+        response = SESSION.get(ENTITIES_URL, headers=header, params=params)
+
+        # Raise an exception for HTTP error responses
+        response.raise_for_status()
+
+        # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+        first_page = orjson.loads(response.content)
+
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
+
+    # List to store all entities
+    all_entities = list(first_page)
+
+    # A short first page already holds every entity
+    if len(first_page) < PAGE_LIMIT:
+        return all_entities
+
+    total = response.headers.get("NGSILD-Results-Count")
+
+    # Without a count the number of pages is unknown, so continue page by page
+    if total is None:
+        for page in fiware_scorpio_get_entity_pages_by_type(entity_type, header, id_pattern, key_values, offset=PAGE_LIMIT):
+            all_entities.extend(page)
+
+        return all_entities
+
+    def fetch_page(offset: int) -> list[dict[str, Any]]:
+        # The pages generator stops after one page when it is not advanced further
+        return next(fiware_scorpio_get_entity_pages_by_type(entity_type, header, id_pattern, key_values, offset=offset), [])
+
+    # Offsets of all remaining pages
+    offsets = range(PAGE_LIMIT, int(total), PAGE_LIMIT)
+
+    # Fetch the remaining pages concurrently; map keeps them in offset order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pages = list(executor.map(fetch_page, offsets))
+
+    for page in pages:
+        all_entities.extend(page)
+
     # Return all entities
     return all_entities
 
-def fiware_scorpio_get_entities_by_query_expression(entity_type: str, header:dict, query_expression: str, id_pattern: str | None = None, ids_only: bool = False) -> list[dict[str, Any]]:
+# Characters outside the Basic Multilingual Plane, escaped as a UTF-16 surrogate pair like in stored values
+_NON_BMP_PATTERN = re.compile("[\U00010000-\U0010FFFF]")
+
+def _split_into_surrogates(match: re.Match) -> str:
     """
-    Retrieve all entities of a specific NGSI-LD type that match a given query expression.
+    Replace one character above U+FFFF with its UTF-16 surrogate pair.
+
+    Args:
+        match (re.Match): Match of _NON_BMP_PATTERN
+
+    Returns:
+        str: The high and low surrogate of the character
+    """
+    code_point = ord(match.group()) - 0x10000
+
+    return chr(0xD800 + (code_point >> 10)) + chr(0xDC00 + (code_point & 0x3FF))
+
+@lru_cache(maxsize=128)
+def _escape_query_expression(query_expression: str) -> str:
+    """
+    Prepare a query expression the way Orion-LD stores the compared values.
+
+    The expression is URL-decoded and every non-ASCII character is turned into a
+    Unicode escape sequence, which allows query expressions that contain Cyrillic.
+    The result is cached, so the pages of one query, fetched concurrently or one
+    by one, escape the expression only once.
+
+    Args:
+        query_expression (str): Query expression, possibly URL-encoded
+
+    Returns:
+        str: ASCII query expression with non-ASCII characters escaped
+    """
+    # Decode the URL-encoded strings, living is as the original variant
+    decoded_query_expression = unquote(query_expression)
+
+    # unicode_escape would write emoji and other non-BMP characters as \UXXXXXXXX,
+    # so they are split into surrogates first and come out as two \uXXXX escapes
+    decoded_query_expression = _NON_BMP_PATTERN.sub(_split_into_surrogates, decoded_query_expression)
+
+    # Orion-LD stores the cyrilic values as escape sequences
+    return decoded_query_expression.encode('unicode_escape').decode('ascii')
+
+def fiware_scorpio_get_entity_pages_by_query_expression(entity_type: str, header: dict[str, str], query_expression: str, id_pattern: str | None = None, key_values: bool = False, offset: int = 0) -> Iterator[list[dict[str, Any]]]:
+    """
+    Lazily page through the entities of a specific NGSI-LD type that match a given query expression.
 
     Orion-LD allows fetching a limited number of entities per request (default limit=1000)
-    and supports pagination via the `offset` parameter. This function retrieves all entities
-    of the specified type up to Orion-LD's maximum limit (34,000). The function automatically
+    and supports pagination via the `offset` parameter. Each page is yielded as soon
+    as it is received, so consumers can start working before the last page arrives
+    and only one page is held in memory at a time. The function automatically
     converts non-ASCII characters in the query expression to Unicode escape sequences for
     handling queries in Cyrillic.
-    
+
     Args:
         entity_type (str): 
             The NGSI-LD entity type to retrieve
@@ -290,89 +799,199 @@ def fiware_scorpio_get_entities_by_query_expression(entity_type: str, header:dic
         query_expression (str): 
             Query expression to filter entities
 
-    Returns:
-        list[dict[str, Any]]: List of entities matching the query.
+        id_pattern (str | None, optional):
+            Regular expression the entity IDs must match. Default: None.
+
+        key_values (bool, optional):
+            Request the simplified keyValues representation for consumers that
+            only read attribute values. Default: False.
+
+        offset (int, optional):
+            Index of the first entity to request. Default: 0.
+
+    Yields:
+        list[dict[str, Any]]: A page of up to 1000 entities matching the query.
 
     Raises:
         requests.exceptions.RequestException: If there is a network or HTTP error during the request.
         RuntimeError: If the pagination loop exceeds the maximum allowed iterations (safety measure).
     """
-    # Decode the URL-encoded strings, living is as the original variant
-    decoded_query_expression = unquote(query_expression)
-    
-    # Turn all non-ASCII symbols into escape sequences which are then turned into a string.
-    # This is needed to allow to send query expressions that contain cyrilic.
-    # Orion-LD stores the cyrilic values as escape sequences
-    escaped_query_expression = decoded_query_expression.encode('unicode_escape').decode('ascii')
-    
-    # List to store all entities
-    all_entities = []
+    # Turn all non-ASCII symbols into escape sequences, as Orion-LD stores cyrilic values that way
+    escaped_query_expression = _escape_query_expression(query_expression)
 
-    # Current index from which to start getting entitites
-    offset = 0
-    
-    # Number of entities per request
-    limit = 1000
-    
     # Prevent infinite loops by setting a maximum number of iterations
-    max_iterations = 50
     iteration = 0
 
-    # While there are entities that satisfy the query request, get 1000 at a time
-    while True:
+    # While there are entities that satisfy the query request, get PAGE_LIMIT at a time
+    # Query parameters that are the same for every page, built once per query
+    base_params = {
+        "type": entity_type,
+        "q": escaped_query_expression,
+        "limit": PAGE_LIMIT
+    }
 
-        params = {
-            "type": entity_type,
-            "q": escaped_query_expression,
-            "offset": offset,
-            "limit": limit
-        }
+    if id_pattern is not None:
+        base_params["idPattern"] = id_pattern
 
-        if id_pattern is not None:
-            params["idPattern"] = id_pattern
+    if key_values:
+        base_params["options"] = "keyValues"
+
+    while True:
+
+        # Only the offset changes from page to page
+        params = {**base_params, "offset": offset}
 
         iteration += 1
-        if iteration > max_iterations:
-            raise RuntimeError("Too many iterations in get_entities_by_type")
+        if iteration > MAX_QUERY_PAGES:
+            raise RuntimeError("Too many iterations in get_entities_by_query_expression")
 
         try:
             # Send a GET request with the query expression and starting index
-            response = requests.get(config.OrionLDEndpoint.ENTITIES_ENDPOINT.value, headers=header, params=params)
+            response = SESSION.get(ENTITIES_URL, headers=header, params=params)
 
             # Raise an exception for HTTP error responses
             response.raise_for_status()
             
-            # Ensure correct response encoding
-            response.encoding = "utf-8"
+            # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+            data = orjson.loads(response.content)
 
-            # Parse the JSON response
-            data = response.json()
-            
-            # Break if no more entities
-            if not data:
-                break
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
 
-            # Extend entity list
-            if ids_only:
-                all_entities.extend(entity["id"] for entity in data)
-            else:
-                all_entities.extend(data)
+        # Stop if no more entities
+        if not data:
+            return
 
-            # Move offset for next page
-            offset += 1000
+        yield data
 
-        except requests.exceptions.RequestException as e:
-            raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
+        # A short page is the last one, no need to ask for an empty one
+        if len(data) < PAGE_LIMIT:
+            return
+
+        # Move offset for next page
+        offset += PAGE_LIMIT
+
+def fiware_scorpio_get_entities_by_query_expression(entity_type: str, header:dict, query_expression: str, id_pattern: str | None = None, ids_only: bool = False, key_values: bool = False, max_workers: int = MAX_CONCURRENT_REQUESTS) -> list[dict[str, Any]]:
+    """
+    Retrieve all entities of a specific NGSI-LD type that match a given query expression.
+
+    The first page is requested together with the total number of matches, so the
+    remaining pages can be requested concurrently instead of one after another.
+    Without a count the pages are read in order with
+    `fiware_scorpio_get_entity_pages_by_query_expression`.
     
+    Args:
+        entity_type (str): 
+            The NGSI-LD entity type to retrieve
+        
+        header (dict[str, str]): 
+            HTTP headers to include in the request (Content-Type and Link)
+        
+        query_expression (str): 
+            Query expression to filter entities
+
+        id_pattern (str | None, optional):
+            Regular expression the entity IDs must match. Default: None.
+
+        ids_only (bool, optional):
+            Return only the IDs of the matching entities. The entities are then
+            requested in the keyValues representation. Default: False.
+
+        key_values (bool, optional):
+            Request the simplified keyValues representation for consumers that
+            only read attribute values. Default: False.
+
+        max_workers (int, optional):
+            Maximum number of pages requested at the same time.
+            Default: MAX_CONCURRENT_REQUESTS.
+
+    Returns:
+        list[dict[str, Any]]: List of entities matching the query.
+
+    Raises:
+        requests.exceptions.RequestException: If there is a network or HTTP error during the request.
+        RuntimeError: If the pagination loop exceeds the maximum allowed iterations (safety measure).
+    """
+    # Only the IDs are read, so the normalized Property/Relationship wrappers are not needed
+    key_values = key_values or ids_only
+
+    params = {
+        "type": entity_type,
+        "q": _escape_query_expression(query_expression),
+        "limit": PAGE_LIMIT,
+        "offset": 0,
+        "count": "true"
+    }
+
+    if id_pattern is not None:
+        params["idPattern"] = id_pattern
+
+    if key_values:
+        params["options"] = "keyValues"
+
+    try:
+        # Request the first page together with the total number of matching entities
+        response = SESSION.get(ENTITIES_URL, headers=header, params=params)
+
+        # Raise an exception for HTTP error responses
+        response.raise_for_status()
+
+        # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+        first_page = orjson.loads(response.content)
+
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
+
+    pages = [first_page]
+
+    # A short first page already holds every match
+    if len(first_page) == PAGE_LIMIT:
+        total = response.headers.get("NGSILD-Results-Count")
+
+        # Without a count the number of pages is unknown, so continue page by page
+        if total is None:
+            pages.extend(fiware_scorpio_get_entity_pages_by_query_expression(entity_type, header, query_expression, id_pattern, key_values, offset=PAGE_LIMIT))
+
+        else:
+            # Offsets of all remaining pages
+            offsets = range(PAGE_LIMIT, int(total), PAGE_LIMIT)
+
+            # Same safety limit as the page-by-page loop
+            if len(offsets) >= MAX_QUERY_PAGES:
+                raise RuntimeError("Too many iterations in get_entities_by_query_expression")
+
+            def fetch_page(offset: int) -> list[dict[str, Any]]:
+                # The pages generator stops after one page when it is not advanced further
+                return next(fiware_scorpio_get_entity_pages_by_query_expression(entity_type, header, query_expression, id_pattern, key_values, offset=offset), [])
+
+            # Fetch the remaining pages concurrently; map keeps them in offset order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages.extend(executor.map(fetch_page, offsets))
+
+    # List to store all entities
+    all_entities = []
+
+    # Extend entity list page by page
+    for page in pages:
+        if ids_only:
+            all_entities.extend(entity["id"] for entity in page)
+        else:
+            all_entities.extend(page)
+
     # Return all entities
     return all_entities
 
-def fiware_scorpio_get_attribute_values_from_etities(entity_ids: list[str], attribute_list: list[str], header: dict) -> list[dict[str, Any]]:
+def fiware_scorpio_get_attribute_values_from_etities(entity_ids: list[str], attribute_list: list[str], header: dict, key_values: bool = False, entity_type: str | None = None) -> list[dict[str, Any]]:
     """
     Retrieve specific attributes for a given list of NGSI-LD entities from Orion-LD.
 
-    This function fetches only selected attributes for explicitly specified entity IDs
-    using the `id` and `attrs` query parameters supported by Orion-LD.
+    This function fetches only selected attributes for explicitly specified entity IDs.
+    Short ID lists are sent as the `id` and `attrs` query parameters of a GET request.
+    Longer lists are sent in the JSON body of a Batch Query request instead, so the
+    request URL stays short regardless of the number of IDs. Lists of more than
+    1000 IDs (one page of results) are split into chunks that are queried
+    concurrently and merged in the original order. No request is sent when
+    there are no IDs or no attributes to ask for.
 
     Args:
         entity_ids (list[str]):
@@ -381,37 +1000,81 @@ def fiware_scorpio_get_attribute_values_from_etities(entity_ids: list[str], attr
             List of attribute names to retrieve from each entity
         header (dict[str, str]):
             HTTP headers to include in the request (Content-Type and Link)
+        key_values (bool, optional):
+            Request the simplified keyValues representation, in which every
+            attribute is returned as its plain value. Default: False.
+        entity_type (str | None, optional):
+            NGSI-LD type of the entities, required by the entity selectors of a
+            Batch Query. If None, it is read from every URN
+            (urn:ngsi-ld:<type>:...). Default: None.
 
     Returns:
         list[dict[str, Any]]:
             List of NGSI-LD entities containing only the requested attributes.
 
     Raises:
+        ValueError:
+            If a Batch Query is needed and the type of an entity can not be read from its ID.
         requests.exceptions.RequestException:
             If the HTTP request fails or Orion-LD returns an error status.
     """
-    # Join entity IDs and attribute names into comma-separated strings
-    entities = ",".join(entity_ids)
-    attributes = ",".join(attribute_list)
-
-    try:
-        # Send GET request to Orion-LD with explicit entity IDs and attribute filtering
-        response = requests.get(f'{config.OrionLDEndpoint.ENTITIES_ENDPOINT.value}/?id={entities}&attrs={attributes}', headers=header)
+    # Nothing to ask for; an empty id filter would otherwise match every entity
+    if not entity_ids or not attribute_list:
+        return []
+
+    # Query parameters shared by both request variants
+    query_params = {}
+
+    if key_values:
+        query_params["options"] = "keyValues"
+
+    def query_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+        # Return all entities of the chunk in a single page (Orion-LD limitation: 1000)
+        params = {"limit": len(chunk), **query_params}
+
+        if len(chunk) <= MAX_IDS_PER_GET_QUERY:
+            # Send GET request to Orion-LD with explicit entity IDs and attribute filtering.
+            # The query parameters are URL-encoded by requests
+            params = {
+                "id": ",".join(chunk),
+                "attrs": ",".join(attribute_list),
+                **params,
+            }
+            response = SESSION.get(ENTITIES_URL, headers=header, params=params)
+        else:
+            # Send the IDs and attributes in the body of a Batch Query request
+            query = {
+                "type": "Query",
+                "entities": [{"id": entity_id, "type": entity_type or _entity_type_from_urn(entity_id)} for entity_id in chunk],
+                "attrs": attribute_list,
+            }
+            response = SESSION.post(BATCH_QUERY_URL, headers=header,
+                                    params=params, data=orjson.dumps(query))
 
         # Raise an exception for HTTP error responses
         response.raise_for_status()
         
-        # Ensure correct response encoding
-        response.encoding = "utf-8"
-        
-        # Parse the JSON response
-        data = response.json()
+        # Parse the UTF-8 JSON body straight from the raw bytes with orjson
+        return orjson.loads(response.content)
+
+    # Split the IDs into chunks that each fit in one page of results
+    chunks = [entity_ids[i:i + PAGE_LIMIT] for i in range(0, len(entity_ids), PAGE_LIMIT)]
+
+    try:
+        # A single chunk is sent directly, without a thread pool
+        if len(chunks) <= 1:
+            return query_chunk(entity_ids)
+
+        # The chunks are independent, so query them concurrently; map keeps their order
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = list(executor.map(query_chunk, chunks))
 
-        # Return the filtered entities
-        return data
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"Error when sending GET request: {e}")
 
+    # Return the filtered entities of all chunks as one list
+    return [entity for result in results for entity in result]
+
 def fiware_scorpio_get_count_of_entities_by_type(entity_type: str, header: dict[str, str], limit: int = 1000, id_pattern: str | None = None) -> int:
     """
     Retrieve the total number of NGSI-LD entities of a given type from Orion-LD.
@@ -438,9 +1101,11 @@ def fiware_scorpio_get_count_of_entities_by_type(entity_type: str, header: dict[
         - `limit=0` prevents returning any entity data, making the request lightweight.
 
     """
+    # limit=0 asks only for the count header, so the broker does not serialize a page of entities
     params = {
         "type": entity_type,
-        "count": "true"
+        "count": "true",
+        "limit": 0
     }
 
     if id_pattern is not None:
@@ -448,7 +1113,7 @@ def fiware_scorpio_get_count_of_entities_by_type(entity_type: str, header: dict[
 
     try:
         # Send GET request to Orion-LD to get the count of entities of the specified type
-        response = requests.get(config.OrionLDEndpoint.ENTITIES_ENDPOINT.value, headers=header, params=params)
+        response = SESSION.get(ENTITIES_URL, headers=header, params=params)
         
         # Raise exception for HTTP error responses
         response.raise_for_status()
@@ -469,12 +1134,14 @@ def fiware_scorpio_get_count_of_entities_by_type(entity_type: str, header: dict[
 # UPDATE Requests
 # -----------------------------------------------------  
 
-def fiware_scorpio_batch_replace_entity_data(batch_ngsi_ld_data: list[dict[str, Any]], header: dict[str, str]) -> None:
+def fiware_scorpio_batch_replace_entity_data(batch_ngsi_ld_data: list[dict[str, Any]], header: dict[str, str], batch_size: int = 1000, max_workers: int = MAX_CONCURRENT_REQUESTS) -> None:
     """
     Perform a batch replace operation for NGSI-LD entities in Orion-LD.
 
-    This function sends a POST request to the Orion-LD batch update endpoint
-    to fully replace the data of multiple entities.
+    This function sends POST requests to the Orion-LD batch update endpoint
+    to fully replace the data of multiple entities. Lists longer than
+    batch_size are split into batches that are sent concurrently, so a large
+    realtime snapshot is not pushed through one long request.
 
     Orion-LD returns:
         - HTTP 201 if all entities are successfully replaced
@@ -486,6 +1153,10 @@ def fiware_scorpio_batch_replace_entity_data(batch_ngsi_ld_data: list[dict[str,
             a valid `id` and `type`.
         header (dict[str, str]):
             HTTP headers to include in the request (Content-Type and Link)
+        batch_size (int, optional):
+            Maximum number of entities per request. Default: 1000.
+        max_workers (int, optional):
+            Maximum number of batch requests in flight. Default: MAX_CONCURRENT_REQUESTS.
 
     Returns:
         None
@@ -496,20 +1167,34 @@ def fiware_scorpio_batch_replace_entity_data(batch_ngsi_ld_data: list[dict[str,
         requests.exceptions.RequestException:
             If a network or request-related error occurs.
     """
-    # Extract entity IDs for logging and debugging purposes
-    entities_ids = [entity['id'] for entity in batch_ngsi_ld_data]
-    entities_ids = "\n".join(entities_ids)
-    
-    try:
+    def replace_batch(batch: list[dict[str, Any]]) -> None:
         # Send POST request to Orion-LD batch update endpoint
-        response = requests.post(config.OrionLDEndpoint.BATCH_UPDATE_ENDPOINT.value, json=batch_ngsi_ld_data, headers=header)
+        response = SESSION.post(BATCH_UPDATE_URL, data=orjson.dumps(batch), headers=header)
 
         # Orion-LD considers 201 (Created) and 207 (Multi-Status) as valid responses
         if response.status_code not in (201, 204, 207):
-            raise requests.exceptions.HTTPError(f"Batch replace failed (status={response.status_code}): {response.text}")
+            raise requests.exceptions.HTTPError(f"Batch replace failed (status={response.status_code}): {response.text[:MAX_ERROR_BODY_CHARS]}")
         
         # Log successful batch replace
-        logger.info("Replaced entity data successfully for entities %s", response.status_code)
+        logger.info("Replaced entity data for %d entities (status=%d)", len(batch), response.status_code)
+
+        # The full ID list is only built when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Replaced entities:\n%s", "\n".join(entity["id"] for entity in batch))
+
+    # Split the entities into batches of at most batch_size
+    batches = [batch_ngsi_ld_data[i:i + batch_size] for i in range(0, len(batch_ngsi_ld_data), batch_size)]
+
+    try:
+        # A single batch is sent directly, without a thread pool
+        if len(batches) <= 1:
+            replace_batch(batch_ngsi_ld_data)
+            return
+
+        # The batches are independent, so send them concurrently; the first failure is re-raised
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(replace_batch, batches):
+                pass
 
     except  requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"POST Request Error: {e}")
@@ -543,25 +1228,86 @@ def fiware_scorpio_delete_entity(entity_id: str, header: dict[str, str]) -> None
     
     try:
         # Send DELETE request to Orion-LD for the specified entity
-        response = requests.delete(f"{config.OrionLDEndpoint.ENTITIES_ENDPOINT.value}/{entity_id}", headers=header)
+        response = SESSION.delete(f"{ENTITIES_URL}/{entity_id}", headers=header)
         
         # Raise exception for HTTP error responses
         response.raise_for_status()
         
         # Log successful deletion
-        logger.info(f"Deleted entity with id: {entity_id}")
+        logger.info("Deleted entity with id: %s", entity_id)
         
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"Error when sending DELETE request for entity {entity_id}: {e}")
 
+def fiware_scorpio_post_batch_delete_request(entity_ids: list[str], header: dict[str, str]) -> None:
+    """
+    Send a single Batch Delete request to the Context Broker.
+
+    The Context Broker answers with:
+        - HTTP 204 if all entities were deleted
+        - HTTP 207 (Multi-Status) if only part of the batch was deleted
+
+    For a 207 response only the failed subset is reported. Entities that no
+    longer exist are already in the desired state and are logged at debug level.
+
+    Args:
+        entity_ids (list[str]):
+            IDs of the entities to delete (max 1000 per request).
+        header (dict[str, str]):
+            HTTP headers for the request (Content-Type and Link)
+
+    Returns:
+        None
+
+    Raises:
+        requests.exceptions.RequestException:
+            If the batch delete request fails or some entities could not be deleted.
+    """
+    try:
+        # Send a Batch Delete request to the Context Broker with the IDs in the current batch
+        response = SESSION.post(BATCH_DELETE_URL, data=orjson.dumps(entity_ids), headers=header)
+        
+        # Raise exception for HTTP error responses
+        response.raise_for_status()
+        
+        # Partial success: keep only the errors for entities that still exist
+        if response.status_code == 207:
+            errors = orjson.loads(response.content).get("errors", [])
+
+            real_errors = []
+
+            for err in errors:
+                title = err.get("error", {}).get("title", "").lower()
+
+                if "not found" in title:
+                    logger.debug("Already deleted: %s", err.get("entityId"))
+                else:
+                    real_errors.append(err)
+
+            if real_errors:
+                logger.error("Failed to delete %d of %d entities", len(real_errors), len(entity_ids))
+                raise requests.exceptions.HTTPError(real_errors)
+
+        logger.info("Deleted batch of %d entities", len(entity_ids))
+        
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(f"Batch DELETE Request Error: {e}")
+
 def fiware_scorpio_batch_delete_entities_by_type(entity_type: str, header: dict[str, str]) -> None:
     """
     Delete all NGSI-LD entities of a given type from Orion-LD in batches.
 
     The function:
-    - Retrieves entities by type
-    - Splits their IDs into batches of max 1000 (Orion-LD limitation)
-    - Sends batch delete requests until no entities of the given type remain
+    - Reads the first pages of entity IDs of the given type
+    - Uses every page as a batch of max 1000 IDs (Orion-LD limitation)
+    - Sends the batch delete of every page concurrently, while the next page is read
+    - Repeats until the broker returns an empty first page
+
+    Deleted entities disappear from the listing, so every round starts again
+    at offset 0 instead of relying on a separate count request. A page read
+    while earlier deletes are still running may skip or repeat some IDs;
+    skipped ones are picked up by the next round and repeated ones are
+    reported as not found, which is ignored.
 
     Args:
         entity_type (str):
@@ -576,41 +1322,42 @@ def fiware_scorpio_batch_delete_entities_by_type(entity_type: str, header: dict[
         requests.exceptions.RequestException:
             If a batch delete request fails.
     """
-    # Initial entity count
-    entity_count = fiware_scorpio_get_count_of_entities_by_type(entity_type, header)
-    logger.info(f'Total entities: {entity_count}')
-    
-    # Continue deleting until no entities remain
-    while entity_count > 0:
-        
-        # Orion-LD returns up to ~34k entities per call
-        entities = fiware_scorpio_get_entities_by_type(entity_type, header)
-        
-        # Extract entity IDs
-        entity_ids = [entity['id'] for entity in entities]
-        
-        # Split IDs into batches of max 1000
-        batch_size = 1000
-        batches = [entity_ids[i:i + batch_size] for i in range(0, len(entity_ids), batch_size)]
-        
-        for batch in batches:
-            try:
-                # Send a Batch Delete request to Orion-LD with the IDs in the current batch
-                response = requests.post(config.OrionLDEndpoint.BATCH_DELETE_ENDPOINT.value, json=batch, headers=header)
-                
-                # Raise exception for HTTP error responses
-                response.raise_for_status()
-                
-                logger.info(f"Deleted batch of {len(batch)} entities of type {entity_type}")
-                
-            except requests.exceptions.RequestException as e:
-                raise requests.exceptions.RequestException(f"Batch DELETE Request Error: {e}")
-        
-        # Update remaining entity count      
-        entity_count = fiware_scorpio_get_count_of_entities_by_type(entity_type, header)
-        logger.debug(f'Remaining entities: {entity_count}')
+    # Total number of deleted entities, for logging
+    deleted = 0
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+
+        # Continue deleting until the broker returns no entities
+        while True:
+
+            # Read as many ID pages as can be deleted in parallel.
+            # Every page holds at most 1000 IDs (Orion-LD limitation), so it is used as a delete batch as is
+            # and handed to the pool as soon as it arrives, so the delete of one page overlaps the GET of the next
+            batches = []
+            futures = []
+
+            for batch in islice(fiware_scorpio_get_entity_ids_by_type(entity_type, header), MAX_CONCURRENT_REQUESTS):
+                batches.append(batch)
+                futures.append(executor.submit(fiware_scorpio_post_batch_delete_request, batch, header))
+
+            # Stop once no entities of the type remain
+            if not batches:
+                break
+            
+            # Wait for the round to finish; the first failed batch is re-raised here
+            for future in futures:
+                future.result()
+            
+            deleted += sum(map(len, batches))
+            logger.debug("Deleted %d entities of type %s so far", deleted, entity_type)
+
+    logger.info("Deleted %d entities of type %s", deleted, entity_type)
         
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
     config.set_operating_city("Sofia")
 
     city = config.get_operating_city()
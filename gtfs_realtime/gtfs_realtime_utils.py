@@ -3,6 +3,7 @@ import sys
 import json
 import requests
 from typing import Any
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
 from google.protobuf.message import DecodeError
@@ -15,6 +16,16 @@ sys.path.append(str(project_root))
 from gtfs_static.gtfs_static_utils import remove_none_values
 import config
 
+# Shared read-only stand-in for a missing sub-message, so its fields read as None
+# without a new empty dictionary or a separate presence check per field
+_EMPTY_MESSAGE: dict[str, Any] = {}
+
+# One session for all realtime polls, so the connection to the feed provider is kept alive between cycles
+FEED_SESSION = requests.Session()
+
+# Last feed per endpoint name with its validators: (content, ETag, Last-Modified)
+_FEED_CACHE: dict[str, tuple[bytes, str | None, str | None]] = {}
+
 def unix_to_iso8601(timestamp: int | str | None) -> str | None:
     """
     Convert UNIX timestamp (seconds) to ISO 8601 UTC string.
@@ -64,6 +75,10 @@ def gtfs_realtime_get_feed(api_endpoint: config.GtfsSource) -> bytes:
     GtfsSource enum and returns the raw GTFS-Realtime feed content
     (Protocol Buffers binary format).
 
+    The request is conditional on the ETag and Last-Modified of the previous
+    response from the same endpoint; if the provider answers 304 Not Modified,
+    the cached feed is returned without downloading it again.
+
     Args:
         api_endpoint (config.GtfsSource): Enum value containing the GTFS-Realtime API endpoint URL.
 
@@ -85,11 +100,30 @@ def gtfs_realtime_get_feed(api_endpoint: config.GtfsSource) -> bytes:
         if url is None or url.strip() == "":
             raise ValueError(f"API endpoint {api_endpoint.name} has no URL configured")
         
+        # Ask only for a newer feed than the cached one, if there is one
+        cached = _FEED_CACHE.get(api_endpoint.name)
+        headers = {}
+
+        if cached is not None:
+            _, etag, last_modified = cached
+
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         # Perform HTTP GET request to fetch the GTFS-Realtime feed
-        response = requests.get(url)
+        response = FEED_SESSION.get(url, headers=headers)
+
+        # The feed has not changed since the last poll
+        if cached is not None and response.status_code == 304:
+            return cached[0]
         
         # Raise an exception for HTTP error responses
         response.raise_for_status()
+
+        # Remember the feed and its validators for the next poll
+        _FEED_CACHE[api_endpoint.name] = (response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
         
         # Return raw protobuf binary content
         return response.content
@@ -133,20 +167,27 @@ def gtfs_realtime_feed_to_dict(feed_data: FeedMessage) -> dict[str, Any]:
         feed_data (FeedMessage): Parsed GTFS-Realtime feed protobuf message.
 
     Returns:
-        dict[str, Any]: Dictionary representation of the GTFS-Realtime feed.
+        dict[str, Any]: Dictionary representation of the GTFS-Realtime feed,
+            keyed by the snake_case field names of the .proto definition.
     """
     
-    feed_dict = MessageToDict(feed_data)
+    # Keep the original proto field names instead of the lowerCamelCase JSON names,
+    # so the keys are already snake_case when they reach the normalization step
+    feed_dict = MessageToDict(feed_data, preserving_proto_field_name=True)
     return feed_dict
 
 # -----------------------------------------------------
 # Key Mapping Functions
 # -----------------------------------------------------
 
+@lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
     """
     Convert a string from CamelCase or PascalCase to snake_case.
 
+    Feed keys come from a small fixed vocabulary of field names,
+    so each distinct name is converted once and then served from the cache.
+
     Args:
         name (str): Input string in CamelCase or PascalCase format.
 
@@ -252,12 +293,12 @@ def gtfs_realtime_normalize_trip_descriptor_message(trip: dict | None) -> dict[s
             }
     """
 
-    # Handle None input by using empty dictionary
+    # Handle None input by using the shared empty message
     if trip is None:
-        trip = {}
+        trip = _EMPTY_MESSAGE
     
-    # Extract nested modified_trip dictionary if present
-    modified_trip = trip.get("modified_trip")
+    # Extract nested modified_trip dictionary; a missing one reads as all None
+    modified_trip = trip.get("modified_trip") or _EMPTY_MESSAGE
 
     return {
         "trip_id": to_ngsi_ld_urn(trip.get("trip_id"), "GtfsTrip"),
@@ -269,10 +310,10 @@ def gtfs_realtime_normalize_trip_descriptor_message(trip: dict | None) -> dict[s
 
         # Normalize modified_trip; return None values if a field is missing
         "modified_trip": {
-            "modifications_id": modified_trip.get("modifications_id") if modified_trip else None,
-            "affected_trip_id": to_ngsi_ld_urn(modified_trip.get("affected_trip_id"), "GtfsTrip") if modified_trip else None,
-            "start_time": modified_trip.get("start_time") if modified_trip else None,
-            "start_date": modified_trip.get("start_date") if modified_trip else None,
+            "modifications_id": modified_trip.get("modifications_id"),
+            "affected_trip_id": to_ngsi_ld_urn(modified_trip.get("affected_trip_id"), "GtfsTrip"),
+            "start_time": modified_trip.get("start_time"),
+            "start_date": modified_trip.get("start_date"),
         },
     }
     
@@ -337,7 +378,7 @@ def gtfs_realtime_normalize_vehicle_descriptor_message(vehicle: dict[str, Any] |
     """
     # If no vehicle descriptor is provided, return an empty structure
     if vehicle is None:
-        vehicle = {}
+        vehicle = _EMPTY_MESSAGE
     
     # Normalize and extract supported fields
     return {
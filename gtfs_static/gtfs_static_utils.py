@@ -6,6 +6,8 @@ import json
 import zipfile
 import requests
 from typing import Any, Iterator
+from itertools import islice
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 from datetime import datetime
@@ -17,6 +19,30 @@ sys.path.append(str(project_root))
 import config
 import validation_functions.validation_utils as validation_utils
 
+# -----------------------------------------------------
+# Intermediate records
+# -----------------------------------------------------
+
+@dataclass(slots=True)
+class ShapePoint:
+    """
+    A single GTFS shape point collected while streaming shapes.txt.
+
+    Shape points only live until their shape is complete, but a large feed
+    holds hundreds of thousands of them at once, so a slotted record is used
+    instead of a per-point dictionary.
+
+    Attributes:
+        seq (int): Sequence order of the point within the shape.
+        lon (float): Longitude of the point.
+        lat (float): Latitude of the point.
+        dist (float | None): Distance traveled from the start of the shape, if available.
+    """
+    seq: int
+    lon: float
+    lat: float
+    dist: float | None = None
+
 # -----------------------------------------------------
 # Get Data
 # -----------------------------------------------------
@@ -194,10 +220,12 @@ def cleanup_string(value: Any) -> str | None:
         str | None: Cleaned string, or None if the value is empty or null.
     """
 
-    if value in (None, ""):
-        return None
-    value = str(value).strip()
-    return value or None
+    # Fast path for the common case: strings need no str() conversion
+    if type(value) is not str:
+        if value is None:
+            return None
+        value = str(value)
+    return value.strip() or None
 
 # -----------------------------------------------------
 # Parse functions
@@ -219,7 +247,7 @@ def parse_int(value: str | None, field: str) -> int | None:
     """
 
     value = cleanup_string(value)
-    if value in (None, ""):
+    if value is None:
         return None
     try:
         return int(value)
@@ -242,7 +270,7 @@ def parse_float(value: str | None, field: str) -> float | None:
     """
 
     value = cleanup_string(value)
-    if value in (None, ""):
+    if value is None:
         return None
     try:
         return float(value)
@@ -265,7 +293,7 @@ def parse_date(value: str | None, field: str) -> str | None:
     """
 
     clean_value = cleanup_string(value)
-    if clean_value in (None, ""):
+    if clean_value is None:
         return None
     try:
         return datetime.strptime(clean_value, "%Y%m%d").date().strftime("%Y%m%d")
@@ -289,7 +317,7 @@ def parse_time(value: str | None, field: str) -> str | None:
     """
 
     clean_value = cleanup_string(value)
-    if clean_value in (None, ""):
+    if clean_value is None:
         return None
 
     parts = clean_value.split(":")
@@ -1808,13 +1836,16 @@ def convert_gtfs_calendar_to_ngsi_ld(entity: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict: An NGSI-LD entity of type GtfsCalendarRule.
     """
+    # Resolve the operating city once for every URN built for this entity
+    city = config.get_operating_city()
+
     return {
-            "id": f"urn:ngsi-ld:GtfsCalendarRule:{config.get_operating_city()}:{entity.get('service_id')}",
+            "id": f"urn:ngsi-ld:GtfsCalendarRule:{city}:{entity.get('service_id')}",
             "type": "GtfsCalendarRule",
             
             "hasService": {
                 "type": "Relationship",
-                "object": f"urn:ngsi-ld:GtfsService:{config.get_operating_city()}:{entity.get("service_id")}"
+                "object": f"urn:ngsi-ld:GtfsService:{city}:{entity.get("service_id")}"
             },
             
             "monday": {
@@ -1876,13 +1907,16 @@ def convert_gtfs_calendar_dates_to_ngsi_ld(entity: dict[str, Any]) -> dict[str,
     Returns:
         dict: An NGSI-LD entity of type GtfsCalendarDateRule.
     """
+    # Resolve the operating city once for every URN built for this entity
+    city = config.get_operating_city()
+
     return {
-            "id": f"urn:ngsi-ld:GtfsCalendarDateRule:{config.get_operating_city()}:{entity.get('service_id')}:{entity.get('date')}",
+            "id": f"urn:ngsi-ld:GtfsCalendarDateRule:{city}:{entity.get('service_id')}:{entity.get('date')}",
             "type": "GtfsCalendarDateRule",
             
             "hasService": {
                 "type": "Relationship",
-                "object": f"urn:ngsi-ld:GtfsService:{config.get_operating_city()}:{entity.get("service_id")}"
+                "object": f"urn:ngsi-ld:GtfsService:{city}:{entity.get("service_id")}"
             },
             
             "appliesOn": {
@@ -2127,7 +2161,7 @@ def convert_gtfs_routes_to_ngsi_ld(entity: dict[str, Any]) -> dict[str, Any]:
             }
         }
 
-def convert_gtfs_shapes_to_ngsi_ld(shape_id: str, points: list[dict]) -> dict[str, Any]:
+def convert_gtfs_shapes_to_ngsi_ld(shape_id: str, points: list[ShapePoint]) -> dict[str, Any]:
     """
     Converts a GTFS shape into an NGSI-LD GtfsShape entity.
 
@@ -2138,19 +2172,19 @@ def convert_gtfs_shapes_to_ngsi_ld(shape_id: str, points: list[dict]) -> dict[st
 
     Args:
         shape_id (str): The GTFS shape identifier.
-        points (list[dict]): A list of shape points, each containing:
-            - 'seq': Sequence order of the point
-            - 'coords': Coordinate pair [longitude, latitude]
-            - 'dist': Distance traveled from the start of the shape (optional)
+        points (list[ShapePoint]): A list of shape points, each containing:
+            - seq: Sequence order of the point
+            - lon, lat: Coordinates of the point
+            - dist: Distance traveled from the start of the shape (optional)
 
     Returns:
         dict[str, Any]: An NGSI-LD entity of type GtfsShape.
     """
-    points.sort(key=lambda p: p["seq"])
+    points.sort(key=lambda p: p.seq)
 
-    coords = [p["coords"] for p in points]
+    coords = [[p.lon, p.lat] for p in points]
 
-    dist_traveled = [p["dist"] for p in points if p["dist"] is not None]
+    dist_traveled = [p.dist for p in points if p.dist is not None]
     if not dist_traveled:
         dist_traveled = None
         
@@ -2191,13 +2225,16 @@ def convert_gtfs_stop_times_to_ngsi_ld(entity: dict[str, Any]) -> dict[str, Any]
     Returns:
         dict: An NGSI-LD entity of type GtfsStopTime.
     """
+    # Resolve the operating city once for every URN built for this entity
+    city = config.get_operating_city()
+
     return {
-            "id": f"urn:ngsi-ld:GtfsStopTime:{config.get_operating_city()}:{entity.get("trip_id")}:{entity.get("stop_sequence")}",
+            "id": f"urn:ngsi-ld:GtfsStopTime:{city}:{entity.get("trip_id")}:{entity.get("stop_sequence")}",
             "type": "GtfsStopTime",
             
             "hasTrip": {
                 "type": "Relationship",
-                "object": f"urn:ngsi-ld:GtfsTrip:{config.get_operating_city()}:{entity.get("trip_id")}"
+                "object": f"urn:ngsi-ld:GtfsTrip:{city}:{entity.get("trip_id")}"
             },
             
             "arrivalTime": {
@@ -2395,27 +2432,30 @@ def convert_gtfs_transfers_to_ngsi_ld(entity: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: An NGSI-LD entity of type GtfsTransferRule.
     """
+    # Resolve the operating city once for every URN built for this entity
+    city = config.get_operating_city()
+
     id_parts = [
         "Transfer",
     ]
         
     if entity.get("from_stop_id") is not None:
         id_parts.append(f"fromStop:{entity.get("from_stop_id")}")
-        entity['from_stop_id'] = f"urn:ngsi-ld:GtfsStop:{config.get_operating_city()}:{entity['from_stop_id']}"
+        entity['from_stop_id'] = f"urn:ngsi-ld:GtfsStop:{city}:{entity['from_stop_id']}"
             
     if entity.get("to_stop_id") is not None:
         id_parts.append(f"toStop:{entity.get("to_stop_id")}")
-        entity['to_stop_id'] = f"urn:ngsi-ld:GtfsStop:{config.get_operating_city()}:{entity['to_stop_id']}"
+        entity['to_stop_id'] = f"urn:ngsi-ld:GtfsStop:{city}:{entity['to_stop_id']}"
         
     if entity.get("from_trip_id") is not None:
         id_parts.append(f"fromTrip:{entity.get("from_trip_id")}")
-        entity["from_trip_id"] = f"urn:ngsi-ld:GtfsTrip:{config.get_operating_city()}:{entity["from_trip_id"]}"
+        entity["from_trip_id"] = f"urn:ngsi-ld:GtfsTrip:{city}:{entity["from_trip_id"]}"
 
     if entity.get("to_trip_id") is not None:
         id_parts.append(f"toTrip:{entity.get("to_trip_id")}")
-        entity["to_trip_id"] = f"urn:ngsi-ld:GtfsTrip:{config.get_operating_city()}:{entity["to_trip_id"]}"
+        entity["to_trip_id"] = f"urn:ngsi-ld:GtfsTrip:{city}:{entity["to_trip_id"]}"
             
-    entity_id = f"urn:ngsi-ld:GtfsTransferRule:{config.get_operating_city()}:" + ":".join(id_parts)
+    entity_id = f"urn:ngsi-ld:GtfsTransferRule:{city}:" + ":".join(id_parts)
     
     return {
             "id": entity_id,
@@ -2586,14 +2626,14 @@ def convert_gtfs_translations_to_ngsi_ld(entity: dict[str, Any]) -> dict[str, An
 # Aggregate GTFS Shape Points
 # -----------------------------------------------------
 
-def collect_shape_points(shapes_dict: dict[str, Any], entity: dict[str, Any]) -> None:
+def collect_shape_points(shapes_dict: dict[str, list[ShapePoint]], entity: dict[str, Any]) -> None:
     """
     Aggregates points and distances travelled into lists for each shape.
     Those lists are sorted by point sequence number.
     
     Args:
         shapes_dict (dict): Dictionary grouping points by shape_id. 
-                            Keys are shape_id strings, values are lists of points and distances.
+                            Keys are shape_id strings, values are lists of ShapePoint records.
         entity (dict): Dictionary with data for a single shape point, including:
         - shape_id: the identifier of the shape
         - shape_pt_sequence: sequence number of the point
@@ -2604,11 +2644,12 @@ def collect_shape_points(shapes_dict: dict[str, Any], entity: dict[str, Any]) ->
     
     # Get shape_id and point and distance data from the entity
     shape_id = entity["shape_id"]
-    point = {
-        "seq": entity["shape_pt_sequence"],
-        "coords": [entity["shape_pt_lon"], entity["shape_pt_lat"]],
-        "dist": entity.get("shape_dist_traveled"),
-    }
+    point = ShapePoint(
+        entity["shape_pt_sequence"],
+        entity["shape_pt_lon"],
+        entity["shape_pt_lat"],
+        entity.get("shape_dist_traveled"),
+    )
     
     # Append the point and distance to the corresponding shape_id in shapes_dict
     shapes_dict.setdefault(shape_id, []).append(point)
@@ -3001,7 +3042,7 @@ def gtfs_static_shapes_to_ngsi_ld_stream(reader: Iterator[dict[str, Any]], batch
     """
 
     # Temporary storage for collected shape points grouped by shape_id
-    shapes_dict: dict[str, list[dict]] = {}
+    shapes_dict: dict[str, list[ShapePoint]] = {}
 
     # Current batch of NGSI-LD entities to be yielded
     batch: list[dict] = []
@@ -3385,31 +3426,42 @@ def gtfs_static_get_ngsi_ld_batches(file_type: str, base_dir: str = "gtfs_static
                 yield from gtfs_static_shapes_to_ngsi_ld_stream(reader, batch_size)
                 continue
 
-            # Standard batch processing
-            batch = []
+            # Standard batch processing: convert batch_size rows per transformer call
+            # so the per-row list allocation and call overhead is paid once per batch
+            while rows := list(islice(reader, batch_size)):
 
-            for row in reader:
-                # Convert the GTFS row into NGSI-LD entities
-                result = transformer([row])
-                
-                if isinstance(result, dict):
-                    entities = [result]
-                else:
-                    entities = result
+                # Convert the chunk of GTFS rows into NGSI-LD entities;
+                # an invalid row raises ValueError, so a chunk is never empty
+                yield transformer(rows)
 
-                for entity in entities:
-                    
-                    batch.append(entity)
+def gtfs_static_iter_ngsi_ld_data(file_type: str, base_dir: str = "gtfs_static") -> Iterator[dict[str, Any]]:
+    """
+    Stream GTFS static data as single NGSI-LD entities.
 
-                    # Yield when batch size limit is reached
-                    if len(batch) >= batch_size:
-                        yield batch
-                        batch = []
+    Entity-level view over gtfs_static_get_ngsi_ld_batches, for callers
+    that re-batch the stream themselves (e.g. with itertools.islice).
+    Only one transformer chunk is held in memory at a time.
+
+    Args:
+        file_type (str):
+            GTFS file type (e.g. agency, stops, routes, stop_times, shapes).
+
+        base_dir (str, optional):
+            Base directory containing GTFS folders per city.
+            Default: "gtfs_static".
+
+    Yields:
+        Iterator[dict]:
+            NGSI-LD entities, one at a time.
+
+    Raises:
+        ValueError:
+            If an unsupported GTFS file type is provided.
+    """
+    # Flatten the converted chunks into single entities
+    for batch in gtfs_static_get_ngsi_ld_batches(file_type, base_dir):
+        yield from batch
 
-            # Yield any remaining entities
-            if batch:
-                yield batch
-                
 if __name__ == "__main__":
     config.set_operating_city("Sofia")
     for batch in gtfs_static_get_ngsi_ld_batches("agency"):
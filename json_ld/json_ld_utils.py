@@ -1,8 +1,31 @@
 import os
 import json
-from typing import Any
+from functools import cache
+from itertools import islice
+from typing import Any, Iterator
 from pyproj import Transformer
 
+__all__ = [
+    "json_ld_read_file",
+    "json_ld_transform_coordinates_to_wgs84_coordinates",
+    "json_ld_get_ngsi_ld_data",
+    "json_ld_get_ngsi_ld_batches",
+]
+
+@cache
+def _get_wgs84_transformer() -> Transformer:
+    """
+    Return the shared EPSG:7801 -> WGS84 (EPSG:4326) coordinate transformer.
+
+    Building a pyproj Transformer loads the CRS definitions from the PROJ
+    database, so it is created once on first use and reused by every
+    subsequent call instead of being rebuilt for each PoI category.
+
+    Returns:
+        Transformer: Transformer with always_xy=True, i.e. (x, y) = (lon, lat) ordering.
+    """
+    return Transformer.from_crs("EPSG:7801", "EPSG:4326", always_xy=True)
+
 def json_ld_read_file(file_path: str) -> list[dict[str, Any]]:
     """
     Load NGSI-LD entities from a JSON-LD file.
@@ -58,9 +81,8 @@ def json_ld_transform_coordinates_to_wgs84_coordinates(raw_data: list[dict[str,
         - For "MultiPoint", only the first coordinate pair is preserved.
     """
 
-    # Initialize CRS transformer: local CRS (EPSG:7801) -> WGS84 (EPSG:4326)
-    # always_xy=True ensures (x, y) = (lon, lat) ordering
-    transformer = Transformer.from_crs("EPSG:7801", "EPSG:4326", always_xy=True)
+    # Get the shared CRS transformer: local CRS (EPSG:7801) -> WGS84 (EPSG:4326)
+    transformer = _get_wgs84_transformer()
 
     # Iterate over all entities
     for entity in raw_data:
@@ -156,4 +178,43 @@ def json_ld_get_ngsi_ld_data(keyword: str, base_dir: str = "json_ld") -> list[di
     json_ld_transform_coordinates_to_wgs84_coordinates(ngsi_ld_data)
 
     # Return processed entities
-    return ngsi_ld_data
\ No newline at end of file
+    return ngsi_ld_data
+
+
+def json_ld_get_ngsi_ld_batches(keyword: str, base_dir: str = "json_ld", batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
+    """
+    Load NGSI-LD Point of Interest (PoI) entities and yield them in batches.
+
+    The batches are cut from the loaded entity list with itertools.islice,
+    so no slice copies of the whole list are made, and their shape matches
+    what `fiware_scorpio_batch_load_to_context_broker` expects.
+
+    Args:
+        keyword (str):
+            Category identifier for PoIs (see `json_ld_get_ngsi_ld_data`).
+
+        base_dir (str, optional):
+            Base directory containing the "data" folder with JSON-LD files.
+            Default: "json_ld".
+
+        batch_size (int, optional):
+            Maximum number of NGSI-LD entities yielded per batch.
+            Default: 1000.
+
+    Yields:
+        list[dict[str, Any]]:
+            Lists of NGSI-LD entities ready to be sent to the Context Broker.
+
+    Raises:
+        ValueError:
+            If the provided keyword is not a supported PoI category.
+        FileNotFoundError:
+            If the mapped JSON-LD file does not exist.
+    """
+
+    # Iterator over the processed entities of the category
+    entities = iter(json_ld_get_ngsi_ld_data(keyword, base_dir))
+
+    # Yield consecutive chunks until the iterator is exhausted
+    while batch := list(islice(entities, batch_size)):
+        yield batch
@@ -1,4 +1,7 @@
+import os
 import sys
+import logging
+from concurrent.futures import ProcessPoolExecutor
 
 from fiware_scorpio import fiware_scorpio_crud_operations as olcd
 from gtfs_static import gtfs_static_utils as gsu
@@ -36,9 +39,74 @@ GTFS_CITIES = (
     "Helsinki",
 )
 
+# Lookup for case-insensitive city arguments, built once at import
+# Key   -> lowercase city name
+# Value -> correctly formatted city name
+_GTFS_CITY_MAP = {c.lower(): c for c in GTFS_CITIES}
+
 LOAD_GTFS = "gtfs"
 LOAD_POIS = "pois"
 
+# Upper bound on loader processes; each one transforms and uploads a single entity type
+MAX_LOADER_PROCESSES = min(max(len(GTFS_STATIC_TYPES), len(POIS_TYPES)), os.cpu_count() or 1)
+
+# Format of every console log line of the loader
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+logger = logging.getLogger("DataLoader")
+
+def _configure_logging() -> None:
+    """
+    Send INFO and higher log records straight to the console.
+
+    Also used as the initializer of the loader process pools: a worker ends with
+    os._exit, so its records must not sit in a buffer, and under the spawn or
+    forkserver start methods it does not inherit the parent's configuration.
+    """
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, force=True)
+
+# -----------------------------------------------------
+# Per-type workers (module level, so they can be pickled)
+# -----------------------------------------------------
+def _load_gtfs_static_type(city: str, entity_type: str, header: dict[str, str]) -> int:
+    """
+    Transform one GTFS Static entity type of a city and load it into Orion-LD.
+    Runs inside a worker process, so the operating city is set again there.
+
+    Args:
+        city (str): Properly formatted city name
+        entity_type (str): GTFS Static entity type
+        header (dict[str, str]): Orion-LD request header
+
+    Returns:
+        int: Number of entities sent to Orion-LD
+    """
+    # Worker processes do not share the parent's config state
+    config.set_operating_city(city)
+
+    # Read GTFS Static Data Sources and get the data in NGSI-LD format
+    data = gsu.gtfs_static_get_ngsi_ld_batches(entity_type)
+
+    # Load data into Orion-LD
+    return olcd.fiware_scorpio_batch_load_to_context_broker(data, header)
+
+def _load_pois_type(entity_type: str, header: dict[str, str]) -> int:
+    """
+    Transform one PoI entity type and load it into Orion-LD.
+
+    Args:
+        entity_type (str): PoI entity type
+        header (dict[str, str]): Orion-LD request header
+
+    Returns:
+        int: Number of entities sent to Orion-LD
+    """
+    # Read PoI Data Sources and get data in NGSI-LD format, split into batches
+    data = jlu.json_ld_get_ngsi_ld_batches(entity_type)
+
+    # Load data into Orion-LD
+    return olcd.fiware_scorpio_batch_load_to_context_broker(data, header)
+
 # -----------------------------------------------------
 # Load GTFS Static Data in Orion-LD
 # ----------------------------------------------------- 
@@ -50,30 +118,35 @@ def load_gtfs_static(cities: list[str]):
         cities (list[str]): Supported cities for which GTFS data is available
     """
     
-    print("Loading GTFS static data...")
+    logger.info("Loading GTFS static data...")
     
     # Define GTFS Static Context Header for Orion-LD
     header = olcd.fiware_scorpio_define_header("gtfs_static")
 
-    # Iterate through the selected cities
-    for city in cities:
-        config.set_operating_city(city.title())
-        print(f"\nCity: {city}")
+    # The entity types are independent of each other, so each one is transformed
+    # and uploaded in its own process, sidestepping the GIL for the conversion step
+    with ProcessPoolExecutor(max_workers=MAX_LOADER_PROCESSES, initializer=_configure_logging) as executor:
 
-        # Iterate through the selected GTFS Static Data Types
-        for entity_type in GTFS_STATIC_TYPES:
-            print(f"  • {entity_type}")
+        # Iterate through the selected cities
+        for city in cities:
+            logger.info("City: %s", city)
 
-            # Read GTFS Static Data Sources and get the data in NGSI-LD format
-            data = gsu.gtfs_static_get_ngsi_ld_batches(entity_type)
+            # Start all GTFS Static Data Types of the city at once
+            results = executor.map(
+                _load_gtfs_static_type,
+                [city] * len(GTFS_STATIC_TYPES),
+                GTFS_STATIC_TYPES,
+                [header] * len(GTFS_STATIC_TYPES))
 
-            # Skip the unsupported Data Types
-            if not data:
-                print(f"Warning: Didn't find a data source of type {entity_type} for the city of {city}")
-                continue
+            # Results come back in type order; a worker exception is re-raised here
+            for entity_type, loaded in zip(GTFS_STATIC_TYPES, results):
 
-            # Load data into Orion-LD
-            olcd.fiware_scorpio_batch_load_to_context_broker(data, header)
+                # The batches are produced lazily, so a missing data source only shows up as nothing loaded
+                if not loaded:
+                    logger.warning("Didn't find a data source of type %s for the city of %s", entity_type, city)
+                    continue
+
+                logger.info("  • %s: %d entities", entity_type, loaded)
 
 # -----------------------------------------------------
 # Load PoI data in Orion-LD
@@ -83,23 +156,23 @@ def load_pois():
     Load PoI data provided by GATE Institute
     """
     
-    print("Loading Points of Interest...")
+    logger.info("Loading Points of Interest...")
     
     # Define PoI Context Header for Orion-LD
     header = olcd.fiware_scorpio_define_header("pois")
 
-    # Iterate through the supported PoI Types
-    for entity_type in POIS_TYPES:
-        
-        print(f"  • {entity_type}")
-        
-        # Read PoI Data Sources and get data in NGSI-LD format
-        data = jlu.json_ld_get_ngsi_ld_data(entity_type)
-        
-        # Load data into Orion-LD
-        olcd.fiware_scorpio_batch_load_to_context_broker(data, header)
+    # Transform and upload every PoI type in its own process
+    with ProcessPoolExecutor(max_workers=MAX_LOADER_PROCESSES, initializer=_configure_logging) as executor:
+        results = executor.map(_load_pois_type, POIS_TYPES, [header] * len(POIS_TYPES))
+
+        # Results come back in type order; a worker exception is re-raised here
+        for entity_type, loaded in zip(POIS_TYPES, results):
+            logger.info("  • %s: %d entities", entity_type, loaded)
 
 def main():
+    # Write progress and warnings to the console as they happen
+    _configure_logging()
+
     # Read command-line arguments
     args = sys.argv[1:]
 
@@ -123,25 +196,20 @@ def main():
             print("Error: specify at least one city")
             sys.exit(1)
 
-        # Build a lookup dictionary for valid cities
-        # Key   -> lowercase city name
-        # Value -> correctly formatted city name
-        valid = {c.lower(): c for c in GTFS_CITIES}
-
         normalized = []
 
         for c in cities:
-            # Normalize user input to lowercase for validation
-            key = c.lower()
+            # Normalize user input to lowercase and resolve the formatted city name
+            city = _GTFS_CITY_MAP.get(c.lower())
 
             # Validate that the provided city is supported
-            if key not in valid:
+            if city is None:
                 print(f"Unknown city: {c}")
                 print("Allowed:", ", ".join(GTFS_CITIES))
                 sys.exit(1)
 
             # Store the properly formatted city name
-            normalized.append(valid[key])
+            normalized.append(city)
 
         # Load GTFS data for the validated and normalized cities
         load_gtfs_static(normalized)
@@ -150,8 +218,11 @@ def main():
     if LOAD_POIS in args:
         load_pois()
 
+    # Release the keep-alive connections to the Context Broker
+    olcd.close_session()
+
     # Final confirmation message
-    print("Initial data successfully loaded.")
+    logger.info("Initial data successfully loaded.")
 
 
 if __name__ == "__main__":
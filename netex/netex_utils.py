@@ -1,3 +1,4 @@
+import os
 import json
 import re
 import sys
@@ -11,8 +12,10 @@ from pathlib import Path
 from lxml import etree # type: ignore
 from pyproj import Transformer
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from shapely.geometry import LineString, Point as ShapelyPoint
 from shapely.ops import substring
+from shapely import get_coordinates
 from datetime import datetime, timedelta
 from urllib.parse import quote, unquote
 
@@ -22,6 +25,7 @@ sys.path.append(str(project_root))
 import config
 
 from fiware_scorpio.fiware_scorpio_crud_operations import (
+    MAX_CONCURRENT_LISTINGS,
     fiware_scorpio_define_header,
     fiware_scorpio_get_entities_by_type,
     fiware_scorpio_get_entity_by_id
@@ -41,6 +45,91 @@ NSMAP = {
 
 etree.register_namespace("gis", GIS_NS)
 
+# The NeTEx files are read by OTP, not by people; indenting every streamed element only
+# adds whitespace nodes and output size. Switch on when the XML has to be inspected by hand
+PRETTY_PRINT_XML = False
+
+# Shared default for chained attribute lookups like entity.get("name", _EMPTY_ATTRIBUTE).get("value"),
+# so a missing attribute does not allocate a throwaway dict; it is only read, never mutated
+_EMPTY_ATTRIBUTE: dict[str, Any] = {}
+
+# Lookup tables used for every Line and StopPlace, built once at import
+# Key   -> GTFS route_type code
+# Value -> NeTEx (transport mode, transport submode)
+GTFS_ROUTE_TYPE_TO_NETEX_MODE = {
+    0: ('tram', 'cityTram'),
+    1: ('metro', 'metro'),
+    2: ('rail', 'local'),
+    3: ('bus', 'localBus'),
+    4: ('water', 'localPassengerFerry'),
+    5: ('cableway', 'telecabin'),
+    6: ('cableway', 'telecabin'),
+    7: ('funicular', 'telecabin'),
+    11: ('bus', 'localBus'),
+    12: ('rail', 'local'),
+    100: ('rail', 'local'),
+    101: ('rail', 'airportLinkRail'),
+    102: ('rail', 'longDistance'),
+    103: ('rail', 'interregionalRail'),
+    105: ('rail', 'nightRail'),
+    106: ('rail', 'regionalRail'),
+    107: ('rail', 'touristRailway'),
+    108: ('rail', 'airportLinkRail'),
+    109: ('rail', 'regionalRail'),
+    200: ('coach', 'nationalCoach'),
+    201: ('coach', 'internationalCoach'),
+    202: ('coach', 'nationalCoach'),
+    204: ('coach', 'touristCoach'),
+    400: ('metro', 'urbanRailway'),
+    401: ('metro', 'metro'),
+    402: ('metro', 'metro'),
+    403: ('metro', 'urbanRailway'),
+    405: ('metro', 'urbanRailway'),
+    700: ('bus', 'unknown'),
+    701: ('bus', 'regionalBus'),
+    702: ('bus', 'expressBus'),
+    704: ('bus', 'localBus'),
+    715: ('bus', 'unknown'),
+    800: ('bus', 'unknown'), # (renamed to bus as otp has problems) not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
+    900: ('tram', 'unknown'),
+    1000: ('water', 'unknown'),
+    1200: ('water', 'unknown'),
+    1300: ('cableway', 'unknown'),
+    1301: ('cableway', 'telecabin'),
+    1400: ('funicular', 'funicular'),
+    1501: ('taxi', 'communalTaxi'),
+    1700: ('other', 'unknown'), # not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
+    1702: ('other', 'unknown'), # not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
+}
+
+# Key   -> NeTEx transport mode
+# Value -> tag of the matching submode element
+NETEX_SUBMODE_TAGS = {
+    "rail": "RailSubmode",
+    "coach": "CoachSubmode",
+    "metro": "MetroSubmode",
+    "bus": "BusSubmode",
+    # "trolleyBus": "TrolleyBusSubmode",
+    "tram": "TramSubmode",
+    "water": "WaterSubmode",
+    "cableway": "TelecabinSubmode",
+    "funicular": "FunicularSubmode",
+    "taxi": "TaxiSubMode",
+    "other": "OtherSubMode",
+}
+
+# Key   -> NeTEx transport mode
+# Value -> StopPlaceType value
+NETEX_STOP_PLACE_TYPES = {
+    "rail": "railStation",
+    "metro": "metroStation",
+    "bus": "onstreetBus",
+    "tram": "onstreetTram",
+    "water": "ferryStop",
+    "cableway": "liftStation",
+    "taxi": "taxiStand",
+}
+
 ROUTE_COUNTER = 0
 LINE_COUNTER = 0
 JOURNEY_PATTERN_COUNTER = 0
@@ -49,6 +138,12 @@ SERVICE_JOURNEY_INTERCHANGE_COUNTER = 0
 
 now_time = datetime.now()
 
+# Worker processes used to write the per-route Line XML files in parallel
+MAX_NETEX_PROCESSES = os.cpu_count() or 1
+
+# Authority dataset of the current worker process, shipped once per worker by its initializer
+_WORKER_AUTHORITY_DATASET: dict[str, Any] = {}
+
 # -----------------------------------------------------
 # Output Functions
 # -----------------------------------------------------
@@ -287,20 +382,39 @@ def netex_get_all_gtfs_translations_of_city() -> list[dict[str, Any]]:
     return fiware_scorpio_get_entities_by_type("GtfsTranslation", header, config.get_operating_city())
 
 def netex_load_city_dataset() -> dict[str, Any]:
-    
-    return {
-        "agencies": netex_get_all_gtfs_agencies_of_a_city(),
-        "routes": netex_get_all_gtfs_routes_of_a_city(),
-        "trips": netex_get_all_gtfs_trips_of_a_city(),
-        "calendar": netex_get_all_gtfs_calendar_of_a_city(),
-        "calendar_dates": netex_get_all_gtfs_calendar_dates_of_a_city(),
-        "shapes": netex_get_all_gtfs_shapes_of_a_city(),
-        "stop_times": netex_get_all_gtfs_stop_times_of_a_city(),
-        "stops": netex_get_all_gtfs_stops_of_city(),
-        "transfers": netex_get_all_gtfs_transfers_of_city(),
-        "translations": netex_get_all_gtfs_translations_of_city()
+    """
+    Load every GTFS entity type of the operating city needed for the NeTEx conversion.
+
+    The types are independent of each other, so they are requested concurrently instead of one after another;
+    each type is itself paged concurrently, so the number of types in flight is capped at MAX_CONCURRENT_LISTINGS
+    to keep all requests within the pooled broker connections.
+
+    Returns:
+        dict[str, Any]: Entity lists of the operating city, keyed by collection name
+
+    Raises:
+        ValueError: If config.OPERATING_CITY is not set
+    """
+    # Collection name -> function that fetches it
+    loaders = {
+        "agencies": netex_get_all_gtfs_agencies_of_a_city,
+        "routes": netex_get_all_gtfs_routes_of_a_city,
+        "trips": netex_get_all_gtfs_trips_of_a_city,
+        "calendar": netex_get_all_gtfs_calendar_of_a_city,
+        "calendar_dates": netex_get_all_gtfs_calendar_dates_of_a_city,
+        "shapes": netex_get_all_gtfs_shapes_of_a_city,
+        "stop_times": netex_get_all_gtfs_stop_times_of_a_city,
+        "stops": netex_get_all_gtfs_stops_of_city,
+        "transfers": netex_get_all_gtfs_transfers_of_city,
+        "translations": netex_get_all_gtfs_translations_of_city
     }
 
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LISTINGS) as executor:
+        futures = {name: executor.submit(loader) for name, loader in loaders.items()}
+
+        # Results are collected in the original key order; a failed fetch re-raises here
+        return {name: future.result() for name, future in futures.items()}
+
 # -----------------------------------------------------
 # Index Functions
 # -----------------------------------------------------
@@ -472,7 +586,7 @@ def netex_index_stop_times_by_trip(stop_times: list[dict[str, Any]]) -> dict[str
         
     # Sort by stopSequence as it will be needed later on
     for trip_id in stop_times_by_trip:
-        stop_times_by_trip[trip_id].sort(key=lambda st: st.get("stopSequence", {}).get("value", 0))
+        stop_times_by_trip[trip_id].sort(key=lambda st: st.get("stopSequence", _EMPTY_ATTRIBUTE).get("value", 0))
 
     return dict(stop_times_by_trip)
 
@@ -529,7 +643,7 @@ def netex_index_stop_times_by_trip(stop_times: list[dict[str, Any]]) -> dict[str
 #         stop_id_value = stop_id.split(":")[-1]
 
 #         # Get stop sequence
-#         sequence = stop_time.get("stopSequence", {}).get("value")
+#         sequence = stop_time.get("stopSequence", _EMPTY_ATTRIBUTE).get("value")
 
 #         # If invalid, log error and continue
 #         if not isinstance(sequence, int):
@@ -612,25 +726,25 @@ def netex_helper_filter_valid_transfers_for_service_journey_interchanges(transfe
         transfer_id = transfer.get("id")
 
         # If `hasOrigin` (from_stop_id) is missing, continue
-        has_origin = transfer.get("hasOrigin", {}).get("object")
+        has_origin = transfer.get("hasOrigin", _EMPTY_ATTRIBUTE).get("object")
         if not has_origin:
             logger.error("Transfer cannot be converted to ServiceJourneyInterchange. Missing hasOrigin: %r", transfer_id)
             continue
 
         # If `hasDestination` (to_stop_id) is missing, continue
-        has_destination = transfer.get("hasDestination", {}).get("object")
+        has_destination = transfer.get("hasDestination", _EMPTY_ATTRIBUTE).get("object")
         if not has_destination:
             logger.error("Transfer cannot be converted to ServiceJourneyInterchange. Missing hasDestination: %r",transfer_id)
             continue
 
         # If from_trip_id is missing, continue
-        from_trip = transfer.get("from_trip_id", {}).get("object")
+        from_trip = transfer.get("from_trip_id", _EMPTY_ATTRIBUTE).get("object")
         if not from_trip:
             logger.error("Transfer cannot be converted to ServiceJourneyInterchange. Missing from_trip_id: %r",transfer_id)
             continue
 
         # If to_trip_id is missing, continue
-        to_trip = transfer.get("to_trip_id", {}).get("object")
+        to_trip = transfer.get("to_trip_id", _EMPTY_ATTRIBUTE).get("object")
         if not to_trip:
             logger.error("Transfer cannot be converted to ServiceJourneyInterchange. Missing to_trip_id: %r", transfer_id)
             continue
@@ -677,11 +791,11 @@ def netex_build_field_value_index(translations: list[dict[str, Any]]) -> dict[tu
     index = defaultdict(dict)
 
     for tr in translations:
-        table_name = tr.get("table_name", {}).get("value")
-        field_name = tr.get("field_name", {}).get("value")
-        language = tr.get("language", {}).get("value")
-        translation = tr.get("translation", {}).get("value")
-        field_value = tr.get("field_value", {}).get("value")
+        table_name = tr.get("table_name", _EMPTY_ATTRIBUTE).get("value")
+        field_name = tr.get("field_name", _EMPTY_ATTRIBUTE).get("value")
+        language = tr.get("language", _EMPTY_ATTRIBUTE).get("value")
+        translation = tr.get("translation", _EMPTY_ATTRIBUTE).get("value")
+        field_value = tr.get("field_value", _EMPTY_ATTRIBUTE).get("value")
 
         # only valid field-based translations
         if not field_value:
@@ -699,13 +813,13 @@ def netex_build_record_id_index(translations: list[dict[str, Any]]) -> dict[tupl
     index = defaultdict(dict)
 
     for tr in translations:
-        table_name = tr.get("table_name", {}).get("value")
-        field_name = tr.get("field_name", {}).get("value")
-        language = tr.get("language", {}).get("value")
-        translation = tr.get("translation", {}).get("value")
+        table_name = tr.get("table_name", _EMPTY_ATTRIBUTE).get("value")
+        field_name = tr.get("field_name", _EMPTY_ATTRIBUTE).get("value")
+        language = tr.get("language", _EMPTY_ATTRIBUTE).get("value")
+        translation = tr.get("translation", _EMPTY_ATTRIBUTE).get("value")
 
-        record_id = tr.get("record_id", {}).get("value")
-        record_sub_id = tr.get("record_sub_id", {}).get("value")
+        record_id = tr.get("record_id", _EMPTY_ATTRIBUTE).get("value")
+        record_sub_id = tr.get("record_sub_id", _EMPTY_ATTRIBUTE).get("value")
 
         # only valid record-based translations
         if not record_id:
@@ -1002,7 +1116,7 @@ def netex_build_route_dataset(route: dict[str, Any], authority_dataset: dict[str
         logger.error("Route missing ID: %r", route)
         return {}
 
-    trips = [trip for trip in authority_dataset.get("trips", []) if trip.get("route", {}).get("object") == route_id]
+    trips = [trip for trip in authority_dataset.get("trips", []) if trip.get("route", _EMPTY_ATTRIBUTE).get("object") == route_id]
     
     if not trips:
         logger.warning("Skipping route %s: no trips found.", route_id)
@@ -1014,7 +1128,7 @@ def netex_build_route_dataset(route: dict[str, Any], authority_dataset: dict[str
 
     for trip in trips:
         trip_id = trip.get("id")
-        shape_ref = trip.get("hasShape", {}).get("object")
+        shape_ref = trip.get("hasShape", _EMPTY_ATTRIBUTE).get("object")
 
         if trip_id and shape_ref:
             trip_shapes[trip_id] = shape_ref.split(":")[-1]
@@ -1025,7 +1139,7 @@ def netex_build_route_dataset(route: dict[str, Any], authority_dataset: dict[str
     stop_times_by_trip = {}
 
     for stop_time in stop_times:
-        trip_id = stop_time.get("hasTrip", {}).get("object")
+        trip_id = stop_time.get("hasTrip", _EMPTY_ATTRIBUTE).get("object")
         if trip_id in trip_ids:
             stop_times_by_trip.setdefault(trip_id, []).append(stop_time)
             
@@ -1034,14 +1148,14 @@ def netex_build_route_dataset(route: dict[str, Any], authority_dataset: dict[str
     #     return {}
 
     transfers = [transfer for transfer in authority_dataset.get("transfers", []) 
-                 if transfer.get("from_trip_id", {}).get("object") in trip_ids
+                 if transfer.get("from_trip_id", _EMPTY_ATTRIBUTE).get("object") in trip_ids
                  ]
 
-    service_ids = {trip.get("service", {}).get("object") for trip in trips}
+    service_ids = {trip.get("service", _EMPTY_ATTRIBUTE).get("object") for trip in trips}
         
-    calendars = [calendar for calendar in authority_dataset["calendar"] if calendar.get("hasService", {}).get("object") in service_ids]
+    calendars = [calendar for calendar in authority_dataset["calendar"] if calendar.get("hasService", _EMPTY_ATTRIBUTE).get("object") in service_ids]
 
-    calendar_dates = [calendar_date for calendar_date in authority_dataset["calendar_dates"] if calendar_date.get("hasService", {}).get("object") in service_ids]
+    calendar_dates = [calendar_date for calendar_date in authority_dataset["calendar_dates"] if calendar_date.get("hasService", _EMPTY_ATTRIBUTE).get("object") in service_ids]
     
     return {
         "agency": authority_dataset["agency"],
@@ -1115,7 +1229,7 @@ def netex_helper_stream_validity_conditions(xml_file, now_time) -> None:
     validity_condition = netex_helper_build_validity_conditions(now_time)
     
     # Stream <validityConditions> into NeTEx file
-    xml_file.write(validity_condition, pretty_print=True)
+    xml_file.write(validity_condition, pretty_print=PRETTY_PRINT_XML)
     
 # -----------------------------------------------------
 # Generate <FrameDefaults>
@@ -1137,8 +1251,8 @@ def netex_helper_build_frame_defaults(agency: dict[str, Any]) -> etree.Element |
         logger.error("Unsupported entity type for FrameDefaults conversion: %s", entity_type)
         return None
 
-    time_zone = agency.get("agency_timezone", {}).get("value")
-    language = agency.get("agency_lang", {}).get("value")
+    time_zone = agency.get("agency_timezone", _EMPTY_ATTRIBUTE).get("value")
+    language = agency.get("agency_lang", _EMPTY_ATTRIBUTE).get("value")
 
     frame_defaults = etree.Element("FrameDefaults")
 
@@ -1168,7 +1282,7 @@ def netex_helper_stream_frame_defaults(xml_file, agency: dict[str, Any]) -> None
         return
 
     # Write <FrameDefaults> into XML file
-    xml_file.write(frame_defaults, pretty_print=True)
+    xml_file.write(frame_defaults, pretty_print=PRETTY_PRINT_XML)
     
 # -----------------------------------------------------
 # GtfsAgency to NeTex <Authority> and <Operator>
@@ -1205,7 +1319,7 @@ def netex_helper_build_authority(gtfs_agency: dict[str, Any], company_number: in
         return None
 
     agency_id_value = agency_id.split(":")[-1]
-    agency_name = gtfs_agency.get("agency_name", {}).get("value")
+    agency_name = gtfs_agency.get("agency_name", _EMPTY_ATTRIBUTE).get("value")
 
     # Build <Authority> element with it's info
     authority = etree.Element("Authority", version="1", id=f"{config.NETEX_AUTHORITY}:Authority:{agency_id_value}_ID")
@@ -1214,9 +1328,9 @@ def netex_helper_build_authority(gtfs_agency: dict[str, Any], company_number: in
     etree.SubElement(authority, "Name").text = unquote(agency_name)
     etree.SubElement(authority, "LegalName").text = unquote(agency_name)
 
-    agency_phone = gtfs_agency.get("agency_phone", {}).get("value")
-    agency_fare_url = gtfs_agency.get("agency_fare_url", {}).get("value")
-    agency_email = gtfs_agency.get("agency_email", {}).get("value")
+    agency_phone = gtfs_agency.get("agency_phone", _EMPTY_ATTRIBUTE).get("value")
+    agency_fare_url = gtfs_agency.get("agency_fare_url", _EMPTY_ATTRIBUTE).get("value")
+    agency_email = gtfs_agency.get("agency_email", _EMPTY_ATTRIBUTE).get("value")
 
     contact = etree.SubElement(authority, "ContactDetails")
 
@@ -1266,7 +1380,7 @@ def netex_helper_stream_authorities(xml_file, agencies: list[dict[str, Any]]) ->
         seen_ids.add(authority_id)
 
         # Stream <Authority> element in XML file
-        xml_file.write(authority, pretty_print=True)
+        xml_file.write(authority, pretty_print=PRETTY_PRINT_XML)
 
 def netex_helper_build_operator(entity: dict[str, Any], company_number: int) -> etree.Element | None:
     """
@@ -1293,19 +1407,21 @@ def netex_helper_build_operator(entity: dict[str, Any], company_number: int) ->
         logger.error("Invalid or missing ID for GtfsAgency: %r", agency_id)
         return None
 
-    agency_id_value = agency_id.split(":")[-1]
-    agency_name = entity.get("agency_name", {}).get("value")
+    agency_id_value = agency_id.rpartition(":")[2]
+
+    # Decoded once, the same name is used for <Name> and <LegalName>
+    agency_name = unquote(entity.get("agency_name", _EMPTY_ATTRIBUTE).get("value"))
 
     # Build <Operator> element with it's info
     operator = etree.Element("Operator", version="1", id=f"{config.NETEX_AUTHORITY}:Operator:{agency_id_value}")
 
     etree.SubElement(operator, "CompanyNumber").text = str(company_number)
-    etree.SubElement(operator, "Name").text = unquote(agency_name)
-    etree.SubElement(operator, "LegalName").text = unquote(agency_name)
+    etree.SubElement(operator, "Name").text = agency_name
+    etree.SubElement(operator, "LegalName").text = agency_name
 
-    agency_phone = entity.get("agency_phone", {}).get("value")
-    agency_fare_url = entity.get("agency_fare_url", {}).get("value")
-    agency_email = entity.get("agency_email", {}).get("value")
+    agency_phone = entity.get("agency_phone", _EMPTY_ATTRIBUTE).get("value")
+    agency_fare_url = entity.get("agency_fare_url", _EMPTY_ATTRIBUTE).get("value")
+    agency_email = entity.get("agency_email", _EMPTY_ATTRIBUTE).get("value")
 
     contact = etree.SubElement(operator, "ContactDetails")
 
@@ -1355,7 +1471,7 @@ def netex_helper_stream_operators(xml_file, agencies: list[dict[str, Any]]) -> N
         seen_ids.add(operator_id)
 
         # Stream <Operator> element in XML file
-        xml_file.write(operator, pretty_print=True)
+        xml_file.write(operator, pretty_print=PRETTY_PRINT_XML)
 
 # -----------------------------------------------------
 # Generate <ResourceFrame>
@@ -1416,7 +1532,7 @@ def netex_helper_build_network(agency: dict[str, Any]) -> etree.Element | None:
     
     # Extract ID value and agency name
     network_id_value = network_id.split(":")[-1]
-    agency_name = agency.get("agency_name", {}).get("value")
+    agency_name = agency.get("agency_name", _EMPTY_ATTRIBUTE).get("value")
 
     # Build <Network> element with it's info
     network = etree.Element("Network", version="1", id=f"{config.NETEX_AUTHORITY}:Network:{network_id_value}Nett")
@@ -1446,7 +1562,7 @@ def netex_helper_stream_networks(xml_file, agency: dict[str, Any]) -> None:
         return
 
     # Stream the <Network> element into the XML file
-    xml_file.write(network, pretty_print=True)
+    xml_file.write(network, pretty_print=PRETTY_PRINT_XML)
 
 # -----------------------------------------------------
 # GtfsShape to <ServiceLink>
@@ -1511,9 +1627,9 @@ def netex_helper_extract_stops_in_a_trip(gtfs_stop_time_entities: list[dict[str,
             continue
         
         # Get trip id, stop id and sequence
-        trip_id = stop_time.get("hasTrip", {}).get("object")
-        stop_id = stop_time.get("hasStop", {}).get("object")
-        sequence = stop_time.get("stopSequence", {}).get("value")
+        trip_id = stop_time.get("hasTrip", _EMPTY_ATTRIBUTE).get("object")
+        stop_id = stop_time.get("hasStop", _EMPTY_ATTRIBUTE).get("object")
+        sequence = stop_time.get("stopSequence", _EMPTY_ATTRIBUTE).get("value")
 
         if not isinstance(trip_id, str) or ":" not in trip_id:
             logger.error("Invalid or missing ID for GtfsTrip: %r", trip_id)
@@ -1577,7 +1693,7 @@ def netex_helper_extract_stop_coordinates(gtfs_stop_entities: list[dict[str, Any
         stop_id_value = stop_id.split(":")[-1]
 
         # Get stop coordinates
-        coordinates = stop.get("location", {}).get("value", {}).get("coordinates")
+        coordinates = stop.get("location", _EMPTY_ATTRIBUTE).get("value", _EMPTY_ATTRIBUTE).get("coordinates")
 
         # Only consider stops that have valid stop ID and coordinates
         if not coordinates or len(coordinates) != 2:
@@ -1625,7 +1741,7 @@ def netex_helper_extract_shape_linestrings(gtfs_shapes: list[dict[str, Any]]) ->
         shape_id_value = shape_id.split(":")[-1]
 
         # Get shape points
-        points = shape.get("location", {}).get("value", {}).get("coordinates", [])
+        points = shape.get("location", _EMPTY_ATTRIBUTE).get("value", _EMPTY_ATTRIBUTE).get("coordinates", [])
         if not isinstance(points, list):
             logger.error("Missing or invalid coordinates for shape %s", shape_id)
             continue
@@ -1690,7 +1806,7 @@ def netex_helper_map_trips_to_shapes(gtfs_trips: list[dict[str, Any]]) -> dict[s
         trip_id_value = trip_id.split(":")[-1]
         
         # Get shape ID
-        shape_id = trip.get("hasShape", {}).get("object")
+        shape_id = trip.get("hasShape", _EMPTY_ATTRIBUTE).get("object")
         if not isinstance(shape_id, str) or ":" not in shape_id:
             logger.error("Invalid or missing ID for GtfsShape: %r", shape_id)
             continue
@@ -1967,6 +2083,9 @@ def netex_helper_create_service_link_info(stops_per_trip: dict[str, list[str]],
                 "geometry": geometry,
             }
     
+# Formatter for a single posList number
+_POS_LIST_NUMBER_FORMAT = "{:.6f}".format
+
 def netex_helper_convert_line_string_to_string(line: LineString) -> str:
     """
     Convert LineString geometry to GML posList string.
@@ -1978,7 +2097,9 @@ def netex_helper_convert_line_string_to_string(line: LineString) -> str:
         str: A string representation of the LineString in GML posList format
     """
 
-    return " ".join(f"{x:.6f} {y:.6f}" for x, y in line.coords)
+    # Read all coordinates in one vectorized call as a flat x, y, x, y, ... list and format
+    # them with a bound method, instead of unpacking one coordinate tuple per point
+    return " ".join(map(_POS_LIST_NUMBER_FORMAT, get_coordinates(line).ravel().tolist()))
 
 def netex_helper_build_service_link(service_link_data: dict[str, Any]) -> etree.Element:
     """
@@ -2062,7 +2183,7 @@ def netex_stream_service_links(xml_file, service_links_data: list[dict]) -> None
             service_link = netex_helper_build_service_link(data)
 
             # Stream <ServiceLink> into the XML file
-            xml_file.write(service_link, pretty_print=True)
+            xml_file.write(service_link, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d ServiceLinks", len(seen))
 
@@ -2245,7 +2366,7 @@ def netex_helper_stream_day_types(xml_file, entities: list[dict[str, Any]]) -> N
             seen_ids.add(day_type_id)
 
             # Stream the <DayType> element into the XML file
-            xml_file.write(day_type, pretty_print=True)
+            xml_file.write(day_type, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d DayTypes", len(seen_ids))
 
@@ -2279,10 +2400,10 @@ def netex_helper_build_operating_period(entity: dict[str, Any]) -> etree.Element
     period_id_value = period_id.split(":")[-1]
 
     # Get and convert start and end dates to ISO format
-    from_date = entity.get("startDate", {}).get("value")
+    from_date = entity.get("startDate", _EMPTY_ATTRIBUTE).get("value")
     from_date_iso = netex_helper_convert_yyyymmdd_date_to_iso_date(from_date)
 
-    to_date = entity.get("endDate", {}).get("value")
+    to_date = entity.get("endDate", _EMPTY_ATTRIBUTE).get("value")
     to_date_iso = netex_helper_convert_yyyymmdd_date_to_iso_date(to_date)
 
     # Build and return the <OperatingPeriod> element with the extracted ID value and date properties
@@ -2331,7 +2452,7 @@ def netex_helper_stream_operating_periods(xml_file, entities: list[dict[str, Any
             seen_ids.add(period_id)
 
             # Stream the <OperatingPeriod> element into the XML file
-            xml_file.write(operating_period, pretty_print=True)
+            xml_file.write(operating_period, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d OperatingPeriods", len(seen_ids))
 
@@ -2374,7 +2495,7 @@ def netex_helper_build_day_type_assignment(entity: dict[str, Any], index: int) -
         raw_date = parts[-1]
 
         # Determine availability based on the exception type (1 for added service, 2 for removed service)
-        exception_type = entity.get("exceptionType", {}).get("value")
+        exception_type = entity.get("exceptionType", _EMPTY_ATTRIBUTE).get("value")
         is_available = exception_type == 1
         is_available_value = "true" if is_available else "false"
 
@@ -2435,7 +2556,7 @@ def netex_helper_stream_day_type_assignments(xml_file, entities: list[dict[str,
                 continue
 
             # Stream the <DayTypeAssignment> element into the XML file
-            xml_file.write(day_type_assignment, pretty_print=True)
+            xml_file.write(day_type_assignment, pretty_print=PRETTY_PRINT_XML)
             written_count += 1
 
     logger.info("Finished streaming %d DayTypeAssignments", written_count)
@@ -2481,52 +2602,7 @@ def netex_helper_get_transport_mode_and_submode(gtfs_route_type_code: int) -> tu
     Returns:
         A tuple containing the NeTEx transport mode and submode, or (None, None) if not found.
     """
-    gtfs_to_netex_map = {
-        0: ('tram', 'cityTram'),
-        1: ('metro', 'metro'),
-        2: ('rail', 'local'),
-        3: ('bus', 'localBus'),
-        4: ('water', 'localPassengerFerry'),
-        5: ('cableway', 'telecabin'),
-        6: ('cableway', 'telecabin'),
-        7: ('funicular', 'telecabin'),
-        11: ('bus', 'localBus'),
-        12: ('rail', 'local'),
-        100: ('rail', 'local'),
-        101: ('rail', 'airportLinkRail'),
-        102: ('rail', 'longDistance'),
-        103: ('rail', 'interregionalRail'),
-        105: ('rail', 'nightRail'),
-        106: ('rail', 'regionalRail'),
-        107: ('rail', 'touristRailway'),
-        108: ('rail', 'airportLinkRail'),
-        109: ('rail', 'regionalRail'),
-        200: ('coach', 'nationalCoach'),
-        201: ('coach', 'internationalCoach'),
-        202: ('coach', 'nationalCoach'),
-        204: ('coach', 'touristCoach'),
-        400: ('metro', 'urbanRailway'),
-        401: ('metro', 'metro'),
-        402: ('metro', 'metro'),
-        403: ('metro', 'urbanRailway'),
-        405: ('metro', 'urbanRailway'),
-        700: ('bus', 'unknown'),
-        701: ('bus', 'regionalBus'),
-        702: ('bus', 'expressBus'),
-        704: ('bus', 'localBus'),
-        715: ('bus', 'unknown'),
-        800: ('bus', 'unknown'), # (renamed to bus as otp has problems) not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
-        900: ('tram', 'unknown'),
-        1000: ('water', 'unknown'),
-        1200: ('water', 'unknown'),
-        1300: ('cableway', 'unknown'),
-        1301: ('cableway', 'telecabin'),
-        1400: ('funicular', 'funicular'),
-        1501: ('taxi', 'communalTaxi'),
-        1700: ('other', 'unknown'), # not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
-        1702: ('other', 'unknown'), # not in the official documentation but found here https://github.com/entur/netex-gtfs-converter-java
-    }
-    return gtfs_to_netex_map.get(gtfs_route_type_code, (None, None))
+    return GTFS_ROUTE_TYPE_TO_NETEX_MODE.get(gtfs_route_type_code, (None, None))
 
 def netex_helper_build_line(route: dict[str, Any]) -> etree.Element | None:
     """
@@ -2558,57 +2634,43 @@ def netex_helper_build_line(route: dict[str, Any]) -> etree.Element | None:
     # Build Line XML
     line = etree.Element("Line", version="1", id = f"{config.NETEX_AUTHORITY}:Line:{route_id_value}")
 
-    route_long_name = route.get("name", {}).get("value")
+    route_long_name = route.get("name", _EMPTY_ATTRIBUTE).get("value")
     if route_long_name:
         etree.SubElement(line, "Name").text = unquote(route_long_name)
 
-    route_description = route.get("description", {}).get("value")
+    route_description = route.get("description", _EMPTY_ATTRIBUTE).get("value")
     if route_description:
         etree.SubElement(line, "Description").text = unquote(route_description)
 
-    route_type = route.get("routeType", {}).get("value")
+    route_type = route.get("routeType", _EMPTY_ATTRIBUTE).get("value")
 
     transport_mode, transport_submode = netex_helper_get_transport_mode_and_submode(route_type)
 
     etree.SubElement(line, "TransportMode").text = transport_mode
 
-    submode_tag_map = {
-        "rail": "RailSubmode",
-        "coach": "CoachSubmode",
-        "metro": "MetroSubmode",
-        "bus": "BusSubmode",
-        # "trolleyBus": "TrolleyBusSubmode",
-        "tram": "TramSubmode",
-        "water": "WaterSubmode",
-        "cableway": "TelecabinSubmode",
-        "funicular": "FunicularSubmode",
-        "taxi": "TaxiSubMode",
-        "other": "OtherSubMode",
-    }
-
     if transport_mode is None or transport_submode is None:
         raise ValueError(
             f"Invalid or unknown transport mode and submode: {route_type}"
         )
 
     if transport_mode != "trolleyBus":
-        submode_tag = submode_tag_map.get(transport_mode)
+        submode_tag = NETEX_SUBMODE_TAGS.get(transport_mode)
 
         transport_submode_element = etree.SubElement(line, "TransportSubmode")
 
         etree.SubElement(transport_submode_element, submode_tag).text = transport_submode
 
-    route_url = route.get("route_url", {}).get("value")
+    route_url = route.get("route_url", _EMPTY_ATTRIBUTE).get("value")
 
     if route_url:
         etree.SubElement(line, "Url").text = route_url
 
-    route_short_name = route.get("shortName", {}).get("value")
+    route_short_name = route.get("shortName", _EMPTY_ATTRIBUTE).get("value")
 
     if route_short_name:
         etree.SubElement(line, "PublicCode").text = route_short_name
 
-    agency_id = route.get("operatedBy", {}).get("object")
+    agency_id = route.get("operatedBy", _EMPTY_ATTRIBUTE).get("object")
 
     if agency_id:
         agency_id_value = agency_id.split(":")[-1]
@@ -2618,8 +2680,8 @@ def netex_helper_build_line(route: dict[str, Any]) -> etree.Element | None:
         etree.SubElement(line,"RepresentedByGroupRef",
                          ref = f"{config.NETEX_AUTHORITY}:Network:{agency_id_value}Nett")
 
-    route_colour = route.get("routeColor", {}).get("value")
-    route_text_colour = route.get("routeTextColor", {}).get("value")
+    route_colour = route.get("routeColor", _EMPTY_ATTRIBUTE).get("value")
+    route_text_colour = route.get("routeTextColor", _EMPTY_ATTRIBUTE).get("value")
 
     if route_colour or route_text_colour:
 
@@ -2647,7 +2709,7 @@ def netex_helper_stream_line(xml_file, route: dict[str, Any]) -> None:
     
     if line is not None:
         with xml_file.element("lines"):
-            xml_file.write(line, pretty_print=True)      
+            xml_file.write(line, pretty_print=PRETTY_PRINT_XML)      
             LINE_COUNTER += 1
                 
 # -----------------------------------------------------
@@ -2681,7 +2743,7 @@ def netex_helper_build_destionation_display(stop: dict[str, Any]) -> etree.Eleme
     stop_id_value = route_id.split(":")[-1]
     
     # Bild <DestinationDisplay> element
-    stop_name = stop.get("name", {}).get("value")
+    stop_name = stop.get("name", _EMPTY_ATTRIBUTE).get("value")
     
     if not isinstance(stop_name, str):
         logger.error("Invalid stop name in stop %s: %r", route_id, stop_name)
@@ -2732,7 +2794,7 @@ def netex_helper_stream_destination_displays(xml_file, gtfs_stops):
             seen_ids.add(destination_display_id)
 
             # Stream the <ScheduledStopPoint> element into the XML file
-            xml_file.write(destination_display,pretty_print=True)
+            xml_file.write(destination_display,pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d DestinationDisplays", len(seen_ids))
 
@@ -2768,7 +2830,7 @@ def netex_helper_build_scheduled_stop_point(gtfs_stop: dict[str, Any]) -> etree.
     stop_id_value = stop_id.split(":")[-1]
 
     # Extract stop name if available
-    stop_name = gtfs_stop.get("name", {}).get("value")
+    stop_name = gtfs_stop.get("name", _EMPTY_ATTRIBUTE).get("value")
 
     # Build and return the <ScheduledStopPoint> element with the extracted ID value, name and location reference
     scheduled_stop_point = etree.Element("ScheduledStopPoint", version="1", 
@@ -2818,7 +2880,7 @@ def netex_helper_stream_scheduled_stop_points(xml_file, gtfs_stops: list[dict[st
             seen_ids.add(scheduled_stop_point_id)
 
             # Stream the <ScheduledStopPoint> element into the XML file
-            xml_file.write(scheduled_stop_point,pretty_print=True)
+            xml_file.write(scheduled_stop_point,pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d ScheduledStopPoints", len(seen_ids))
 
@@ -2843,7 +2905,7 @@ def netex_helper_get_transport_modes_per_stop(authority_dataset: dict[str, Any])
 
     for route in authority_dataset["routes"]:
         route_id = route["id"]
-        route_type = route.get("routeType", {}).get("value")
+        route_type = route.get("routeType", _EMPTY_ATTRIBUTE).get("value")
 
         route_modes_and_submodes[route_id] = netex_helper_get_transport_mode_and_submode(route_type)
 
@@ -2893,10 +2955,10 @@ def netex_helper_build_stop_place(gtfs_stop_entity: dict[str, Any], transport_mo
     stop_place = etree.Element("StopPlace", version = "1", id = f"{config.NETEX_AUTHORITY}:StopPlace:{stop_id_value}")
 
     # Extract  name, code, description and coordinates
-    name_value = gtfs_stop_entity.get("name", {}).get("value")
-    stop_code_value = gtfs_stop_entity.get("code", {}).get("value")
-    description_value = gtfs_stop_entity.get("description", {}).get("value")
-    coords = gtfs_stop_entity.get("location", {}).get("value", {}).get("coordinates")
+    name_value = gtfs_stop_entity.get("name", _EMPTY_ATTRIBUTE).get("value")
+    stop_code_value = gtfs_stop_entity.get("code", _EMPTY_ATTRIBUTE).get("value")
+    description_value = gtfs_stop_entity.get("description", _EMPTY_ATTRIBUTE).get("value")
+    coords = gtfs_stop_entity.get("location", _EMPTY_ATTRIBUTE).get("value", _EMPTY_ATTRIBUTE).get("coordinates")
 
     # Add Name, Description, PublicCode and Centroid elements if values are present
     if name_value:
@@ -2915,8 +2977,8 @@ def netex_helper_build_stop_place(gtfs_stop_entity: dict[str, Any], transport_mo
     #     etree.SubElement(location, "Latitude").text = str(coords[1])
 
     # Extract wheelchair boarding and tts_stop_name for accessibility information
-    wheelchair = gtfs_stop_entity.get("wheelchair_boarding", {}).get("value")
-    tts_stop_name = gtfs_stop_entity.get("tts_stop_name", {}).get("value")
+    wheelchair = gtfs_stop_entity.get("wheelchair_boarding", _EMPTY_ATTRIBUTE).get("value")
+    tts_stop_name = gtfs_stop_entity.get("tts_stop_name", _EMPTY_ATTRIBUTE).get("value")
 
     # Add AccessibilityAssessment and AccessibilityLimitation elements if wheelchair boarding information is present
     if wheelchair:
@@ -2937,7 +2999,7 @@ def netex_helper_build_stop_place(gtfs_stop_entity: dict[str, Any], transport_mo
         etree.SubElement(accessibility_limitation, "VisualSignsAvailable").text = "unknown"
 
     # Extract parent station information and add ParentSiteRef element if present
-    parent_station = gtfs_stop_entity.get("hasParentStation", {}).get("object")
+    parent_station = gtfs_stop_entity.get("hasParentStation", _EMPTY_ATTRIBUTE).get("object")
     
     if parent_station:
         parent_station_value = parent_station.split(":")[-1]
@@ -2963,40 +3025,16 @@ def netex_helper_build_stop_place(gtfs_stop_entity: dict[str, Any], transport_mo
     # Add TransportMode and StopPlaceType elements
     etree.SubElement(stop_place, "TransportMode").text = transport_mode
     
-    submode_tag_map = {
-        "rail": "RailSubmode",
-        "coach": "CoachSubmode",
-        "metro": "MetroSubmode",
-        "bus": "BusSubmode",
-        # "trolleyBus": "TrolleyBusSubmode",
-        "tram": "TramSubmode",
-        "water": "WaterSubmode",
-        "cableway": "TelecabinSubmode",
-        "funicular": "FunicularSubmode",
-        "taxi": "TaxiSubMode",
-        "other": "OtherSubMode",
-    }
-    
-    stop_place_tag_map = {
-        "rail": "railStation",
-        "metro": "metroStation",
-        "bus": "onstreetBus",
-        "tram": "onstreetTram",
-        "water": "ferryStop",
-        "cableway": "liftStation",
-        "taxi": "taxiStand",
-    }
-
     # Get submode type tag
     if transport_mode != "trolleyBus":
           
-        submode_tag = submode_tag_map.get(transport_mode)
+        submode_tag = NETEX_SUBMODE_TAGS.get(transport_mode)
             
         # Add transport submode
         etree.SubElement(stop_place, submode_tag).text = transport_submode
     
         #Add StopPlaceType
-        stop_place_type = stop_place_tag_map.get(transport_mode)
+        stop_place_type = NETEX_STOP_PLACE_TYPES.get(transport_mode)
         
         etree.SubElement(stop_place, "StopPlaceType").text = stop_place_type
         
@@ -3046,7 +3084,7 @@ def netex_helper_stream_stop_places(xml_file, transport_modes_per_stop: dict[str
 
 
             # Stream the <StopPlace> element into the XML file
-            xml_file.write(stop_place, pretty_print=True)
+            xml_file.write(stop_place, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d stopPlaces", len(seen))
 
@@ -3128,7 +3166,7 @@ def netex_helper_stream_passenger_stop_assignments(xml_file, entities: list[dict
             seen.add(passenger_stop_assignment_id)
 
             # Stream the <PassengerStopAssignment> element into the XML file
-            xml_file.write(passenger_stop_assignment, pretty_print=True)
+            xml_file.write(passenger_stop_assignment, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d PassengerStopAssignments", len(seen))
 
@@ -3212,7 +3250,7 @@ def netex_helper_stream_route_points(xml_file, gtfs_stops: list[dict[str, Any]])
             seen_ids.add(route_point_id)
 
             # Stream the <RoutePoint> element into the XML file
-            xml_file.write(route_point, pretty_print=True)
+            xml_file.write(route_point, pretty_print=PRETTY_PRINT_XML)
 
     logger.info("Finished streaming %d RoutePoints", len(seen_ids))
 
@@ -3241,9 +3279,9 @@ def netex_build_route_structures(route_dataset: dict[str, Any]) -> list[dict[str
 
     route_id = route.get("id")
 
-    route_short_name = route.get("shortName", {}).get("value")
-    route_long_name = route.get("name", {}).get("value")
-    agency_id = route.get("operatedBy", {}).get("object")
+    route_short_name = route.get("shortName", _EMPTY_ATTRIBUTE).get("value")
+    route_long_name = route.get("name", _EMPTY_ATTRIBUTE).get("value")
+    agency_id = route.get("operatedBy", _EMPTY_ATTRIBUTE).get("object")
 
     # Group trips by direction + stop sequence
     trip_groups = {}
@@ -3270,7 +3308,7 @@ def netex_build_route_structures(route_dataset: dict[str, Any]) -> list[dict[str
 
         for stop_time in trip_stop_times:
 
-            stop_id = stop_time.get("hasStop", {}).get("object")
+            stop_id = stop_time.get("hasStop", _EMPTY_ATTRIBUTE).get("object")
 
             if not isinstance(stop_id, str) or ":" not in stop_id:
                 logger.warning(
@@ -3285,7 +3323,7 @@ def netex_build_route_structures(route_dataset: dict[str, Any]) -> list[dict[str
             logger.warning("No stop sequence found for trip %s", trip_id)
             continue
 
-        direction_id = trip.get("direction", {}).get("value")
+        direction_id = trip.get("direction", _EMPTY_ATTRIBUTE).get("value")
 
         direction = None
 
@@ -3305,7 +3343,7 @@ def netex_build_route_structures(route_dataset: dict[str, Any]) -> list[dict[str
         trip_groups[key]["trips"].append(
             {
                 "trip_id": trip_id,
-                "service_id": trip.get("service", {}).get("object"),
+                "service_id": trip.get("service", _EMPTY_ATTRIBUTE).get("object"),
                 "shape_id": shape_id
             }
         )
@@ -3405,7 +3443,7 @@ def netex_helper_stream_routes(xml_file, route_structures: list[dict[str, Any]])
     with xml_file.element("routes"):
 
         for route in valid_routes:
-            xml_file.write(route, pretty_print=True)
+            xml_file.write(route, pretty_print=PRETTY_PRINT_XML)
             ROUTE_COUNTER += 1
 
 # -----------------------------------------------------
@@ -3441,8 +3479,8 @@ def netex_helper_build_journey_pattern(route_structure: dict[str, Any]) -> etree
         is_first = (order == 1)
         is_last = (order == len(sequence))
 
-        pickup_type = stop_time.get("pickupType", {}).get("value")
-        drop_off_type = stop_time.get("dropOffType", {}).get("value")
+        pickup_type = stop_time.get("pickupType", _EMPTY_ATTRIBUTE).get("value")
+        drop_off_type = stop_time.get("dropOffType", _EMPTY_ATTRIBUTE).get("value")
 
         point_on_route = etree.SubElement(points_in_sequence, "StopPointInJourneyPattern", order=str(order), version="1",
                                           id=f"{config.NETEX_AUTHORITY}:StopPointInJourneyPattern:{route_id_value}_{sequence[0]}_{sequence[-1]}_{stop_id}_{unique_identifier}")
@@ -3497,7 +3535,7 @@ def netex_helper_stream_journey_patterns(xml_file, route_structures: list[dict[s
 
     with xml_file.element("journeyPatterns"):
         for journey_pattern in valid_journey_patterns:
-            xml_file.write(journey_pattern, pretty_print=True)    
+            xml_file.write(journey_pattern, pretty_print=PRETTY_PRINT_XML)    
             JOURNEY_PATTERN_COUNTER += 1
 
 # -----------------------------------------------------
@@ -3506,10 +3544,10 @@ def netex_helper_stream_journey_patterns(xml_file, route_structures: list[dict[s
 
 def netex_helper_build_service_journey_interchange(route_tansfer: dict[str, Any]) -> etree.Element:
 
-    from_stop_id = route_tansfer.get("hasOrigin", {}).get("object")
-    to_stop_id = route_tansfer.get("hasDestination", {}).get("object")
-    from_trip_id = route_tansfer.get("from_trip_id", {}).get("object")
-    to_trip_id = route_tansfer.get("to_trip_id", {}).get("object")
+    from_stop_id = route_tansfer.get("hasOrigin", _EMPTY_ATTRIBUTE).get("object")
+    to_stop_id = route_tansfer.get("hasDestination", _EMPTY_ATTRIBUTE).get("object")
+    from_trip_id = route_tansfer.get("from_trip_id", _EMPTY_ATTRIBUTE).get("object")
+    to_trip_id = route_tansfer.get("to_trip_id", _EMPTY_ATTRIBUTE).get("object")
 
     from_stop_id_value = from_stop_id.split(":")[-1]
     to_stop_id_value = to_stop_id.split(":")[-1]
@@ -3558,7 +3596,7 @@ def netex_helper_stream_service_journey_interchange(xml_file, transfers: list[di
 
     with xml_file.element("journeyInterchanges"):
         for journey_pattern in valid_service_journey_interchanges:
-            xml_file.write(journey_pattern, pretty_print=True)    
+            xml_file.write(journey_pattern, pretty_print=PRETTY_PRINT_XML)    
             SERVICE_JOURNEY_INTERCHANGE_COUNTER += 1
 
 # -----------------------------------------------------
@@ -3638,8 +3676,8 @@ def netex_helper_build_service_journeys(route_structure: dict[str, Any]) -> list
             is_first = (order == 1)
             is_last = (order == len(sequence))
 
-            arrival_time = stop_time.get("arrivalTime", {}).get("value")
-            departure_time = stop_time.get("departureTime", {}).get("value")
+            arrival_time = stop_time.get("arrivalTime", _EMPTY_ATTRIBUTE).get("value")
+            departure_time = stop_time.get("departureTime", _EMPTY_ATTRIBUTE).get("value")
             
             arrival_offset = 0
             departure_offset = 0
@@ -3708,7 +3746,7 @@ def netex_helper_stream_service_journey(xml_file, route_structures: list[dict[st
     
     with xml_file.element("vehicleJourneys"):
         for service_journey in valid_service_journeys:
-            xml_file.write(service_journey, pretty_print=True)
+            xml_file.write(service_journey, pretty_print=PRETTY_PRINT_XML)
             SERVICE_JOURNEY_COUNTER += 1
         
 def netex_stream_service_frame_for_shared_data_xml(xml_file, 
@@ -3832,53 +3870,161 @@ def netex_create_line_xmls(authority_dataset: dict[str, Any]) -> None:
     logger.info("Streaming ServiceJourneys")
     logger.info("Streaming ServiceJourneyInterchanges")
 
+    global ROUTE_COUNTER, LINE_COUNTER, JOURNEY_PATTERN_COUNTER, SERVICE_JOURNEY_COUNTER, SERVICE_JOURNEY_INTERCHANGE_COUNTER
+
+    # Totals from earlier authorities, the workers reset the counters for every route they convert
+    totals = [ROUTE_COUNTER, LINE_COUNTER, JOURNEY_PATTERN_COUNTER, SERVICE_JOURNEY_COUNTER, SERVICE_JOURNEY_INTERCHANGE_COUNTER]
+
+    # Routes whose names sanitise to the same file name must not be written by two processes at once,
+    # so all routes of one output file form a group that is converted in order by a single worker;
+    # the last route of a group still ends up in the file, as with a serial run
+    route_groups: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
+
     for route in routes:
+        route_groups[netex_helper_line_xml_path(route, authority_dataset["translations"])].append(route)
 
-        route_id = route.get("id")
+    groups = list(route_groups.values())
 
-        if not route_id:
-            logger.error("Route missing ID: %r", route)
-            continue
+    max_workers = min(MAX_NETEX_PROCESSES, len(groups))
 
-        route_dataset = netex_build_route_dataset(route, authority_dataset)
-        
-        if not route_dataset:
-            logger.warning("No dataset found for route %s", route_id)
-            continue
+    # A single output file (or a single core) is not worth the cost of starting worker processes
+    if max_workers <= 1:
+        counts = [_netex_create_route_group_line_xmls(group, authority_dataset) for group in groups]
 
-        try:
-            netex_create_line_xml(route_dataset, authority_dataset)
+    else:
+        # Every Line XML file is built independently of the others, so the groups are fanned out to
+        # worker processes; the authority dataset is sent once per worker instead of once per group
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_netex_init_line_worker,
+            initargs=(authority_dataset, config.NETEX_AUTHORITY, config.NETEX_OUTPUT_DIR, now_time),
+        ) as executor:
+            counts = list(executor.map(_netex_create_route_group_line_xmls, groups, chunksize=max(1, len(groups) // (max_workers * 4))))
+
+    # The counters were incremented inside the workers, so their per-group totals are summed here
+    for group_counts in counts:
+        totals = [total + count for total, count in zip(totals, group_counts)]
+
+    ROUTE_COUNTER, LINE_COUNTER, JOURNEY_PATTERN_COUNTER, SERVICE_JOURNEY_COUNTER, SERVICE_JOURNEY_INTERCHANGE_COUNTER = totals
 
-        except Exception:
-            logger.exception("Failed to create Line XML for route %s", route_id)
-            
     logger.info("Finished streaming %d Routes", ROUTE_COUNTER)
     logger.info("Finished streaming %d Lines", LINE_COUNTER)
     logger.info("Finished streaming %d JourneyPatterns", JOURNEY_PATTERN_COUNTER)
     logger.info("Finished streaming %d ServiceJourneys", SERVICE_JOURNEY_COUNTER)
     logger.info("Finished streaming %d ServiceJourneyInterchanges", SERVICE_JOURNEY_INTERCHANGE_COUNTER)
 
-def netex_create_line_xml(route_dataset: dict[str, Any], authority_dataset) -> None:
+def _netex_init_line_worker(
+        authority_dataset: dict[str, Any],
+        netex_authority: str | None,
+        output_dir: Path,
+        started_at: datetime
+        ) -> None:
     """
-    Create a NeTEx Line XML file for a given route dataset.
+    Prepare a worker process for writing Line XML files.
+
+    The authority code, output directory and publication time are module state in the parent process,
+    so they are copied into the worker explicitly; this also keeps the worker correct with the "spawn" start method.
 
     Args:
-        route_dataset (dict[str, Any]): Dataset containing all the entities involved in the route
+        authority_dataset (dict[str, Any]): Dataset of the authority whose routes the worker converts
+        netex_authority (str | None): Value of config.NETEX_AUTHORITY in the parent process
+        output_dir (Path): Directory the Line XML files are written to
+        started_at (datetime): Time used for the validity conditions of every file
 
     Returns:
         None
     """
-    route_structures = netex_build_route_structures(route_dataset)
-    
-    if not route_structures:
-        logger.warning("Skipping Line XML for route %s: no route structures generated.",route_dataset["route"]["id"])
-        return
+    global _WORKER_AUTHORITY_DATASET, now_time
+
+    _WORKER_AUTHORITY_DATASET = authority_dataset
+    now_time = started_at
+
+    config.NETEX_AUTHORITY = netex_authority
+    config.NETEX_OUTPUT_DIR = output_dir
+
+def _netex_create_route_group_line_xmls(
+        routes: list[dict[str, Any]],
+        authority_dataset: dict[str, Any] | None = None
+        ) -> tuple[int, int, int, int, int]:
+    """
+    Create the Line XML files of a group of routes that share one output file, in order.
 
-    route_name = (route_dataset["route"].get("name", {}).get("value") or route_dataset["route"].get("shortName", {}).get("value"))
+    Args:
+        routes (list[dict[str, Any]]): NGSI-LD GtfsRoute entities written to the same file
+        authority_dataset (dict[str, Any] | None, optional):
+            Dataset of the authority; a worker process uses the one shipped by its initializer. Default: None.
+
+    Returns:
+        tuple[int, int, int, int, int]:
+            Number of Routes, Lines, JourneyPatterns, ServiceJourneys and ServiceJourneyInterchanges streamed for the group
+    """
+    if authority_dataset is None:
+        authority_dataset = _WORKER_AUTHORITY_DATASET
+
+    totals = (0, 0, 0, 0, 0)
+
+    for route in routes:
+        route_counts = _netex_create_route_line_xml(route, authority_dataset)
+        totals = tuple(total + count for total, count in zip(totals, route_counts))
+
+    return totals # type: ignore
+
+def _netex_create_route_line_xml(route: dict[str, Any], authority_dataset: dict[str, Any]) -> tuple[int, int, int, int, int]:
+    """
+    Create the Line XML file of one route.
+
+    Args:
+        route (dict[str, Any]): NGSI-LD GtfsRoute entity
+        authority_dataset (dict[str, Any]): Dataset of the authority the route belongs to
+
+    Returns:
+        tuple[int, int, int, int, int]:
+            Number of Routes, Lines, JourneyPatterns, ServiceJourneys and ServiceJourneyInterchanges streamed for the route
+    """
+    global ROUTE_COUNTER, LINE_COUNTER, JOURNEY_PATTERN_COUNTER, SERVICE_JOURNEY_COUNTER, SERVICE_JOURNEY_INTERCHANGE_COUNTER
+
+    # Counters are reset per route so the parent can sum them no matter which process did the work
+    ROUTE_COUNTER = LINE_COUNTER = JOURNEY_PATTERN_COUNTER = SERVICE_JOURNEY_COUNTER = SERVICE_JOURNEY_INTERCHANGE_COUNTER = 0
+
+    route_id = route.get("id")
+
+    if not route_id:
+        logger.error("Route missing ID: %r", route)
+        return 0, 0, 0, 0, 0
+
+    route_dataset = netex_build_route_dataset(route, authority_dataset)
+
+    if not route_dataset:
+        logger.warning("No dataset found for route %s", route_id)
+        return 0, 0, 0, 0, 0
+
+    try:
+        netex_create_line_xml(route_dataset, authority_dataset)
+
+    except Exception:
+        logger.exception("Failed to create Line XML for route %s", route_id)
+
+    return ROUTE_COUNTER, LINE_COUNTER, JOURNEY_PATTERN_COUNTER, SERVICE_JOURNEY_COUNTER, SERVICE_JOURNEY_INTERCHANGE_COUNTER
+
+def netex_helper_line_xml_path(route: dict[str, Any], translations: dict[str, Any]) -> str | None:
+    """
+    Build the path of the Line XML file of a route from its (translated) name.
+
+    Args:
+        route (dict[str, Any]): NGSI-LD GtfsRoute entity
+        translations (dict[str, Any]): Translation indexes of the authority
+
+    Returns:
+        str | None: Path of the Line XML file, or None if the route has no name
+    """
+    route_name = (route.get("name", _EMPTY_ATTRIBUTE).get("value") or route.get("shortName", _EMPTY_ATTRIBUTE).get("value"))
+
+    if not route_name:
+        return None
 
     route_name = quote(route_name.strip(), safe="")
     
-    translated_route_name = netex_resolve_translation(authority_dataset["translations"], "routes", "long_name", route_name)
+    translated_route_name = netex_resolve_translation(translations, "routes", "long_name", route_name)
             
     route_name_str = translated_route_name if translated_route_name is not None else route_name
     route_name_str = unquote(route_name_str)
@@ -3887,7 +4033,31 @@ def netex_create_line_xml(route_dataset: dict[str, Any], authority_dataset) -> N
     route_name_str = "_".join(route_name_str.split())
     route_name_str = re.sub(r"_+", "_", route_name_str)
 
-    with etree.xmlfile(f"{config.NETEX_OUTPUT_DIR}/{config.NETEX_AUTHORITY}_{route_name_str}.xml", encoding="utf-8") as xml_file:
+    return f"{config.NETEX_OUTPUT_DIR}/{config.NETEX_AUTHORITY}_{route_name_str}.xml"
+
+def netex_create_line_xml(route_dataset: dict[str, Any], authority_dataset) -> None:
+    """
+    Create a NeTEx Line XML file for a given route dataset.
+
+    Args:
+        route_dataset (dict[str, Any]): Dataset containing all the entities involved in the route
+
+    Returns:
+        None
+    """
+    route_structures = netex_build_route_structures(route_dataset)
+    
+    if not route_structures:
+        logger.warning("Skipping Line XML for route %s: no route structures generated.",route_dataset["route"]["id"])
+        return
+
+    line_xml_path = netex_helper_line_xml_path(route_dataset["route"], authority_dataset["translations"])
+
+    if line_xml_path is None:
+        logger.warning("Skipping Line XML for route %s: route has no name.", route_dataset["route"]["id"])
+        return
+
+    with etree.xmlfile(line_xml_path, encoding="utf-8") as xml_file:
         xml_file.write_declaration()
 
         with xml_file.element(f"PublicationDelivery", nsmap=NSMAP, version="1"):
@@ -3932,6 +4102,10 @@ def netex_create_stops_xml(agency, authority_dataset):
                 netex_stream_site_frame_for_stops_xml(xml_file, agency, authority_dataset)
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
     netex_helper_prepare_output_directory()
 
     config.set_operating_city("Sofia")
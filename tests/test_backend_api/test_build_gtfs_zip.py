@@ -0,0 +1,28 @@
+import config
+import zipfile
+from unittest.mock import patch
+
+from backend_api.main import build_gtfs_zip, GTFS_FILE_ENTITY_TYPES
+
+
+def test_build_gtfs_zip_writes_every_type_in_order(tmp_path, monkeypatch):
+    """
+    Check that every entity type is fetched once and written to its own file
+    in the archive order, even though the fetches run concurrently
+    """
+    monkeypatch.setattr(config, "OTP_DATA_DIR", tmp_path)
+
+    with (
+        patch("backend_api.main.fiware_scorpio_get_entities_by_type",
+              side_effect=lambda entity_type, header, city: [{"type": entity_type}]) as mock_get,
+        patch("backend_api.main.entities_to_csv_bytes",
+              side_effect=lambda entities: entities[0]["type"].encode()),
+    ):
+        zip_path = build_gtfs_zip()
+
+    assert mock_get.call_count == len(GTFS_FILE_ENTITY_TYPES)
+
+    with zipfile.ZipFile(zip_path) as archive:
+        assert archive.namelist() == list(GTFS_FILE_ENTITY_TYPES)
+        assert archive.read("stop_times.txt") == b"GtfsStopTime"
+        assert archive.read("transfers.txt") == b"GtfsTransferRule"
@@ -51,3 +51,23 @@ async def test_update_vehicle_positions_loop_exception_logged():
             await update_vehicle_positions_loop()
 
         mock_logger.exception.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_update_vehicle_positions_loop_builds_header_once():
+    """
+    Check that the Context Broker header is built once and reused by every update cycle
+    """
+    with (
+        patch("backend_api.main.gtfs_realtime_get_ngsi_ld_data", return_value=[]),
+        patch("backend_api.main.fiware_scorpio_define_header", return_value={"header": "x"}) as mock_header,
+        patch("backend_api.main.fiware_scorpio_batch_replace_entity_data") as mock_batch,
+        patch("backend_api.main.fiware_scorpio_get_entities_by_type", return_value=[]),
+        patch("backend_api.main.ngsi_ld_vehicle_positions_to_feed_message", return_value=MagicMock(entity=[])),
+        patch("backend_api.main.asyncio.sleep", side_effect=[None, None, asyncio.CancelledError]),
+        patch("backend_api.main.logger"),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await update_vehicle_positions_loop()
+
+        mock_header.assert_called_once_with("gtfs_realtime")
+        assert mock_batch.call_count == 3
@@ -0,0 +1,11 @@
+from unittest.mock import patch
+from fiware_scorpio.fiware_scorpio_crud_operations import close_session
+
+def test_close_session_closes_shared_session():
+    """
+    Check that the shared Context Broker session is closed
+    """
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.close") as mock_close:
+        close_session()
+
+    mock_close.assert_called_once()
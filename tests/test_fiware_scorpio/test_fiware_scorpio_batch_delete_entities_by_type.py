@@ -1,4 +1,6 @@
 import pytest
+import threading
+import orjson
 import requests
 from unittest.mock import patch, MagicMock
 from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_batch_delete_entities_by_type
@@ -11,9 +13,8 @@ def test_batch_delete_entities_success():
         {"id": "urn:ngsi-ld:Test:2"},
     ]
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_count_of_entities_by_type", side_effect=[2, 0]), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entities_by_type", return_value=entities), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post") as mock_post:
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type", side_effect=[iter([[entity["id"] for entity in entities]]), iter([])]), \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post") as mock_post:
 
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
@@ -27,9 +28,8 @@ def test_batch_delete_entities_http_error():
     
     entities = [{"id": "urn:ngsi-ld:Test:1"}]
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_count_of_entities_by_type", return_value=1), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entities_by_type", return_value=entities), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", side_effect=requests.exceptions.HTTPError("Delete failed")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type", side_effect=[iter([[entity["id"] for entity in entities]]), iter([])]), \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=requests.exceptions.HTTPError("Delete failed")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_batch_delete_entities_by_type("Test", headers)
 
@@ -39,10 +39,61 @@ def test_batch_delete_entities_timeout():
     
     entities = [{"id": "urn:ngsi-ld:Test:1"}]
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_count_of_entities_by_type", return_value=1), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entities_by_type", return_value=entities), \
-        patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type", side_effect=[iter([[entity["id"] for entity in entities]]), iter([])]), \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=requests.exceptions.Timeout("timeout")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_batch_delete_entities_by_type("Test", headers)
 
         assert "timeout" in str(err.value)
+
+def test_batch_delete_entities_sends_one_batch_per_id_page():
+    id_pages = [
+        [f"urn:ngsi-ld:Test:{i}" for i in range(0, 1000)],
+        [f"urn:ngsi-ld:Test:{i}" for i in range(1000, 2000)],
+        [f"urn:ngsi-ld:Test:{i}" for i in range(2000, 2500)],
+    ]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type", side_effect=[iter(id_pages), iter([])]), \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post") as mock_post:
+
+        fiware_scorpio_batch_delete_entities_by_type("Test", headers)
+
+    assert mock_post.call_count == 3
+    assert sorted(len(orjson.loads(call.kwargs["data"])) for call in mock_post.call_args_list) == [500, 1000, 1000]
+
+def test_batch_delete_entities_polls_until_listing_is_empty():
+    first_round = [[f"urn:ngsi-ld:Test:{i}"] for i in range(4)]
+    second_round = [["urn:ngsi-ld:Test:4"]]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type",
+               side_effect=[iter(first_round + second_round), iter(second_round), iter([])]) as mock_ids, \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post") as mock_post:
+
+        fiware_scorpio_batch_delete_entities_by_type("Test", headers)
+
+    # 4 batches in the first round (MAX_CONCURRENT_REQUESTS), the remaining one in the second
+    assert mock_post.call_count == 5
+    assert mock_ids.call_count == 3
+
+def test_batch_delete_entities_starts_delete_before_next_page_is_read():
+    first_deleted = threading.Event()
+    overlapped = []
+
+    def id_pages():
+        yield ["urn:ngsi-ld:Test:0"]
+
+        # The first page's delete must already be running while the second page is read
+        overlapped.append(first_deleted.wait(timeout=5))
+        yield ["urn:ngsi-ld:Test:1"]
+
+    def fake_delete(entity_ids, header):
+        if entity_ids == ["urn:ngsi-ld:Test:0"]:
+            first_deleted.set()
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_get_entity_ids_by_type", side_effect=[id_pages(), iter([])]), \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_post_batch_delete_request", side_effect=fake_delete) as mock_delete:
+
+        fiware_scorpio_batch_delete_entities_by_type("Test", headers)
+
+    assert mock_delete.call_count == 2
+    assert overlapped == [True]
@@ -1,3 +1,6 @@
+import threading
+import pytest
+import requests
 from unittest.mock import patch
 from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_batch_load_to_context_broker
 
@@ -27,4 +30,56 @@ def test_batch_load_sends_multiple_batches():
         fiware_scorpio_batch_load_to_context_broker(iter(batches), headers, delay=0.01)
 
         # Expect 3 calls (5 entities, batch size 2)
-        assert mock_post.call_count == 3
\ No newline at end of file
+        assert mock_post.call_count == 3
+
+def test_batch_load_limits_batches_in_flight():
+    """
+    Check that no more than max_workers batch requests run at the same time
+    """
+    batches = [[{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"}] for i in range(10)]
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def slow_post(batch, header):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        threading.Event().wait(0.01)
+        with lock:
+            state["running"] -= 1
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_post_batch_request", side_effect=slow_post) as mock_post:
+
+        fiware_scorpio_batch_load_to_context_broker(iter(batches), {}, delay=0, max_workers=2)
+
+    assert mock_post.call_count == 10
+    assert state["peak"] <= 2
+
+
+def test_batch_load_propagates_batch_failure():
+    """
+    Check that a batch failing after all retries is raised to the caller
+    """
+    batches = [[{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_post_batch_request",
+               side_effect=requests.exceptions.HTTPError("Batch failed (400)")), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep"):
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            fiware_scorpio_batch_load_to_context_broker(iter(batches), {})
+
+
+def test_batch_load_does_not_sleep_by_default():
+    """
+    Check that batches are not paced with a fixed sleep unless a delay is requested
+    """
+    batches = [[{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"}] for i in range(3)]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.fiware_scorpio_post_batch_request"), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+
+        fiware_scorpio_batch_load_to_context_broker(iter(batches), {})
+
+    mock_sleep.assert_not_called()
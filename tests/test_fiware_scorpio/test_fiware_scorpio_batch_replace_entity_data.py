@@ -1,3 +1,5 @@
+import logging
+import orjson
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
@@ -22,19 +24,19 @@ def test_batch_replace_success_201():
     mock_response = MagicMock()
     mock_response.status_code = 201
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
         fiware_scorpio_batch_replace_entity_data(sample_entities, headers)
 
 def test_batch_replace_partial_success_207():
     mock_response = MagicMock()
     mock_response.status_code = 207
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
         fiware_scorpio_batch_replace_entity_data(sample_entities, headers)
 
 def test_batch_replace_http_error_status():
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", side_effect=requests.exceptions.HTTPError("Bad Request")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=requests.exceptions.HTTPError("Bad Request")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_batch_replace_entity_data(sample_entities, headers)
 
@@ -42,8 +44,48 @@ def test_batch_replace_http_error_status():
 
 def test_batch_replace_request_exception_timeout():
     
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=requests.exceptions.Timeout("timeout")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_batch_replace_entity_data(sample_entities, headers)
 
     assert "timeout" in str(err.value)
+
+def test_batch_replace_logs_entity_count(caplog):
+    mock_response = MagicMock()
+    mock_response.status_code = 204
+
+    caplog.set_level(logging.INFO, logger="Orion-LD")
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
+        fiware_scorpio_batch_replace_entity_data(sample_entities, headers)
+
+    assert "Replaced entity data for 2 entities (status=204)" in caplog.text
+    assert "urn:ngsi-ld:Test:1" not in caplog.text
+
+def test_batch_replace_splits_large_lists_into_batches():
+    entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(5)]
+
+    mock_response = MagicMock()
+    mock_response.status_code = 204
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        fiware_scorpio_batch_replace_entity_data(entities, headers, batch_size=2)
+
+    sent = sorted(len(orjson.loads(call.kwargs["data"])) for call in mock_post.call_args_list)
+    assert sent == [1, 2, 2]
+
+def test_batch_replace_failed_batch_is_raised():
+    entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(4)]
+
+    ok = MagicMock()
+    ok.status_code = 204
+
+    failed = MagicMock()
+    failed.status_code = 400
+    failed.text = "Bad Request"
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[ok, failed]):
+        with pytest.raises(requests.exceptions.RequestException) as err:
+            fiware_scorpio_batch_replace_entity_data(entities, headers, batch_size=2, max_workers=1)
+
+    assert "Bad Request" in str(err.value)
@@ -0,0 +1,46 @@
+import pytest
+from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_define_header, SESSION
+
+@pytest.mark.parametrize("keyword, context", [
+    ("gtfs_static", "gtfs_static/gtfs_static_context.jsonld"),
+    ("gtfs_realtime", "gtfs_realtime/gtfs_realtime_context.jsonld"),
+    ("pois", "dataModel.PointOfInterest/master/context.jsonld"),
+    ("unknown", "ngsi-ld-core-context.jsonld"),
+])
+def test_define_header_selects_context(keyword, context):
+    """
+    Check that the Link header points to the context of the given keyword
+    """
+    header = fiware_scorpio_define_header(keyword)
+
+    assert context in header["Link"]
+    assert "Content-Type" not in header
+
+def test_define_header_accepts_plain_json():
+    """
+    Check that plain JSON responses are requested, so entities are returned without @context.
+    The base headers live on the shared session and are not repeated per request
+    """
+    header = fiware_scorpio_define_header("gtfs_static")
+
+    assert "Accept" not in header
+    assert SESSION.headers["Accept"] == "application/json"
+    assert SESSION.headers["Content-Type"] == "application/json"
+
+def test_define_header_applies_extra_headers():
+    """
+    Check that extra headers are added and can override the defaults
+    """
+    header = fiware_scorpio_define_header("gtfs_static", extra={"Prefer": "return=minimal", "Accept": "application/ld+json"})
+
+    assert header["Prefer"] == "return=minimal"
+    assert header["Accept"] == "application/ld+json"
+
+def test_define_header_returns_a_fresh_dict():
+    """
+    Check that changing a returned header does not leak into later calls
+    """
+    header = fiware_scorpio_define_header("pois")
+    header["Link"] = "changed"
+
+    assert fiware_scorpio_define_header("pois")["Link"] != "changed"
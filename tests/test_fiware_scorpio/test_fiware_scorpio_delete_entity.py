@@ -11,12 +11,12 @@ def test_delete_entity_success():
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.delete", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.delete", return_value=mock_response):
         fiware_scorpio_delete_entity(entity_id, headers)
 
 def test_delete_entity_http_error():
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.delete", side_effect=requests.exceptions.HTTPError("Not Found")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.delete", side_effect=requests.exceptions.HTTPError("Not Found")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_delete_entity(entity_id, headers)
 
@@ -24,7 +24,7 @@ def test_delete_entity_http_error():
 
 def test_delete_entity_timeout():
     
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.delete", side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.delete", side_effect=requests.exceptions.Timeout("timeout")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_delete_entity(entity_id, headers)
 
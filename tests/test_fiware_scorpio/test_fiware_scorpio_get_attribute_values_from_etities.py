@@ -1,3 +1,5 @@
+import config
+import orjson
 from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_get_attribute_values_from_etities
 from unittest.mock import patch, MagicMock
 import requests
@@ -29,16 +31,16 @@ def test_get_attribute_values_success():
 
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = sample_response
+    mock_response.content = orjson.dumps(sample_response)
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get",return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",return_value=mock_response):
         result = fiware_scorpio_get_attribute_values_from_etities(entity_ids, attributes, headers)
 
     assert result == sample_response
 
 def test_get_attribute_values_http_error():
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect=requests.exceptions.HTTPError("Bad Request")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.HTTPError("Bad Request")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_get_attribute_values_from_etities(["urn:ngsi-ld:Test:1"], ["name"], headers)
 
@@ -46,8 +48,92 @@ def test_get_attribute_values_http_error():
 
 def test_get_attribute_values_timeout():
     
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.Timeout("timeout")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_get_attribute_values_from_etities(["urn:ngsi-ld:Test:1"], ["name"], headers)
 
     assert "timeout" in str(err.value)
+
+def test_get_attribute_values_sends_ids_as_query_params():
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response) as mock_get:
+        fiware_scorpio_get_attribute_values_from_etities(["urn:ngsi-ld:Test:1", "urn:ngsi-ld:Test:2"], ["name", "speed"], headers)
+
+    assert mock_get.call_args.args[0] == config.OrionLDEndpoint.ENTITIES_ENDPOINT.value
+    assert mock_get.call_args.kwargs["params"] == {
+        "id": "urn:ngsi-ld:Test:1,urn:ngsi-ld:Test:2",
+        "attrs": "name,speed",
+        "limit": 2,
+    }
+
+def test_get_attribute_values_uses_batch_query_for_long_id_lists():
+    entity_ids = [f"urn:ngsi-ld:Test:{i}" for i in range(51)]
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get") as mock_get, \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        fiware_scorpio_get_attribute_values_from_etities(entity_ids, ["name"], headers)
+
+    mock_get.assert_not_called()
+    assert mock_post.call_args.args[0] == config.OrionLDEndpoint.BATCH_QUERY_ENDPOINT.value
+    assert mock_post.call_args.kwargs["params"] == {"limit": 51}
+    assert orjson.loads(mock_post.call_args.kwargs["data"]) == {
+        "type": "Query",
+        "entities": [{"id": entity_id, "type": "Test"} for entity_id in entity_ids],
+        "attrs": ["name"],
+    }
+
+def test_get_attribute_values_batch_query_uses_explicit_entity_type():
+    entity_ids = [f"urn:ngsi-ld:Test:{i}" for i in range(51)]
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        fiware_scorpio_get_attribute_values_from_etities(entity_ids, ["name"], headers, entity_type="GtfsStop")
+
+    selectors = orjson.loads(mock_post.call_args.kwargs["data"])["entities"]
+
+    assert selectors == [{"id": entity_id, "type": "GtfsStop"} for entity_id in entity_ids]
+
+def test_get_attribute_values_batch_query_rejects_ids_without_type():
+    entity_ids = [f"urn:ngsi-ld:Test:{i}" for i in range(50)] + ["not-a-urn"]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post") as mock_post:
+        with pytest.raises(ValueError, match="not-a-urn"):
+            fiware_scorpio_get_attribute_values_from_etities(entity_ids, ["name"], headers)
+
+    mock_post.assert_not_called()
+
+def test_get_attribute_values_splits_id_lists_larger_than_a_page():
+    entity_ids = [f"urn:ngsi-ld:Test:{i}" for i in range(2500)]
+
+    def fake_post(url, headers, params, data):
+        ids = [entity["id"] for entity in orjson.loads(data)["entities"]]
+        response = MagicMock()
+        response.content = orjson.dumps([{"id": entity_id} for entity_id in ids])
+        return response
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=fake_post) as mock_post:
+        result = fiware_scorpio_get_attribute_values_from_etities(entity_ids, ["name"], headers)
+
+    assert mock_post.call_count == 3
+    assert sorted(call.kwargs["params"]["limit"] for call in mock_post.call_args_list) == [500, 1000, 1000]
+    assert [entity["id"] for entity in result] == entity_ids
+
+@pytest.mark.parametrize("entity_ids, attribute_list", [
+    ([], ["name"]),
+    (["urn:ngsi-ld:Test:1"], []),
+])
+def test_get_attribute_values_sends_no_request_for_empty_lists(entity_ids, attribute_list):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get") as mock_get, \
+        patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post") as mock_post:
+        result = fiware_scorpio_get_attribute_values_from_etities(entity_ids, attribute_list, headers)
+
+    assert result == []
+    mock_get.assert_not_called()
+    mock_post.assert_not_called()
@@ -11,7 +11,7 @@ def test_get_count_of_entities_success():
     mock_response.raise_for_status.return_value = None
     mock_response.headers = {"NGSILD-Results-Count": "42"}
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
         result = fiware_scorpio_get_count_of_entities_by_type("Test", headers)
 
     assert result == 42
@@ -23,7 +23,7 @@ def test_get_count_of_entities_missing_header():
     mock_response.raise_for_status.return_value = None
     mock_response.headers = {}
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
         result = fiware_scorpio_get_count_of_entities_by_type("Test", headers)
 
     assert result == 0
@@ -34,7 +34,7 @@ def test_get_count_of_entities_http_error():
     mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
         result = fiware_scorpio_get_count_of_entities_by_type("Test", headers)
 
     assert result == 0
@@ -42,7 +42,21 @@ def test_get_count_of_entities_http_error():
 def test_get_count_of_entities_request_exception():
     headers = {"Content-Type": "application/ld+json"}
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.Timeout("timeout")):
         result = fiware_scorpio_get_count_of_entities_by_type("Test", headers)
 
     assert result == 0
+
+def test_get_count_of_entities_requests_no_entities():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.headers = {"NGSILD-Results-Count": "7"}
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response) as mock_get:
+        fiware_scorpio_get_count_of_entities_by_type("Test", headers)
+
+    params = mock_get.call_args.kwargs["params"]
+
+    assert params["count"] == "true"
+    assert params["limit"] == 0
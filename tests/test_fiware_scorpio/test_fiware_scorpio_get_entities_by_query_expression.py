@@ -1,3 +1,4 @@
+import orjson
 import pytest
 from unittest.mock import patch, MagicMock
 import requests
@@ -11,23 +12,24 @@ def test_get_entities_by_query_single_page():
 
     mock_response_1 = MagicMock()
     mock_response_1.status_code = 200
-    mock_response_1.json.return_value = sample_entities
+    mock_response_1.content = orjson.dumps(sample_entities)
     mock_response_1.encoding = "utf-8"
 
     mock_response_2 = MagicMock()
     mock_response_2.status_code = 200
-    mock_response_2.json.return_value = []
+    mock_response_2.content = orjson.dumps([])
     mock_response_2.encoding = "utf-8"
 
     with patch(
-        "fiware_scorpio.fiware_scorpio_crud_operations.requests.get",
+        "fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
         side_effect=[mock_response_1, mock_response_2]
     ) as mock_get:
         result = fiware_scorpio_get_entities_by_query_expression("Test", headers, query)
 
     assert result == sample_entities
 
-    assert mock_get.call_count == 2
+    # The single page is shorter than the limit, so no further page is requested
+    assert mock_get.call_count == 1
 
     called_q = mock_get.call_args_list[0][1]["params"]["q"]
     assert "\\u0421\\u043e\\u0444\\u0438\\u044f" in called_q
@@ -37,8 +39,107 @@ def test_get_entities_by_query_http_error():
     
     headers = {"Content-Type": "application/ld+json"}
     
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect = requests.exceptions.HTTPError("404 Not Found")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect = requests.exceptions.HTTPError("404 Not Found")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="Test"')
 
-    assert "404 Not Found" in str(err.value)
\ No newline at end of file
+    assert "404 Not Found" in str(err.value)
+
+def test_get_entities_by_query_ids_only_requests_key_values():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response_1 = MagicMock()
+    mock_response_1.content = orjson.dumps([{"id": "urn:ngsi-ld:Test:1", "type": "Test", "name": "A"}])
+
+    mock_response_2 = MagicMock()
+    mock_response_2.content = orjson.dumps([])
+
+    with patch(
+        "fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
+        side_effect=[mock_response_1, mock_response_2]
+    ) as mock_get:
+        result = fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="A"', ids_only=True)
+
+    assert result == ["urn:ngsi-ld:Test:1"]
+    assert mock_get.call_args_list[0][1]["params"]["options"] == "keyValues"
+
+
+def test_get_entities_by_query_normalized_by_default():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response) as mock_get:
+        fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="A"')
+
+    assert "options" not in mock_get.call_args_list[0][1]["params"]
+
+
+def test_get_entities_by_query_fetches_remaining_pages_by_count():
+    headers = {"Content-Type": "application/ld+json"}
+
+    pages = {
+        0: [{"id": "urn:ngsi-ld:Test:1"}, {"id": "urn:ngsi-ld:Test:2"}],
+        2: [{"id": "urn:ngsi-ld:Test:3"}, {"id": "urn:ngsi-ld:Test:4"}],
+        4: [{"id": "urn:ngsi-ld:Test:5"}],
+    }
+
+    def fake_get(url, headers, params):
+        response = MagicMock()
+        response.content = orjson.dumps(pages[params["offset"]])
+        response.headers = {"NGSILD-Results-Count": "5"}
+        return response
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 2), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=fake_get) as mock_get:
+        result = fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="A"')
+
+    assert result == pages[0] + pages[2] + pages[4]
+    assert mock_get.call_count == 3
+    assert mock_get.call_args_list[0][1]["params"]["count"] == "true"
+    assert sorted(call[1]["params"]["offset"] for call in mock_get.call_args_list) == [0, 2, 4]
+
+
+def test_get_entities_by_query_without_count_reads_pages_in_order():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response_1 = MagicMock()
+    mock_response_1.content = orjson.dumps([{"id": "1"}])
+    mock_response_1.headers = {}
+
+    mock_response_2 = MagicMock()
+    mock_response_2.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
+               side_effect=[mock_response_1, mock_response_2]) as mock_get:
+        result = fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="A"')
+
+    assert result == [{"id": "1"}]
+    assert mock_get.call_args_list[1][1]["params"]["offset"] == 1
+
+
+def test_get_entities_by_query_rejects_runaway_count():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([{"id": "1"}])
+    mock_response.headers = {"NGSILD-Results-Count": "1000"}
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
+        with pytest.raises(RuntimeError):
+            fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="A"')
+
+
+def test_get_entities_by_query_escapes_non_bmp_characters_as_surrogate_pairs():
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps([])
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response) as mock_get:
+        fiware_scorpio_get_entities_by_query_expression("Test", headers, 'name=="Ж \U0001F68C"')
+
+    assert mock_get.call_args_list[0][1]["params"]["q"] == 'name=="\\u0416 \\ud83d\\ude8c"'
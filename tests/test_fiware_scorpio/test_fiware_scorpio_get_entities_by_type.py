@@ -1,3 +1,4 @@
+import orjson
 import pytest
 import requests
 from unittest.mock import patch, Mock
@@ -5,7 +6,7 @@ from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_get_ent
 
 def test_get_entities_by_type_multiple_pages():
     """
-    Check for multiple pagination
+    Check for multiple pagination when the broker does not report the entity count
     """
     headers = {"Content-Type": "application/ld+json"}
 
@@ -15,21 +16,24 @@ def test_get_entities_by_type_multiple_pages():
     # Multiple pagination calls
     mock_response_1 = Mock()
     mock_response_1.status_code = 200
-    mock_response_1.json.return_value = first_page
+    mock_response_1.content = orjson.dumps(first_page)
     mock_response_1.encoding = "utf-8"
+    mock_response_1.headers = {}
 
     mock_response_2 = Mock()
     mock_response_2.status_code = 200
-    mock_response_2.json.return_value = second_page
+    mock_response_2.content = orjson.dumps(second_page)
     mock_response_2.encoding = "utf-8"
 
     # Final call returns empty list
     mock_response_3 = Mock()
     mock_response_3.status_code = 200
-    mock_response_3.json.return_value = []
+    mock_response_3.content = orjson.dumps([])
     mock_response_3.encoding = "utf-8"
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get",
+    # Every page is full, so the next one is requested until an empty page arrives
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
                side_effect=[mock_response_1, mock_response_2, mock_response_3]) as mock_get:
         result = fiware_scorpio_get_entities_by_type("Test", headers)
 
@@ -43,8 +47,55 @@ def test_get_entities_by_type_http_error():
     """
     headers = {"Content-Type": "application/ld+json"}
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect=requests.exceptions.HTTPError("404 Not Found")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.HTTPError("404 Not Found")):
         with pytest.raises( requests.exceptions.RequestException) as err:
             fiware_scorpio_get_entities_by_type("GtfsRoute", headers)
             
     assert "404 Not Found" in str(err.value)
+
+def test_get_entities_by_type_stops_after_short_page():
+    """
+    Check that a page shorter than the limit ends the pagination without another request
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    page = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(page)
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response) as mock_get:
+        result = fiware_scorpio_get_entities_by_type("Test", headers)
+
+    assert result == page
+    assert mock_get.call_count == 1
+
+def test_get_entities_by_type_fetches_remaining_pages_concurrently_from_count():
+    """
+    Check that the count of the first page determines the remaining offsets
+    and the pages are returned in offset order
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    pages = {
+        0: [{"id": "urn:ngsi-ld:Test:1"}, {"id": "urn:ngsi-ld:Test:2"}],
+        2: [{"id": "urn:ngsi-ld:Test:3"}, {"id": "urn:ngsi-ld:Test:4"}],
+        4: [{"id": "urn:ngsi-ld:Test:5"}],
+    }
+
+    def fake_get(url, headers, params):
+        response = Mock()
+        response.status_code = 200
+        response.content = orjson.dumps(pages[params["offset"]])
+        response.headers = {"NGSILD-Results-Count": "5"}
+        return response
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 2), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=fake_get) as mock_get:
+        result = fiware_scorpio_get_entities_by_type("Test", headers)
+
+    assert result == pages[0] + pages[2] + pages[4]
+    assert mock_get.call_count == 3
+    assert mock_get.call_args_list[0].kwargs["params"]["count"] == "true"
+    assert sorted(call.kwargs["params"]["offset"] for call in mock_get.call_args_list) == [0, 2, 4]
@@ -1,3 +1,4 @@
+import orjson
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
@@ -13,7 +14,7 @@ def test_get_entity_success_with_unicode():
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.encoding = "utf-8"
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "id": "urn:ngsi-ld:Test:1",
         "type": "Test",
         "name": {
@@ -24,9 +25,9 @@ def test_get_entity_success_with_unicode():
             "type": "Relationship",
             "object": "urn:ngsi-ld:Line:94"
         }
-    }
+    })
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
         result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1",headers)
 
     assert result["name"]["value"] == "Линия 94"
@@ -39,7 +40,7 @@ def test_get_entity_http_error():
     """
     headers = {"Content-Type": "application/ld+json"}
     
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", side_effect=requests.exceptions.HTTPError("404 Not Found")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.HTTPError("404 Not Found")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             fiware_scorpio_get_entity_by_id("urn:ngsi-ld:NonExisting:1",headers)
 
@@ -55,16 +56,127 @@ def test_get_entity_without_unicode():
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.encoding = "utf-8"
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "id": "urn:ngsi-ld:Test:1",
         "type": "Test",
         "count": {
             "type": "Property",
             "value": 1
         }
-    }
+    })
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.get", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
         result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Simple:1", headers)
 
     assert result["count"]["value"] == 1
+
+
+def test_get_entity_keeps_utf8_values():
+    """
+    Test that values already returned as UTF-8 are not decoded a second time.
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = orjson.dumps({
+        "id": "urn:ngsi-ld:Test:1",
+        "type": "Test",
+        "name": {
+            "type": "Property",
+            "value": "Линия 94"
+        }
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
+        result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1", headers)
+
+    assert result["name"]["value"] == "Линия 94"
+
+def test_get_entity_decodes_nested_values():
+    """
+    Test that escaped Unicode is decoded in sub-attributes and list elements too.
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({
+        "id": "urn:ngsi-ld:Test:1",
+        "type": "Test",
+        "name": {
+            "type": "Property",
+            "value": "Line",
+            "translation": {
+                "type": "Property",
+                "value": "\\u041b\\u0438\\u043d\\u0438\\u044f"
+            }
+        },
+        "stops": [
+            {"type": "Property", "value": "\\u0421\\u043e\\u0444\\u0438\\u044f"}
+        ]
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
+        result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1", headers)
+
+    assert result["name"]["value"] == "Line"
+    assert result["name"]["translation"]["value"] == "Линия"
+    assert result["stops"][0]["value"] == "София"
+
+def test_get_entity_decodes_escapes_mixed_with_non_ascii_text():
+    """
+    Test that escapes next to real UTF-8 text and emoji surrogate pairs are decoded
+    without corrupting the rest of the string, and that other backslashes are kept.
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({
+        "id": "urn:ngsi-ld:Test:1",
+        "type": "Test",
+        "name": {"type": "Property", "value": "Ж\\u0416 é \\ud83d\\ude8c"},
+        "path": {"type": "Property", "value": "C:\\x\\data"}
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
+        result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1", headers)
+
+    assert result["name"]["value"] == "ЖЖ é \U0001F68C"
+    assert result["path"]["value"] == "C:\\x\\data"
+
+def test_get_entity_skips_decoding_without_escaped_backslash():
+    """
+    Test that the value walk is skipped when the body has no escaped backslash.
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({"id": "urn:ngsi-ld:Test:1", "type": "Test",
+                                          "name": {"type": "Property", "value": "Линия"}})
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations._decode_escaped_values") as mock_decode:
+        result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1", headers)
+
+    mock_decode.assert_not_called()
+    assert result["name"]["value"] == "Линия"
+
+def test_get_entity_decodes_values_that_are_not_valid_json_strings():
+    """
+    Test that values with a bare quote or an unknown escape still get their \\uXXXX sequences decoded.
+    """
+    headers = {"Content-Type": "application/ld+json"}
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps({
+        "id": "urn:ngsi-ld:Test:1",
+        "type": "Test",
+        "name": {"type": "Property", "value": "\"\\u0416\""},
+        "path": {"type": "Property", "value": "C:\\x\\u0416"}
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=mock_response):
+        result = fiware_scorpio_get_entity_by_id("urn:ngsi-ld:Test:1", headers)
+
+    assert result["name"]["value"] == "\"Ж\""
+    assert result["path"]["value"] == "C:\\xЖ"
@@ -0,0 +1,27 @@
+import orjson
+from unittest.mock import patch, Mock
+from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_get_entity_ids_by_type
+
+headers = {"Content-Type": "application/ld+json"}
+
+def make_response(data):
+    response = Mock()
+    response.status_code = 200
+    response.content = orjson.dumps(data)
+    return response
+
+def test_get_entity_ids_by_type_yields_id_pages():
+    """
+    Check that only the entity IDs of every page are yielded
+    and the keyValues representation is requested
+    """
+    first_page = [{"id": "urn:ngsi-ld:Test:1", "type": "Test", "name": "A"}]
+    second_page = [{"id": "urn:ngsi-ld:Test:2", "type": "Test", "name": "B"}]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
+               side_effect=[make_response(first_page), make_response(second_page), make_response([])]) as mock_get:
+        pages = list(fiware_scorpio_get_entity_ids_by_type("Test", headers))
+
+    assert pages == [["urn:ngsi-ld:Test:1"], ["urn:ngsi-ld:Test:2"]]
+    assert all(call.kwargs["params"]["options"] == "keyValues" for call in mock_get.call_args_list)
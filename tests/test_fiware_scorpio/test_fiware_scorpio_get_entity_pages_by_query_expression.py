@@ -0,0 +1,59 @@
+import orjson
+import pytest
+import requests
+from unittest.mock import patch, Mock
+from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_get_entity_pages_by_query_expression
+
+headers = {"Content-Type": "application/ld+json"}
+
+def make_response(data):
+    response = Mock()
+    response.status_code = 200
+    response.content = orjson.dumps(data)
+    return response
+
+def test_get_entity_pages_by_query_yields_each_page():
+    """
+    Check that every full page is yielded separately and the offset advances
+    """
+    first_page = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+    second_page = [{"id": "urn:ngsi-ld:Test:2", "type": "Test"}]
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get",
+               side_effect=[make_response(first_page), make_response(second_page), make_response([])]) as mock_get:
+        pages = list(fiware_scorpio_get_entity_pages_by_query_expression("Test", headers, 'name=="A"'))
+
+    assert pages == [first_page, second_page]
+    assert [call.kwargs["params"]["offset"] for call in mock_get.call_args_list] == [0, 1, 2]
+    assert mock_get.call_args.kwargs["params"]["q"] == 'name=="A"'
+
+def test_get_entity_pages_by_query_is_lazy():
+    """
+    Check that no request is sent before the generator is consumed
+    """
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get") as mock_get:
+        pages = fiware_scorpio_get_entity_pages_by_query_expression("Test", headers, 'name=="A"')
+
+        mock_get.assert_not_called()
+
+        pages.close()
+
+def test_get_entity_pages_by_query_stops_after_max_iterations():
+    """
+    Check that the safety limit on the number of pages is enforced
+    """
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.PAGE_LIMIT", 1), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", return_value=make_response([{"id": "1"}])):
+        with pytest.raises(RuntimeError):
+            list(fiware_scorpio_get_entity_pages_by_query_expression("Test", headers, 'name=="A"'))
+
+def test_get_entity_pages_by_query_http_error():
+    """
+    Check that HTTP exceptions are wrapped into RequestException
+    """
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.get", side_effect=requests.exceptions.HTTPError("500 Server Error")):
+        with pytest.raises(requests.exceptions.RequestException) as err:
+            list(fiware_scorpio_get_entity_pages_by_query_expression("Test", headers, 'name=="A"'))
+
+    assert "500 Server Error" in str(err.value)
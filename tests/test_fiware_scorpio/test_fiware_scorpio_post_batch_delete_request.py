@@ -0,0 +1,58 @@
+import pytest
+import orjson
+import requests
+from unittest.mock import patch, MagicMock
+
+import config
+from fiware_scorpio.fiware_scorpio_crud_operations import fiware_scorpio_post_batch_delete_request
+
+headers = {"Content-Type": "application/ld+json"}
+entity_ids = ["urn:ngsi-ld:Test:1", "urn:ngsi-ld:Test:2"]
+
+def test_post_batch_delete_request_success():
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        fiware_scorpio_post_batch_delete_request(entity_ids, headers)
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == config.OrionLDEndpoint.BATCH_DELETE_ENDPOINT.value
+    assert orjson.loads(mock_post.call_args.kwargs["data"]) == entity_ids
+
+def test_post_batch_delete_request_http_error():
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=requests.exceptions.HTTPError("Bad Request")):
+        with pytest.raises(requests.exceptions.RequestException) as err:
+            fiware_scorpio_post_batch_delete_request(entity_ids, headers)
+
+    assert "Bad Request" in str(err.value)
+
+def test_post_batch_delete_request_multi_status_ignores_not_found():
+    mock_response = MagicMock()
+    mock_response.status_code = 207
+    mock_response.content = orjson.dumps({
+        "success": ["urn:ngsi-ld:Test:1"],
+        "errors": [
+            {"entityId": "urn:ngsi-ld:Test:2", "error": {"title": "Entity Not Found"}}
+        ]
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
+        fiware_scorpio_post_batch_delete_request(entity_ids, headers)
+
+def test_post_batch_delete_request_multi_status_raises_failed_subset():
+    mock_response = MagicMock()
+    mock_response.status_code = 207
+    mock_response.content = orjson.dumps({
+        "success": ["urn:ngsi-ld:Test:1"],
+        "errors": [
+            {"entityId": "urn:ngsi-ld:Test:2", "error": {"title": "Internal Error"}}
+        ]
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
+        with pytest.raises(requests.exceptions.RequestException) as err:
+            fiware_scorpio_post_batch_delete_request(entity_ids, headers)
+
+    assert "urn:ngsi-ld:Test:2" in str(err.value)
@@ -1,4 +1,5 @@
 import logging
+import orjson
 import requests
 import pytest
 from unittest.mock import patch, MagicMock
@@ -20,7 +21,7 @@ def test_batch_create_success_logs_info(caplog):
 
     caplog.set_level(logging.INFO)
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
         fiware_scorpio_post_batch_request(sample_entities, headers)
 
     assert "Batch OK (2 entities)" in caplog.text
@@ -40,7 +41,7 @@ def test_batch_create_http_error_logs_error():
     mock_response.status_code = 400
     mock_response.text = "Bad Request"
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post", return_value=mock_response):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
         with pytest.raises(requests.exceptions.HTTPError) as err:
             fiware_scorpio_post_batch_request(sample_entities, headers)
 
@@ -58,8 +59,238 @@ def test_batch_create_request_exception_logs_exception():
     ]
     headers = {"Content-Type": "application/ld+json"}
 
-    with patch("fiware_scorpio.fiware_scorpio_crud_operations.requests.post",side_effect=requests.exceptions.Timeout("timeout")):
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post",side_effect=requests.exceptions.Timeout("timeout")), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep"):
         with pytest.raises(requests.exceptions.RequestException) as exc_info:
             fiware_scorpio_post_batch_request(sample_entities, headers)
 
-    assert "timeout" in str(exc_info.value)
\ No newline at end of file
+    assert "timeout" in str(exc_info.value)
+
+def test_batch_create_sends_utf8_json_body():
+    """
+    Check that the batch is sent as a UTF-8 encoded JSON body
+    """
+    sample_entities = [
+        {"id": "urn:ngsi-ld:Test:1", "type": "Test", "name": {"type": "Property", "value": "Линия 94"}},
+    ]
+
+    headers = {"Content-Type": "application/json"}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    body = mock_post.call_args.kwargs["data"]
+
+    assert isinstance(body, bytes)
+    assert orjson.loads(body) == sample_entities
+
+def test_batch_create_splits_batch_on_payload_too_large():
+    """
+    Check that a batch rejected with 413 is split in halves which are sent separately
+    """
+    sample_entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(4)]
+
+    headers = {"Content-Type": "application/json"}
+
+    too_large = MagicMock()
+    too_large.status_code = 413
+
+    created = MagicMock()
+    created.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[too_large, created, created]) as mock_post:
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    sent = [orjson.loads(call.kwargs["data"]) for call in mock_post.call_args_list]
+
+    assert sent == [sample_entities, sample_entities[:2], sample_entities[2:]]
+
+def test_batch_create_client_error_is_not_retried():
+    """
+    Check that a 4xx answer fails on the first attempt
+    """
+    sample_entities = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    headers = {"Content-Type": "application/json"}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 400
+    mock_response.text = "Bad Request"
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post, \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+        with pytest.raises(requests.exceptions.HTTPError):
+            fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+
+def test_batch_create_server_error_retried_with_exponential_backoff():
+    """
+    Check that server errors are retried with a growing, jittered and capped pause
+    """
+    sample_entities = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    headers = {"Content-Type": "application/json"}
+
+    unavailable = MagicMock()
+    unavailable.status_code = 503
+    unavailable.headers = {}
+
+    created = MagicMock()
+    created.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[unavailable] * 4 + [created]) as mock_post, \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.random.random", return_value=0.5), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.MAX_BACKOFF_SECONDS", 5), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert mock_post.call_count == 5
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.5, 2.5, 4.5, 5]
+
+def test_batch_create_retries_only_failed_entities_of_multi_status():
+    """
+    Check that after a 207 only the entities that failed with a server error are sent again
+    """
+    sample_entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(3)]
+
+    headers = {"Content-Type": "application/json"}
+
+    partial = MagicMock()
+    partial.status_code = 207
+    partial.content = orjson.dumps({
+        "success": ["urn:ngsi-ld:Test:0"],
+        "errors": [
+            {"entityId": "urn:ngsi-ld:Test:1", "error": {"title": "Already exists", "status": 409}},
+            {"entityId": "urn:ngsi-ld:Test:2", "error": {"title": "Internal error", "status": 500}},
+        ],
+    })
+
+    created = MagicMock()
+    created.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[partial, created]) as mock_post, \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep"):
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    sent = [orjson.loads(call.kwargs["data"]) for call in mock_post.call_args_list]
+
+    assert sent == [sample_entities, [sample_entities[2]]]
+
+def test_batch_create_multi_status_error_without_status_is_not_retried():
+    """
+    Check that a 207 error entry without a status is reported as a rejection
+    instead of being sent again as a server error
+    """
+    sample_entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(2)]
+
+    headers = {"Content-Type": "application/json"}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 207
+    mock_response.content = orjson.dumps({
+        "success": ["urn:ngsi-ld:Test:0"],
+        "errors": [{"entityId": "urn:ngsi-ld:Test:1", "error": {"title": "Invalid attribute", "detail": "bad value"}}],
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post, \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+        with pytest.raises(requests.exceptions.HTTPError) as err:
+            fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+    assert "1 entities rejected" in str(err.value)
+    assert "Invalid attribute" in str(err.value)
+
+def test_batch_create_error_body_is_truncated():
+    """
+    Check that a large error body is cut to MAX_ERROR_BODY_CHARS in the raised error
+    """
+    sample_entities = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    headers = {"Content-Type": "application/json"}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 400
+    mock_response.text = "x" * 10000
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response):
+        with pytest.raises(requests.exceptions.HTTPError) as err:
+            fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert "x" * 512 in str(err.value)
+    assert "x" * 513 not in str(err.value)
+
+def test_batch_create_partial_rejection_quotes_only_first_errors():
+    """
+    Check that a 207 with many rejected entities is not retried and only the first
+    MAX_REPORTED_ERRORS of them are quoted in the raised error
+    """
+    sample_entities = [{"id": f"urn:ngsi-ld:Test:{i}", "type": "Test"} for i in range(50)]
+
+    headers = {"Content-Type": "application/json"}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 207
+    mock_response.content = orjson.dumps({
+        "success": [],
+        "errors": [{"entityId": entity["id"], "error": {"title": "Bad Request", "status": 400}} for entity in sample_entities]
+    })
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", return_value=mock_response) as mock_post:
+        with pytest.raises(requests.exceptions.HTTPError) as err:
+            fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert mock_post.call_count == 1
+    assert "50 entities rejected" in str(err.value)
+    assert "urn:ngsi-ld:Test:9'" in str(err.value)
+    assert "urn:ngsi-ld:Test:10'" not in str(err.value)
+
+def test_batch_create_throttled_request_waits_for_retry_after():
+    """
+    Check that a 429 is retried after the pause given in Retry-After instead of failing the batch
+    """
+    sample_entities = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    headers = {"Content-Type": "application/json"}
+
+    throttled = MagicMock()
+    throttled.status_code = 429
+    throttled.headers = {"Retry-After": "7"}
+
+    created = MagicMock()
+    created.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[throttled, created]) as mock_post, \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(7.0)
+
+def test_batch_create_retry_after_date_falls_back_to_backoff():
+    """
+    Check that a Retry-After given as an HTTP date uses the exponential backoff instead
+    """
+    sample_entities = [{"id": "urn:ngsi-ld:Test:1", "type": "Test"}]
+
+    headers = {"Content-Type": "application/json"}
+
+    throttled = MagicMock()
+    throttled.status_code = 503
+    throttled.headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+
+    created = MagicMock()
+    created.status_code = 201
+
+    with patch("fiware_scorpio.fiware_scorpio_crud_operations.SESSION.post", side_effect=[throttled, created]), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.random.random", return_value=0.5), \
+         patch("fiware_scorpio.fiware_scorpio_crud_operations.time.sleep") as mock_sleep:
+        fiware_scorpio_post_batch_request(sample_entities, headers)
+
+    mock_sleep.assert_called_once_with(1.5)
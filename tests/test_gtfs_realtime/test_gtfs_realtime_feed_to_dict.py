@@ -37,5 +37,23 @@ def test_feed_to_dict_calls_message_to_dict():
             result = gtfs_realtime_feed_to_dict(feed)
 
     # Check that the function call was done with the mock FeedMessage and the result is as expected
-    mock_message_to_dict.assert_called_once_with(feed)
+    mock_message_to_dict.assert_called_once_with(feed, preserving_proto_field_name=True)
     assert result == expected_result
+
+def test_feed_to_dict_keeps_proto_field_names():
+    """
+    Check that the keys of the result are the snake_case field names of the .proto definition
+    """
+    feed = FeedMessage()
+    feed.header.gtfs_realtime_version = "2.0"
+    vehicle_position = feed.entity.add(id="1").vehicle
+    vehicle_position.trip.trip_id = "T1"
+    vehicle_position.current_stop_sequence = 3
+
+    result = gtfs_realtime_feed_to_dict(feed)
+
+    assert result["header"] == {"gtfs_realtime_version": "2.0"}
+    assert result["entity"][0]["vehicle"] == {
+        "trip": {"trip_id": "T1"},
+        "current_stop_sequence": 3,
+    }
@@ -2,6 +2,11 @@ import pytest
 import requests
 from unittest.mock import MagicMock, patch
 from gtfs_realtime.gtfs_realtime_utils import gtfs_realtime_get_feed
+import gtfs_realtime.gtfs_realtime_utils as gtfs_realtime_utils
+
+@pytest.fixture(autouse=True)
+def empty_feed_cache(monkeypatch):
+    monkeypatch.setattr(gtfs_realtime_utils, "_FEED_CACHE", {})
 
 def test_get_gtfs_realtime_feed_success():
     """
@@ -16,10 +21,12 @@ def test_get_gtfs_realtime_feed_success():
     # Mock API response after sending a GET request
     mock_response = MagicMock()
     mock_response.content = b"protobuf-bytes"
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.raise_for_status.return_value = None
 
     # Simulate sending the GET request and getting a response
-    with patch("gtfs_static.gtfs_static_utils.requests.get", return_value=mock_response) as mock_get:
+    with patch("gtfs_realtime.gtfs_realtime_utils.FEED_SESSION.get", return_value=mock_response) as mock_get:
         result = gtfs_realtime_get_feed(mock_api_endpoint)
 
     # Check that protobuf bytes are received from the GET response
@@ -55,7 +62,7 @@ def test_get_gtfs_realtime_feed_404_not_found():
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
     # Trigger HTTPError exception
-    with patch("gtfs_static.gtfs_static_utils.requests.get", return_value=mock_response):
+    with patch("gtfs_realtime.gtfs_realtime_utils.FEED_SESSION.get", return_value=mock_response):
         with pytest.raises(requests.exceptions.RequestException) as err:
             gtfs_realtime_get_feed(mock_api_endpoint)
 
@@ -73,10 +80,44 @@ def test_get_gtfs_realtime_feed_timeout_error():
     mock_api_endpoint.value = "http://fake-url.com/feed"
 
     # Mock requests.get to raise Timeout
-    with patch("gtfs_static.gtfs_static_utils.requests.get", side_effect=requests.exceptions.Timeout("The request timed out")):
+    with patch("gtfs_realtime.gtfs_realtime_utils.FEED_SESSION.get", side_effect=requests.exceptions.Timeout("The request timed out")):
         with pytest.raises(requests.exceptions.RequestException) as err:
             gtfs_realtime_get_feed(mock_api_endpoint)
 
     # Check that Timeout exception is raised
     assert f"Error when fetching GTFS data from {mock_api_endpoint.name}" in str(err.value)
 
+
+def test_get_gtfs_realtime_feed_not_modified_returns_cached_feed():
+    """
+    Check that the validators of the previous response are sent with the next poll
+    and that a 304 Not Modified answer returns the cached feed
+    """
+    # Mock API endpoint
+    mock_api_endpoint = MagicMock()
+    mock_api_endpoint.name = "GTFS_REALTIME"
+    mock_api_endpoint.value = "http://fake-url.com/feed"
+
+    # First poll returns the feed with its validators
+    first_response = MagicMock()
+    first_response.status_code = 200
+    first_response.content = b"protobuf-bytes"
+    first_response.headers = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}
+
+    # Second poll reports that nothing changed
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    not_modified.content = b""
+
+    with patch("gtfs_realtime.gtfs_realtime_utils.FEED_SESSION.get", side_effect=[first_response, not_modified]) as mock_get:
+        first = gtfs_realtime_get_feed(mock_api_endpoint)
+        second = gtfs_realtime_get_feed(mock_api_endpoint)
+
+    # Check that the cached feed is returned and the second poll was conditional
+    assert first == second == b"protobuf-bytes"
+    assert mock_get.call_args_list[0].kwargs["headers"] == {}
+    assert mock_get.call_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+    }
+    not_modified.raise_for_status.assert_not_called()
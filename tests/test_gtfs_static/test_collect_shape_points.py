@@ -1,5 +1,5 @@
 import pytest
-from gtfs_static.gtfs_static_utils import collect_shape_points
+from gtfs_static.gtfs_static_utils import ShapePoint, collect_shape_points
 
 def test_collect_shape_points_creates_new_shape():
     shapes = {}
@@ -16,13 +16,13 @@ def test_collect_shape_points_creates_new_shape():
 
     assert "S1" in shapes
     assert len(shapes["S1"]) == 1
-    assert shapes["S1"][0] == {"seq": 1, "coords": [23.32, 42.69], "dist": 0.0,}
+    assert shapes["S1"][0] == ShapePoint(seq=1, lon=23.32, lat=42.69, dist=0.0)
 
 
 def test_collect_shape_points_appends_to_existing_shape():
     shapes = {
         "S1": [
-            {"seq": 1, "coords": [23.30, 42.60], "dist": 0.0}
+            ShapePoint(seq=1, lon=23.30, lat=42.60, dist=0.0)
         ]
     }
 
@@ -37,7 +37,7 @@ def test_collect_shape_points_appends_to_existing_shape():
     collect_shape_points(shapes, entity)
 
     assert len(shapes["S1"]) == 2
-    assert shapes["S1"][1]["seq"] == 2
+    assert shapes["S1"][1].seq == 2
 
 def test_collect_shape_points_without_distance():
     shapes = {}
@@ -51,4 +51,4 @@ def test_collect_shape_points_without_distance():
 
     collect_shape_points(shapes, entity)
 
-    assert shapes["S2"][0]["dist"] is None
+    assert shapes["S2"][0].dist is None
@@ -1,5 +1,5 @@
 import config
-from gtfs_static.gtfs_static_utils import convert_gtfs_shapes_to_ngsi_ld
+from gtfs_static.gtfs_static_utils import ShapePoint, convert_gtfs_shapes_to_ngsi_ld
 
 def test_convert_gtfs_shapes_with_distance_travelled():
     """
@@ -9,9 +9,9 @@ def test_convert_gtfs_shapes_with_distance_travelled():
     
     shape_id = "S1"
     points = [
-        {"seq": 2, "coords": [23.32, 42.70], "dist": 100.0},
-        {"seq": 1, "coords": [23.31, 42.69], "dist": 0.0},
-        {"seq": 3, "coords": [23.33, 42.71], "dist": 150.0},
+        ShapePoint(seq=2, lon=23.32, lat=42.70, dist=100.0),
+        ShapePoint(seq=1, lon=23.31, lat=42.69, dist=0.0),
+        ShapePoint(seq=3, lon=23.33, lat=42.71, dist=150.0),
     ]
 
     result = convert_gtfs_shapes_to_ngsi_ld(shape_id, points)
@@ -49,8 +49,8 @@ def test_convert_gtfs_shapes_without_distance_travelled():
     
     shape_id = "S2"
     points = [
-        {"seq": 2, "coords": [23.32, 42.70], "dist": None},
-        {"seq": 1, "coords": [23.31, 42.69], "dist": None},
+        ShapePoint(seq=2, lon=23.32, lat=42.70, dist=None),
+        ShapePoint(seq=1, lon=23.31, lat=42.69, dist=None),
     ]
 
     result = convert_gtfs_shapes_to_ngsi_ld(shape_id, points)
@@ -0,0 +1,57 @@
+import pytest
+import config
+from unittest.mock import patch
+from gtfs_static.gtfs_static_utils import gtfs_static_get_ngsi_ld_batches
+
+def test_rows_are_converted_in_batches(tmp_path):
+    """
+    Check that rows are passed to the transformer in chunks of batch_size
+    and every chunk is yielded as one batch
+    """
+    config.set_operating_city("Sofia")
+
+    folder = tmp_path / "sofia"
+    folder.mkdir()
+    (folder / "levels.txt").write_text("level_id,level_index\nL1,0\nL2,1\nL3,2\nL4,3\nL5,4\n")
+
+    with patch("gtfs_static.gtfs_static_utils.gtfs_static_levels_to_ngsi_ld",
+               side_effect=lambda rows: [row["level_id"] for row in rows]) as mock_transformer:
+        batches = list(gtfs_static_get_ngsi_ld_batches("levels", base_dir=str(tmp_path), batch_size=2))
+
+    assert batches == [["L1", "L2"], ["L3", "L4"], ["L5"]]
+    assert mock_transformer.call_count == 3
+
+def test_empty_file_yields_nothing(tmp_path):
+    """
+    Check that an empty GTFS file produces no batches
+    """
+    config.set_operating_city("Sofia")
+
+    folder = tmp_path / "sofia"
+    folder.mkdir()
+    (folder / "levels.txt").write_text("")
+
+    assert list(gtfs_static_get_ngsi_ld_batches("levels", base_dir=str(tmp_path))) == []
+
+def test_unsupported_file_type():
+    """
+    Check that an unsupported GTFS type raises ValueError
+    """
+    with pytest.raises(ValueError, match="Unsupported GTFS type"):
+        list(gtfs_static_get_ngsi_ld_batches("unknown"))
+
+def test_invalid_row_raises_instead_of_being_skipped(tmp_path):
+    """
+    Check that an invalid row stops the stream with the transformer's ValueError
+    instead of being dropped from its batch
+    """
+    config.set_operating_city("Sofia")
+
+    folder = tmp_path / "sofia"
+    folder.mkdir()
+    (folder / "levels.txt").write_text("level_id,level_index\nL1,0\nL2,1\n")
+
+    with patch("gtfs_static.gtfs_static_utils.gtfs_static_levels_to_ngsi_ld",
+               side_effect=ValueError("Invalid level")):
+        with pytest.raises(ValueError, match="Invalid level"):
+            list(gtfs_static_get_ngsi_ld_batches("levels", base_dir=str(tmp_path)))
@@ -0,0 +1,27 @@
+import config
+from unittest.mock import patch
+from gtfs_static.gtfs_static_utils import gtfs_static_iter_ngsi_ld_data
+
+def test_entities_are_yielded_one_by_one(tmp_path):
+    """
+    Check that the converted batches are flattened into single entities
+    """
+    config.set_operating_city("Sofia")
+
+    folder = tmp_path / "sofia"
+    folder.mkdir()
+    (folder / "levels.txt").write_text("level_id,level_index\nL1,0\nL2,1\nL3,2\n")
+
+    with patch("gtfs_static.gtfs_static_utils.gtfs_static_levels_to_ngsi_ld",
+               side_effect=lambda rows: [row["level_id"] for row in rows]):
+        entities = list(gtfs_static_iter_ngsi_ld_data("levels", base_dir=str(tmp_path)))
+
+    assert entities == ["L1", "L2", "L3"]
+
+def test_missing_files_yield_nothing(tmp_path):
+    """
+    Check that a city without the requested GTFS file produces no entities
+    """
+    config.set_operating_city("Sofia")
+
+    assert list(gtfs_static_iter_ngsi_ld_data("levels", base_dir=str(tmp_path))) == []
@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import patch
+from json_ld.json_ld_utils import json_ld_get_ngsi_ld_batches
+
+def test_json_ld_get_ngsi_ld_batches_splits_entities():
+    """
+    Check that entities are yielded in batches of batch_size
+    """
+    mock_data = [{"id": f"E{i}"} for i in range(5)]
+
+    with patch("json_ld.json_ld_utils.json_ld_get_ngsi_ld_data", return_value=mock_data) as mock_get:
+        batches = list(json_ld_get_ngsi_ld_batches("culture", base_dir="/fake/base", batch_size=2))
+
+    mock_get.assert_called_once_with("culture", "/fake/base")
+    assert batches == [mock_data[0:2], mock_data[2:4], mock_data[4:5]]
+
+def test_json_ld_get_ngsi_ld_batches_empty_file():
+    """
+    Check that no batches are yielded for a category without entities
+    """
+    with patch("json_ld.json_ld_utils.json_ld_get_ngsi_ld_data", return_value=[]):
+        assert list(json_ld_get_ngsi_ld_batches("culture")) == []
+
+def test_json_ld_get_ngsi_ld_batches_invalid_keyword():
+    """
+    Check that unsupported PoIs categories are reported when the batches are consumed
+    """
+    with pytest.raises(ValueError, match="Unsupported PoIs category"):
+        list(json_ld_get_ngsi_ld_batches("invalid_category"))
@@ -17,7 +17,7 @@ def test_skip_entity_without_location():
     mock_transformer = MagicMock()
     mock_transformer.transform.return_value = (101, 202)
 
-    with patch("json_ld.json_ld_utils.Transformer.from_crs", return_value = mock_transformer):
+    with patch("json_ld.json_ld_utils._get_wgs84_transformer", return_value = mock_transformer):
         json_ld_transform_coordinates_to_wgs84_coordinates(data)
 
     assert data == [{"id": "E1"}]
@@ -41,7 +41,7 @@ def test_point_geometry_transformed():
     mock_transformer = MagicMock()
     mock_transformer.transform.return_value = (101, 202)
 
-    with patch("json_ld.json_ld_utils.Transformer.from_crs", return_value = mock_transformer):
+    with patch("json_ld.json_ld_utils._get_wgs84_transformer", return_value = mock_transformer):
         json_ld_transform_coordinates_to_wgs84_coordinates(data)
 
     assert data[0]["location"]["value"]["coordinates"] == [101, 202]
@@ -68,7 +68,7 @@ def test_multipoint_geometry_transformed():
     mock_transformer = MagicMock()
     mock_transformer.transform.return_value = (110, 220)
 
-    with patch("json_ld.json_ld_utils.Transformer.from_crs", return_value = mock_transformer):
+    with patch("json_ld.json_ld_utils._get_wgs84_transformer", return_value = mock_transformer):
         json_ld_transform_coordinates_to_wgs84_coordinates(data)
 
     location = data[0]["location"]["value"]
@@ -95,7 +95,7 @@ def test_point_with_invalid_coordinates():
     mock_transformer.transform.return_value = (101, 202)
 
     original = data[0]["location"]["value"].copy()
-    with patch("json_ld.json_ld_utils.Transformer.from_crs", return_value = mock_transformer):
+    with patch("json_ld.json_ld_utils._get_wgs84_transformer", return_value = mock_transformer):
         json_ld_transform_coordinates_to_wgs84_coordinates(data)
 
     assert data[0]["location"]["value"] == original
@@ -119,7 +119,7 @@ def test_unsupported_geometry_type():
     mock_transformer.transform.return_value = (101, 202)
 
     original = data[0]["location"]["value"].copy()
-    with patch("json_ld.json_ld_utils.Transformer.from_crs", return_value = mock_transformer):
+    with patch("json_ld.json_ld_utils._get_wgs84_transformer", return_value = mock_transformer):
         json_ld_transform_coordinates_to_wgs84_coordinates(data)
 
     assert data[0]["location"]["value"] == original
@@ -0,0 +1,124 @@
+import os
+import pytest
+import config
+import multiprocessing
+import netex.netex_utils as netex_utils
+from unittest.mock import patch
+
+# Empty translation indexes of an authority dataset
+NO_TRANSLATIONS = {"by_record_id": {}, "by_field_value": {}}
+
+
+def test_netex_create_line_xmls_sums_counters_of_every_route(monkeypatch):
+    """
+    Check that the per-route counters returned by the workers are added to the totals
+    of earlier authorities instead of replacing them
+    """
+    monkeypatch.setattr(netex_utils, "MAX_NETEX_PROCESSES", 1)
+    monkeypatch.setattr(netex_utils, "ROUTE_COUNTER", 10)
+    monkeypatch.setattr(netex_utils, "LINE_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "JOURNEY_PATTERN_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "SERVICE_JOURNEY_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "SERVICE_JOURNEY_INTERCHANGE_COUNTER", 0)
+    monkeypatch.setattr(config, "NETEX_AUTHORITY", "BG-")
+
+    routes = [{"id": "urn:ngsi-ld:GtfsRoute:Sofia:1"}, {"id": "urn:ngsi-ld:GtfsRoute:Sofia:2"}]
+
+    with patch("netex.netex_utils.netex_build_route_dataset", return_value={"route": {}}), \
+         patch("netex.netex_utils.netex_create_line_xml") as mock_create:
+
+        # Simulate what the stream helpers do for one route
+        def create_line_xml(route_dataset, authority_dataset):
+            netex_utils.ROUTE_COUNTER += 1
+            netex_utils.LINE_COUNTER += 1
+            netex_utils.SERVICE_JOURNEY_COUNTER += 3
+
+        mock_create.side_effect = create_line_xml
+
+        netex_utils.netex_create_line_xmls({"routes": routes, "translations": NO_TRANSLATIONS})
+
+    assert mock_create.call_count == 2
+    assert netex_utils.ROUTE_COUNTER == 12
+    assert netex_utils.LINE_COUNTER == 2
+    assert netex_utils.SERVICE_JOURNEY_COUNTER == 6
+
+def test_netex_create_line_xmls_skips_routes_without_id(monkeypatch):
+    """
+    Check that a route without an ID is logged and skipped without stopping the others
+    """
+    monkeypatch.setattr(netex_utils, "MAX_NETEX_PROCESSES", 1)
+    monkeypatch.setattr(netex_utils, "ROUTE_COUNTER", 0)
+
+    with patch("netex.netex_utils.netex_build_route_dataset", return_value={"route": {}}) as mock_build, \
+         patch("netex.netex_utils.netex_create_line_xml"):
+
+        netex_utils.netex_create_line_xmls({"routes": [{}, {"id": "urn:ngsi-ld:GtfsRoute:Sofia:1"}], "translations": NO_TRANSLATIONS})
+
+    assert mock_build.call_count == 1
+
+def test_netex_create_line_xmls_serial_run_leaves_no_worker_dataset(monkeypatch):
+    """
+    Check that converting the routes in-process does not keep the authority dataset
+    in the worker globals after the function returns
+    """
+    monkeypatch.setattr(netex_utils, "MAX_NETEX_PROCESSES", 1)
+    monkeypatch.setattr(netex_utils, "_WORKER_AUTHORITY_DATASET", {})
+
+    authority_dataset = {"routes": [{"id": "urn:ngsi-ld:GtfsRoute:Sofia:1"}], "translations": NO_TRANSLATIONS}
+
+    with patch("netex.netex_utils.netex_build_route_dataset", return_value={"route": {}}), \
+         patch("netex.netex_utils.netex_create_line_xml") as mock_create:
+
+        netex_utils.netex_create_line_xmls(authority_dataset)
+
+    mock_create.assert_called_once_with({"route": {}}, authority_dataset)
+    assert netex_utils._WORKER_AUTHORITY_DATASET == {}
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="the stubs are inherited by the worker processes only when they are forked")
+def test_netex_create_line_xmls_process_pool_groups_routes_by_file(monkeypatch, tmp_path):
+    """
+    Check that with several worker processes every route is converted, the counters of all
+    workers are summed, and routes sharing an output file are written by the same worker in order
+    """
+    monkeypatch.setattr(netex_utils, "MAX_NETEX_PROCESSES", 2)
+    monkeypatch.setattr(netex_utils, "ROUTE_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "LINE_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "JOURNEY_PATTERN_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "SERVICE_JOURNEY_COUNTER", 0)
+    monkeypatch.setattr(netex_utils, "SERVICE_JOURNEY_INTERCHANGE_COUNTER", 0)
+    monkeypatch.setattr(config, "NETEX_AUTHORITY", "BG")
+    monkeypatch.setattr(config, "NETEX_OUTPUT_DIR", tmp_path)
+
+    # "Line 1" and "Line-1" sanitise to the same file name
+    routes = [
+        {"id": "urn:ngsi-ld:GtfsRoute:Sofia:1", "name": {"value": "Line 1"}},
+        {"id": "urn:ngsi-ld:GtfsRoute:Sofia:2", "name": {"value": "Line 2"}},
+        {"id": "urn:ngsi-ld:GtfsRoute:Sofia:3", "name": {"value": "Line-1"}},
+    ]
+
+    # Record which process converted which route, in the file of the route
+    def create_line_xml(route_dataset, authority_dataset):
+        path = netex_utils.netex_helper_line_xml_path(route_dataset["route"], authority_dataset["translations"])
+
+        with open(path, "a") as line_file:
+            line_file.write(f"{os.getpid()} {route_dataset['route']['id']}\n")
+
+        netex_utils.ROUTE_COUNTER += 1
+        netex_utils.SERVICE_JOURNEY_COUNTER += 2
+
+    with patch("netex.netex_utils.netex_build_route_dataset", side_effect=lambda route, dataset: {"route": route}), \
+         patch("netex.netex_utils.netex_create_line_xml", side_effect=create_line_xml):
+
+        netex_utils.netex_create_line_xmls({"routes": routes, "translations": NO_TRANSLATIONS})
+
+    assert netex_utils.ROUTE_COUNTER == 3
+    assert netex_utils.SERVICE_JOURNEY_COUNTER == 6
+
+    shared_file = (tmp_path / "BG_Line_1.xml").read_text().splitlines()
+    pids = {line.split()[0] for line in shared_file}
+
+    assert [line.split()[1] for line in shared_file] == ["urn:ngsi-ld:GtfsRoute:Sofia:1", "urn:ngsi-ld:GtfsRoute:Sofia:3"]
+    assert len(pids) == 1
+    assert str(os.getpid()) not in pids
+    assert (tmp_path / "BG_Line_2.xml").exists()
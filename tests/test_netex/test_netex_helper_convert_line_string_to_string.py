@@ -0,0 +1,28 @@
+from shapely.geometry import LineString
+from netex.netex_utils import netex_helper_convert_line_string_to_string
+
+def test_convert_line_string_to_pos_list():
+    """
+    Test that the coordinates are written as a space-separated x y posList with 6 decimals.
+    """
+
+    line = LineString([
+        (23.3219, 42.6977),
+        (23.33, -42.1234567),
+    ])
+
+    result = netex_helper_convert_line_string_to_string(line)
+
+    assert result == "23.321900 42.697700 23.330000 -42.123457"
+
+
+def test_convert_line_string_keeps_point_order():
+    """
+    Test that the points are written in the order of the LineString.
+    """
+
+    line = LineString([(float(i), float(i + 1)) for i in range(3)])
+
+    result = netex_helper_convert_line_string_to_string(line)
+
+    assert result.split() == ["0.000000", "1.000000", "1.000000", "2.000000", "2.000000", "3.000000"]
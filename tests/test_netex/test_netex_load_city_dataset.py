@@ -0,0 +1,68 @@
+import time
+import pytest
+import config
+import threading
+import netex.netex_utils as netex_utils
+from unittest.mock import patch
+from netex.netex_utils import netex_load_city_dataset
+from fiware_scorpio.fiware_scorpio_crud_operations import MAX_CONCURRENT_LISTINGS, MAX_CONCURRENT_REQUESTS, POOL_MAXSIZE
+
+
+def test_netex_load_city_dataset_fetches_every_type():
+    """
+    Check that every collection is filled with the entities of its own type
+    """
+    config.set_operating_city("Sofia")
+
+    with patch("netex.netex_utils.fiware_scorpio_get_entities_by_type",
+               side_effect=lambda entity_type, header, city: [{"type": entity_type}]) as mock_get:
+        dataset = netex_load_city_dataset()
+
+    assert list(dataset) == ["agencies", "routes", "trips", "calendar", "calendar_dates",
+                             "shapes", "stop_times", "stops", "transfers", "translations"]
+    assert dataset["agencies"] == [{"type": "GtfsAgency"}]
+    assert dataset["stop_times"] == [{"type": "GtfsStopTime"}]
+    assert dataset["translations"] == [{"type": "GtfsTranslation"}]
+    assert mock_get.call_count == 10
+
+def test_netex_load_city_dataset_propagates_errors():
+    """
+    Check that a failed fetch of one type is raised to the caller
+    """
+    config.set_operating_city("Sofia")
+
+    with patch("netex.netex_utils.fiware_scorpio_get_entities_by_type", side_effect=RuntimeError("broker down")):
+        with pytest.raises(RuntimeError, match="broker down"):
+            netex_load_city_dataset()
+
+def test_netex_load_city_dataset_caps_types_in_flight(monkeypatch):
+    """
+    Check that no more than MAX_CONCURRENT_LISTINGS types are fetched at the same time,
+    so the paged requests of all types together fit in the session's connection pool
+    """
+    config.set_operating_city("Sofia")
+    monkeypatch.setattr(netex_utils, "MAX_CONCURRENT_LISTINGS", 2)
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fetch(entity_type, header, city):
+        nonlocal in_flight, peak
+
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+
+        time.sleep(0.01)
+
+        with lock:
+            in_flight -= 1
+
+        return []
+
+    with patch("netex.netex_utils.fiware_scorpio_get_entities_by_type", side_effect=fetch):
+        netex_load_city_dataset()
+
+    assert peak == 2
+    assert MAX_CONCURRENT_LISTINGS * MAX_CONCURRENT_REQUESTS <= POOL_MAXSIZE